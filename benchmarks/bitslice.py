@@ -0,0 +1,40 @@
+"""Benchmark of bit-sliced batches of small matrices.
+
+Compares methods of `Matrix` called for every matrix with the same
+methods of `bitslice.MatrixBatch` evaluated for all matrices at once.
+
+Usage: python benchmarks/bitslice.py [size] [nrows] [ncolumns]
+"""
+
+import sys
+import timeit
+from blincodes import bitslice
+
+
+def measure(statement, number=3):
+    """Return the best time of `statement` in seconds."""
+    return min(timeit.repeat(statement, number=1, repeat=number))
+
+
+def main(size=256, nrows=32, ncolumns=64):
+    """Print times of operations."""
+    batch = bitslice.random(size, nrows, ncolumns)
+    mats = batch.to_matrices()
+    results = [
+        ('Matrix.rank', measure(lambda: [mat.rank for mat in mats])),
+        ('MatrixBatch.rank', measure(lambda: batch.rank)),
+        ('Matrix.gaussian_elimination',
+         measure(lambda: [mat.gaussian_elimination() for mat in mats])),
+        ('MatrixBatch.gaussian_elimination',
+         measure(batch.gaussian_elimination)),
+        ('bitslice.from_matrices', measure(
+            lambda: bitslice.from_matrices(mats))),
+        ('MatrixBatch.to_matrices', measure(batch.to_matrices)),
+    ]
+    print('size = {}, shapes = {}'.format(size, (nrows, ncolumns)))
+    for name, seconds in results:
+        print('{:<36}{:>12.6f} s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:4]))
@@ -0,0 +1,61 @@
+"""Benchmark of conversion of bit arrays to vectors and matrices.
+
+Compares the element by element path `vector.from_iterable` with
+`from_bytes` and, if `numpy` is installed, with `from_numpy`.
+
+Usage: python benchmarks/interop.py [length] [nrows]
+"""
+
+import random
+import sys
+import timeit
+from blincodes import matrix, vector
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def measure(statement, number=5):
+    """Return the best time of `statement` in seconds."""
+    return min(timeit.repeat(statement, number=1, repeat=number))
+
+
+def main(length=8192, nrows=1024):
+    """Print times of conversions."""
+    bits = [random.getrandbits(1) for _ in range(length)]
+    rows = [[random.getrandbits(1) for _ in range(length)]
+            for _ in range(nrows)]
+    packed = vector.from_iterable(bits).to_bytes()
+    packed_rows = matrix.from_iterable(rows).to_bytes()
+    results = [
+        ('vector.from_iterable(list)',
+         measure(lambda: vector.from_iterable(bits))),
+        ('vector.from_bytes(bytes)',
+         measure(lambda: vector.from_bytes(packed, length))),
+        ('matrix.from_iterable(lists)',
+         measure(lambda: matrix.from_iterable(rows), 1)),
+        ('matrix.from_bytes(bytes)',
+         measure(lambda: matrix.from_bytes(packed_rows, length))),
+    ]
+    if numpy is not None:
+        array = numpy.array(bits, dtype=numpy.uint8)
+        array2d = numpy.array(rows, dtype=bool)
+        results.extend([
+            ('vector.from_iterable(ndarray)',
+             measure(lambda: vector.from_iterable(array))),
+            ('vector.from_numpy(ndarray)',
+             measure(lambda: vector.from_numpy(array))),
+            ('matrix.from_iterable(ndarray)',
+             measure(lambda: matrix.from_iterable(array2d), 1)),
+            ('matrix.from_numpy(ndarray)',
+             measure(lambda: matrix.from_numpy(array2d))),
+        ])
+    print('length = {}, nrows = {}'.format(length, nrows))
+    for name, seconds in results:
+        print('{:<32}{:>12.6f} s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:3]))
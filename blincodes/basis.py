@@ -0,0 +1,215 @@
+"""Module for incremental construction of row bases over GF(2).
+
+Rows are handled as raw integers: the column `j` of a row of length `n`
+is the bit `n - j - 1` of the integer, as in `Vector` and `Matrix`.
+"""
+
+
+class IncrementalBasis():
+    """Reduced echelon basis of a row space built row by row.
+
+    Every stored row has a pivot (its leading bit) and zeroes at the
+    pivots of all other stored rows, so a new row is reduced by one XOR
+    per pivot it touches.
+    """
+
+    def __init__(self, ncolumns, rows=None):
+        """Create new basis.
+
+        :param: int `ncolumns` - length of rows;
+        :param: `rows` - any iterable of integers or vectors to insert.
+        """
+        if not isinstance(ncolumns, int):
+            raise TypeError(
+                'expected `ncolumns` is integer, but '
+                'got {}'.format(type(ncolumns)))
+        if ncolumns < 0:
+            raise ValueError(
+                'expected `ncolumns` is not less then 0, but '
+                '{} < 0'.format(ncolumns))
+        self._ncolumns = ncolumns
+        self._mask = (1 << ncolumns) - 1
+        self._rows = {}  # {pivot bit: row}
+        self._pivot_mask = 0
+        if rows:
+            self.extend(rows)
+
+    @property
+    def ncolumns(self):
+        """Return length of rows."""
+        return self._ncolumns
+
+    @property
+    def rank(self):
+        """Return dimension of spanned space."""
+        return len(self._rows)
+
+    @property
+    def is_full(self):
+        """Return True if basis spans the whole space."""
+        return len(self._rows) == self._ncolumns
+
+    @property
+    def pivots(self):
+        """Return sorted list of pivot columns."""
+        return sorted(self._ncolumns - bit - 1 for bit in self._rows)
+
+    @property
+    def pivot_mask(self):
+        """Return integer with ones on pivot columns."""
+        return self._pivot_mask
+
+    @property
+    def rows(self):
+        """Return tuple of basis rows sorted in descending order.
+
+        The rows form the reduced echelon (diagonal) form of the space.
+        """
+        return tuple(self._rows[bit]
+                     for bit in sorted(self._rows, reverse=True))
+
+    def __len__(self):
+        """Return dimension of spanned space."""
+        return len(self._rows)
+
+    def __iter__(self):
+        """Iterate over basis rows in descending order."""
+        return iter(self.rows)
+
+    def __contains__(self, row):
+        """Return True if `row` belongs to spanned space."""
+        return not self.reduce(row)
+
+    def copy(self):
+        """Return copy of basis."""
+        other = self.__class__(self._ncolumns)
+        other._rows = dict(self._rows)
+        other._pivot_mask = self._pivot_mask
+        return other
+
+    def reduce(self, row):
+        """Return `row` reduced by the basis as integer.
+
+        The result is zero if and only if `row` belongs to spanned space.
+        """
+        value = _row_value(row) & self._mask
+        touched = value & self._pivot_mask
+        while touched:
+            bit = touched.bit_length() - 1
+            value ^= self._rows[bit]
+            touched ^= 1 << bit
+        return value
+
+    def insert(self, row):
+        """Insert `row` into basis.
+
+        :return: True if `row` was linearly independent of the basis.
+        """
+        value = self.reduce(row)
+        if not value:
+            return False
+        bit = value.bit_length() - 1
+        pivot = 1 << bit
+        for key, other in self._rows.items():
+            if other & pivot:
+                self._rows[key] = other ^ value
+        self._rows[bit] = value
+        self._pivot_mask |= pivot
+        return True
+
+    def puncture(self, column):
+        """Set column `column` to zero in every row of the basis.
+
+        The reduced echelon form is updated in O(rank) operations.
+        :return: True if the rank was decreased.
+        """
+        bit = self._column_bit(column)
+        pivot = 1 << bit
+        if not self._pivot_mask & pivot:
+            for key, other in self._rows.items():
+                if other & pivot:
+                    self._rows[key] = other ^ pivot
+            return False
+        row = self._rows.pop(bit) ^ pivot
+        self._pivot_mask ^= pivot
+        return not self.insert(row)
+
+    def shorten(self, column):
+        """Keep only the subspace of rows having zero in column `column`.
+
+        The reduced echelon form is updated in O(rank) operations.
+        :return: True if the rank was decreased.
+        """
+        bit = self._column_bit(column)
+        pivot = 1 << bit
+        if self._pivot_mask & pivot:
+            del self._rows[bit]
+            self._pivot_mask ^= pivot
+            return True
+        keys = [key for key, other in self._rows.items() if other & pivot]
+        if not keys:
+            return False
+        # The row with the lowest pivot can be added to the others
+        # without changing their pivots.
+        lowest = min(keys)
+        row = self._rows.pop(lowest)
+        self._pivot_mask ^= 1 << lowest
+        for key in keys:
+            if key != lowest:
+                self._rows[key] ^= row
+        return True
+
+    def extend(self, rows, max_rank=None):
+        """Insert rows into basis until rank reaches `max_rank`.
+
+        :param: `rows` - any iterable of integers or vectors;
+        :param: int `max_rank` - stop when the rank reaches this value,
+                                 by default it is equal to `ncolumns`.
+        :return: number of inserted independent rows.
+        """
+        if max_rank is None:
+            max_rank = self._ncolumns
+        inserted = 0
+        if len(self._rows) >= max_rank:
+            return inserted
+        for row in rows:
+            if self.insert(row):
+                inserted += 1
+                if len(self._rows) >= max_rank:
+                    break
+        return inserted
+
+    def _column_bit(self, column):
+        """Return bit number of column `column`."""
+        if not 0 <= column < self._ncolumns:
+            raise IndexError(
+                'expected 0 <= `column` < {}, but got '
+                '{}'.format(self._ncolumns, column))
+        return self._ncolumns - column - 1
+
+
+def _row_value(row):
+    """Return integer value of row given as integer or vector."""
+    try:
+        return row.value
+    except AttributeError:
+        if isinstance(row, int):
+            return row
+    raise TypeError(
+        'expected row is integer or `Vector`, but got {}'.format(type(row)))
+
+
+def from_reduced(rows, ncolumns):
+    """Return basis made from rows in the reduced echelon form.
+
+    The rows are not checked and no elimination is evaluated.
+    :param: rows - iterable of integers with distinct leading bits and
+                   zeroes at leading bits of other rows.
+    """
+    row_basis = IncrementalBasis(ncolumns)
+    for row in rows:
+        if row:
+            bit = row.bit_length() - 1
+            row_basis._rows[bit] = row
+            row_basis._pivot_mask |= 1 << bit
+    return row_basis
@@ -0,0 +1,338 @@
+"""Compact binary file format of matrices over GF(2).
+
+A file is the header of 32 bytes followed by packed rows::
+
+    offset  size  field
+    0       4     magic b'BLCM'
+    4       1     version of format (1)
+    5       1     bit order: b'B' or b'L'
+    6       2     reserved (zeroes)
+    8       8     number of rows, unsigned little endian
+    16      8     number of columns, unsigned little endian
+    24      8     row stride in bytes, unsigned little endian
+
+Every row occupies `stride` bytes, a multiple of `WORD_SIZE`, so rows are
+aligned on 64-bit words. For the bit order b'B' (big) the column `j` is
+the bit `7 - j % 8` of the byte `j // 8` of row, that is the row is the
+big endian integer with column 0 in the most significant bit, as rows of
+`Matrix`. For the bit order b'L' (little) the column `j` is the bit
+`j % 8` of the byte `j // 8`, that is the order of M4RI and of
+`numpy.packbits(..., bitorder='little')`. Unused bits are zeroes.
+
+Rows are converted by `int.from_bytes` and `int.to_bytes` of a whole row,
+`PackedMatrix` reads rows lazily from any buffer and `MappedMatrix` from
+memory-mapped file.
+"""
+
+import mmap
+import struct
+from blincodes import matrix, vector
+
+#: Magic bytes of the format.
+MAGIC = b'BLCM'
+
+#: Version of the format.
+VERSION = 1
+
+#: Rows are aligned on words of this number of bytes.
+WORD_SIZE = 8
+
+#: Size of the header in bytes.
+HEADER_SIZE = 32
+
+_HEADER = struct.Struct('<4sBc2xQQQ')
+_BIT_ORDERS = {'big': b'B', 'little': b'L'}
+
+
+def row_stride(ncolumns):
+    """Return number of bytes of packed row of `ncolumns` bits."""
+    return -(-ncolumns // (8 * WORD_SIZE)) * WORD_SIZE
+
+
+def dumps(mat, bit_order='big'):
+    """Return bytes of matrix in the binary format."""
+    return b''.join(_iter_chunks(mat, bit_order))
+
+
+def loads(data):
+    """Return Matrix from bytes-like object in the binary format."""
+    view = memoryview(data)
+    nrows, ncolumns, stride, order = _unpack_header(view)
+    _check_size(len(view), nrows, stride)
+    return matrix.Matrix(_iter_values(view, nrows, ncolumns, stride, order),
+                         ncolumns)
+
+
+def save(mat, file, bit_order='big'):
+    """Write matrix into file `file` in the binary format.
+
+    :param: Matrix mat - the matrix;
+    :param: file - path or binary file object;
+    :param: str bit_order - 'big' or 'little'.
+    """
+    if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+        with open(file, 'wb') as stream:
+            save(mat, stream, bit_order)
+        return
+    for chunk in _iter_chunks(mat, bit_order):
+        file.write(chunk)
+
+
+def load(file):
+    """Read Matrix from file `file` in the binary format.
+
+    :param: file - path or binary file object.
+    """
+    if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+        with open(file, 'rb') as stream:
+            return load(stream)
+    return loads(file.read())
+
+
+def create(path, nrows, ncolumns, bit_order='big'):
+    """Create file of zero matrix and return its writable MappedMatrix."""
+    stride = row_stride(ncolumns)
+    with open(path, 'wb') as stream:
+        stream.write(_pack_header(nrows, ncolumns, bit_order))
+        stream.truncate(HEADER_SIZE + nrows * stride)
+    return MappedMatrix(path, writable=True)
+
+
+class PackedMatrix():
+    """Matrix in the binary format kept in a buffer.
+
+    The buffer is any object supporting the buffer protocol: bytes,
+    bytearray, memory map or shared memory. Rows are unpacked only when
+    they are accessed.
+    """
+
+    def __init__(self, buffer, writable=False):
+        """Use `buffer` with matrix in the binary format.
+
+        :param: buffer - bytes-like object with header and rows;
+        :param: bool writable - if True then rows can be changed.
+        """
+        self._view = memoryview(buffer).cast('B')
+        if writable and self._view.readonly:
+            raise TypeError('expected writable buffer')
+        (self._nrows, self._ncolumns, self._stride,
+         self._order) = _unpack_header(self._view)
+        _check_size(len(self._view), self._nrows, self._stride)
+        self._writable = writable
+
+    @property
+    def nrows(self):
+        """Return number of rows."""
+        return self._nrows
+
+    @property
+    def ncolumns(self):
+        """Return number of columns."""
+        return self._ncolumns
+
+    @property
+    def shapes(self):
+        """Return shapes of the matrix: (nrows, ncolumns)."""
+        return self._nrows, self._ncolumns
+
+    @property
+    def stride(self):
+        """Return number of bytes of row."""
+        return self._stride
+
+    @property
+    def bit_order(self):
+        """Return bit order of rows: 'big' or 'little'."""
+        return 'big' if self._order == b'B' else 'little'
+
+    def row(self, index):
+        """Return row `index` as integer."""
+        if not -self._nrows <= index < self._nrows:
+            raise IndexError(
+                'expected {} <= `index` < {}, but got {}'.format(
+                    -self._nrows, self._nrows, index))
+        index %= self._nrows
+        start = HEADER_SIZE + index * self._stride
+        return _unpack_row(self._view[start:start + self._stride],
+                           self._ncolumns, self._order)
+
+    def rows(self, start=0, stop=None):
+        """Return list of rows `start, ..., stop - 1` as integers."""
+        start, stop, _ = slice(start, stop).indices(self._nrows)
+        offset = HEADER_SIZE + start * self._stride
+        return list(_iter_values(self._view[offset:], max(stop - start, 0),
+                                 self._ncolumns, self._stride, self._order,
+                                 offset=0))
+
+    def set_row(self, index, value):
+        """Write row `index` given as integer or Vector."""
+        if not self._writable:
+            raise TypeError('expected writable matrix')
+        index = range(self._nrows)[index]
+        start = HEADER_SIZE + index * self._stride
+        self._view[start:start + self._stride] = _pack_row(
+            int(value), self._ncolumns, self._stride, self._order)
+
+    def set_rows(self, start, values):
+        """Write consecutive rows from row `start` given as integers."""
+        if not self._writable:
+            raise TypeError('expected writable matrix')
+        data = b''.join(_pack_row(int(value), self._ncolumns, self._stride,
+                                  self._order) for value in values)
+        offset = HEADER_SIZE + start * self._stride
+        if not 0 <= start <= self._nrows - len(data) // max(self._stride, 1):
+            raise IndexError(
+                'expected rows in range 0, ..., {}, but got rows from '
+                '{}'.format(self._nrows - 1, start))
+        self._view[offset:offset + len(data)] = data
+
+    def to_matrix(self):
+        """Return Matrix with all rows."""
+        return matrix.Matrix(self.rows(), self._ncolumns)
+
+    def release(self):
+        """Release the view of the buffer."""
+        view = getattr(self, '_view', None)
+        if view is not None:
+            view.release()
+            self._view = None
+
+    def __len__(self):
+        """Return number of rows."""
+        return self._nrows
+
+    def __iter__(self):
+        """Iterate over rows as Vectors."""
+        for i in range(self._nrows):
+            yield self[i]
+
+    def __getitem__(self, index):
+        """Return row as Vector or rows of slice as Matrix."""
+        if isinstance(index, slice):
+            return matrix.Matrix(
+                (self.row(i) for i in range(*index.indices(self._nrows))),
+                self._ncolumns)
+        return vector.Vector(self.row(index), self._ncolumns)
+
+    def __enter__(self):
+        """Return self."""
+        return self
+
+    def __exit__(self, *args):
+        """Release the view."""
+        self.release()
+
+    def __repr__(self):
+        """Return string representation of packed matrix."""
+        return '{name}(shapes={shapes}, bit_order={order!r})'.format(
+            name=self.__class__.__name__, shapes=self.shapes,
+            order=self.bit_order)
+
+
+class MappedMatrix(PackedMatrix):
+    """Matrix stored in file of the binary format and mapped to memory."""
+
+    def __init__(self, path, writable=False):
+        """Open file `path` in the binary format.
+
+        :param: path - path to file;
+        :param: bool writable - if True then rows can be changed.
+        """
+        self._file = open(path, 'r+b' if writable else 'rb')
+        try:
+            self._map = mmap.mmap(
+                self._file.fileno(), 0,
+                access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+            super().__init__(self._map, writable)
+        except BaseException:
+            self.close()
+            raise
+
+    def flush(self):
+        """Flush changes to the file."""
+        self._map.flush()
+
+    def close(self):
+        """Close the mapping and the file."""
+        self.release()
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __exit__(self, *args):
+        """Close the mapping."""
+        self.close()
+
+
+def _pack_header(nrows, ncolumns, bit_order):
+    """Return header of matrix."""
+    try:
+        order = _BIT_ORDERS[bit_order]
+    except KeyError:
+        raise ValueError(
+            "expected `bit_order` is 'big' or 'little', but "
+            "got {!r}".format(bit_order))
+    return _HEADER.pack(MAGIC, VERSION, order, nrows, ncolumns,
+                        row_stride(ncolumns))
+
+
+def _unpack_header(view):
+    """Return (nrows, ncolumns, stride, order) from header."""
+    if len(view) < HEADER_SIZE:
+        raise ValueError(
+            'expected at least {} bytes of header, but '
+            'got {}'.format(HEADER_SIZE, len(view)))
+    magic, version, order, nrows, ncolumns, stride = _HEADER.unpack(
+        view[:HEADER_SIZE])
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(
+            'expected magic {} and version {}, but got {} and '
+            '{}'.format(MAGIC, VERSION, magic, version))
+    if order not in (b'B', b'L'):
+        raise ValueError(
+            "expected bit order b'B' or b'L', but got {}".format(order))
+    if stride < row_stride(ncolumns) or stride % WORD_SIZE:
+        raise ValueError(
+            'expected row stride is multiple of {} not less than {}, but '
+            'got {}'.format(WORD_SIZE, row_stride(ncolumns), stride))
+    return nrows, ncolumns, stride, order
+
+
+def _check_size(size, nrows, stride):
+    """Raise ValueError if data is shorter than rows."""
+    if size < HEADER_SIZE + nrows * stride:
+        raise ValueError(
+            'expected {} bytes, but got {}'.format(
+                HEADER_SIZE + nrows * stride, size))
+
+
+def _iter_chunks(mat, bit_order):
+    """Iterate over header and packed rows of matrix."""
+    ncolumns = mat.ncolumns
+    header = _pack_header(mat.nrows, ncolumns, bit_order)
+    yield header
+    order = header[5:6]
+    stride = row_stride(ncolumns)
+    yield b''.join(_pack_row(row.value, ncolumns, stride, order)
+                   for row in mat)
+
+
+def _iter_values(view, nrows, ncolumns, stride, order, offset=HEADER_SIZE):
+    """Iterate over integer rows of packed data."""
+    for start in range(offset, offset + nrows * stride, stride or 1):
+        yield _unpack_row(view[start:start + stride], ncolumns, order)
+
+
+def _pack_row(value, ncolumns, stride, order):
+    """Return bytes of row."""
+    if order == b'B':
+        return (value << (8 * stride - ncolumns)).to_bytes(stride, 'big')
+    return vector.reverse_bits(value, ncolumns).to_bytes(stride, 'little')
+
+
+def _unpack_row(data, ncolumns, order):
+    """Return integer row from its bytes."""
+    if order == b'B':
+        return int.from_bytes(data, 'big') >> (8 * len(data) - ncolumns)
+    return vector.reverse_bits(int.from_bytes(data, 'little'), ncolumns)
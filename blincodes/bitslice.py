@@ -0,0 +1,321 @@
+"""Bit-sliced batches of small matrices over GF(2).
+
+A batch keeps `size` matrices of the same shapes. The element `(i, j)` of
+all matrices is one integer word: its bit `k` is the element `(i, j)` of
+the matrix `k`. Any operation on words (XOR, AND) is applied to all
+matrices at once, so the Python overhead of one operation is shared by
+the whole batch. Words are Python integers, the batch may be of any size,
+64 or more matrices give the best gain.
+
+Branches of algorithms are replaced by masks of matrices (lanes). For
+example, the leading column of a row differs from matrix to matrix, so
+the elimination keeps for every column the mask of matrices with the
+leading one of the row in this column. Elimination and sorting of rows
+have the semantics of `Matrix.echelon_form`, `Matrix.rank` and
+`Matrix.gaussian_elimination`, so every matrix of the result equals the
+result of the same method of the matrix.
+
+Rows are sorted by the odd-even transposition network of compare and
+swap operations, it is stable as `sorted`.
+"""
+
+import random as _random
+from blincodes import matrix
+
+
+class MatrixBatch():
+    """Bit-sliced batch of matrices of the same shapes."""
+
+    def __init__(self, value=None, ncolumns=0, size=0):
+        """Create new batch.
+
+        :param: value - any iterable of rows, every row is an iterable of
+                        `ncolumns` integer words;
+        :param: int ncolumns - number of columns of matrices;
+        :param: int size - number of matrices.
+        """
+        for name, number in (('ncolumns', ncolumns), ('size', size)):
+            if not isinstance(number, int):
+                raise TypeError(
+                    'expected `{}` is integer, but '
+                    'got {}'.format(name, type(number)))
+            if number < 0:
+                raise ValueError(
+                    'expected `{}` is not less then 0, but '
+                    '{} < 0'.format(name, number))
+        self._ncolumns = ncolumns
+        self._size = size
+        self._full = (1 << size) - 1
+        self._rows = []
+        for row in (value or ()):
+            row = [word & self._full for word in row]
+            if len(row) != ncolumns:
+                raise ValueError(
+                    'expected {} words in row, but '
+                    'got {}'.format(ncolumns, len(row)))
+            self._rows.append(row)
+
+    @property
+    def nrows(self):
+        """Return number of rows of matrices."""
+        return len(self._rows)
+
+    @property
+    def ncolumns(self):
+        """Return number of columns of matrices."""
+        return self._ncolumns
+
+    @property
+    def shapes(self):
+        """Return shapes of matrices: (nrows, ncolumns)."""
+        return self.nrows, self._ncolumns
+
+    @property
+    def size(self):
+        """Return number of matrices."""
+        return self._size
+
+    @property
+    def words(self):
+        """Return list of rows of words."""
+        return [list(row) for row in self._rows]
+
+    @property
+    def rank(self):
+        """Return list of ranks of matrices."""
+        rows = self.words
+        _eliminate(rows, range(self._ncolumns), False)
+        nonzero = []
+        for row in rows:
+            mask = 0
+            for word in row:
+                mask |= word
+            nonzero.append(mask)
+        return _count_lanes(nonzero, self._size)
+
+    @property
+    def echelon_form(self):
+        """Return batch of echelon forms of matrices."""
+        rows = self.words
+        columns = range(self._ncolumns)
+        _eliminate(rows, columns, False)
+        _sort(rows, columns, self._full)
+        return MatrixBatch(rows, self._ncolumns, self._size)
+
+    def gaussian_elimination(self, columns=None, sort=True):
+        """Evaluate the Gaussian eliminations on columns `columns`.
+
+        :param: `iterable` columns - list or any iterable of columns.
+        :param: bool sort - if True then rows are sorted as in
+                            `Matrix.gaussian_elimination`.
+        :return: batch of results of Gaussian eliminations.
+        """
+        if not columns:
+            columns = range(self._ncolumns)
+        else:
+            columns = set(columns)
+            columns = [col for col in range(self._ncolumns)
+                       if col in columns]
+        rows = self.words
+        _eliminate(rows, columns, True)
+        if sort:
+            _sort(rows, columns, self._full)
+        return MatrixBatch(rows, self._ncolumns, self._size)
+
+    def to_matrices(self):
+        """Return list of matrices of batch."""
+        values = [[] for _ in range(self._size)]
+        width = '0{}b'.format(self._size)
+        for row in self._rows:
+            if not self._ncolumns:
+                break
+            # Column `j` of the table is the row of the matrix `j`.
+            table = (format(word, width)[::-1] for word in row)
+            for lane, bits in zip(values, zip(*table)):
+                lane.append(int(''.join(bits), 2))
+        return [matrix.Matrix(rows, self._ncolumns) for rows in values]
+
+    def __len__(self):
+        """Return number of matrices."""
+        return self._size
+
+    def __iter__(self):
+        """Iterate over matrices of batch."""
+        return iter(self.to_matrices())
+
+    def __getitem__(self, index):
+        """Return matrix `index` of batch."""
+        if not -self._size <= index < self._size:
+            raise IndexError(
+                'expected {} <= `index` < {}, but got {}'.format(
+                    -self._size, self._size, index))
+        index %= self._size
+        if not self._ncolumns:
+            return matrix.Matrix()
+        return matrix.Matrix(
+            (int(''.join(str(word >> index & 1) for word in row), 2)
+             for row in self._rows),
+            self._ncolumns)
+
+    def __eq__(self, other):
+        """Return True if batches are equal."""
+        return (self._size == other.size and
+                self.shapes == other.shapes and
+                self._rows == other.words)
+
+    def __ne__(self, other):
+        """Return True if batches are not equal."""
+        return not self == other
+
+    def __mul__(self, other):
+        """Multiply matrices of batch by matrices of other batch.
+
+        If `other` is Matrix then all matrices are multiplied by it.
+        """
+        if self._ncolumns != other.nrows:
+            raise ValueError(
+                'wrong shapes of matrices: the number of '
+                'columns of the first matrix must be equal the '
+                'number of rows of other matrix, '
+                'but {} != {}'.format(self._ncolumns, other.nrows))
+        if isinstance(other, matrix.Matrix):
+            return self._mul_matrix(other)
+        if self._size != other.size:
+            raise ValueError(
+                'expected batches of the same size, but '
+                '{} != {}'.format(self._size, other.size))
+        other_rows = other.words
+        result = []
+        for row in self._rows:
+            product = [0] * other.ncolumns
+            for lanes, other_row in zip(row, other_rows):
+                if lanes:
+                    product = [word ^ (lanes & other_word)
+                               for word, other_word in zip(product,
+                                                           other_row)]
+            result.append(product)
+        return MatrixBatch(result, other.ncolumns, self._size)
+
+    def __repr__(self):
+        """Return string representation of batch."""
+        return '{name}(size={size}, shapes={shapes})'.format(
+            name=self.__class__.__name__, size=self._size,
+            shapes=self.shapes)
+
+    def _mul_matrix(self, other):
+        """Multiply all matrices of batch by Matrix."""
+        supports = [row.support for row in other]
+        result = []
+        for row in self._rows:
+            product = [0] * other.ncolumns
+            for lanes, support in zip(row, supports):
+                if lanes:
+                    for column in support:
+                        product[column] ^= lanes
+            result.append(product)
+        return MatrixBatch(result, other.ncolumns, self._size)
+
+
+def from_matrices(matrices):
+    """Make batch of matrices of the same shapes."""
+    matrices = list(matrices)
+    if not matrices:
+        return MatrixBatch()
+    nrows, ncolumns = matrices[0].shapes
+    for mat in matrices:
+        if mat.shapes != (nrows, ncolumns):
+            raise ValueError(
+                'expected matrices of shapes {}, but '
+                'got {}'.format((nrows, ncolumns), mat.shapes))
+    width = '0{}b'.format(ncolumns)
+    rows = []
+    for index in range(nrows):
+        # Column `j` of the table is the word of column `j` of the row,
+        # the matrix 0 is the lowest bit.
+        table = (format(mat[index].value, width) for mat in reversed(matrices))
+        rows.append([int(''.join(bits), 2) for bits in zip(*table)])
+    return MatrixBatch(rows, ncolumns, len(matrices))
+
+
+def from_matrix(mat, size):
+    """Make batch of `size` copies of matrix."""
+    full = (1 << size) - 1
+    return MatrixBatch(([full * bit for bit in row] for row in mat),
+                       mat.ncolumns, size)
+
+
+def random(size, nrows, ncolumns, rng=None):
+    """Return batch of `size` random matrices.
+
+    :param: rng - random numbers generator, by default the module `random`.
+    """
+    if not rng:
+        rng = _random
+    return MatrixBatch(
+        ([rng.getrandbits(size) if size else 0 for _ in range(ncolumns)]
+         for _ in range(nrows)),
+        ncolumns, size)
+
+
+def _eliminate(rows, columns, backward):
+    """Reduce rows by their leading ones in order of rows.
+
+    Row `i` reduces the following rows (all other rows if `backward`)
+    having one in its leading column of `columns`, as in methods of
+    Matrix.
+    """
+    full_columns = len(columns) == len(rows[0]) if rows else True
+    for i, row in enumerate(rows):
+        leads = []
+        seen = 0
+        for column in columns:
+            lead = row[column] & ~seen
+            if lead:
+                leads.append((column, lead))
+                seen |= row[column]
+        if not leads:
+            continue
+        # Without other columns the row has only zeroes before its leads.
+        start = leads[0][0] if full_columns else 0
+        others = range(len(rows)) if backward else range(i + 1, len(rows))
+        for k in others:
+            other = rows[k]
+            if k == i:
+                continue
+            hit = 0
+            for column, lead in leads:
+                hit |= lead & other[column]
+            if hit:
+                other[start:] = [word ^ (hit & row_word) for word, row_word
+                                 in zip(other[start:], row[start:])]
+
+
+def _sort(rows, columns, full):
+    """Sort rows of every matrix by values on `columns` in reverse order."""
+    for step in range(len(rows)):
+        for i in range(step % 2, len(rows) - 1, 2):
+            first, second = rows[i], rows[i + 1]
+            # Lanes where the second row is greater than the first one.
+            greater = 0
+            equal = full
+            for column in columns:
+                greater |= equal & second[column] & ~first[column]
+                equal &= ~(first[column] ^ second[column])
+                if not equal:
+                    break
+            if greater:
+                for column, (word, other) in enumerate(zip(first, second)):
+                    diff = (word ^ other) & greater
+                    first[column] = word ^ diff
+                    second[column] = other ^ diff
+
+
+def _count_lanes(masks, size):
+    """Return list of numbers of masks with bit `k` for every lane `k`."""
+    counts = [0] * size
+    width = '0{}b'.format(size)
+    for mask in masks:
+        for lane, bit in enumerate(format(mask, width)[::-1]):
+            if bit == '1':
+                counts[lane] += 1
+    return counts
@@ -0,0 +1,443 @@
+"""Iterative decoders of binary codes with sparse parity check matrix.
+
+Messages are stored in flat edge arrays: edges are numbered by checks (as
+ones of CSR format of parity check matrix) and every variable keeps the
+list of its edges. A batch of frames is decoded together, a frame leaves
+the batch as soon as its syndrome is zero.
+
+If `numpy` is installed then messages of the batch are `numpy` arrays
+`frames x edges`: check messages are evaluated by reductions over
+segments of edges of checks (`numpy.ufunc.reduceat` on the CSR pointers)
+and sums of variables by reductions over edges sorted by variables.
+Frames with zero syndrome are removed from the arrays after every
+iteration. Without `numpy` frames are decoded one by one by loops over
+edges.
+
+LLR of a bit is `log(P(bit = 0) / P(bit = 1))`, so positive values
+are decided to zero.
+"""
+
+import itertools
+import math
+from array import array
+from blincodes import matrix, vector
+from blincodes.sparse import SparseMatrix, from_matrix
+
+#: Bound of tanh of messages keeping atanh finite.
+TANH_BOUND = 1 - 1e-12
+
+#: Number of frames decoded at once by `numpy` arrays.
+BATCH_SIZE = 1 << 10
+
+
+class BeliefPropagation():
+    """Iterative decoder on the Tanner graph of parity check matrix."""
+
+    def __init__(self, parity_check, vectorized=True):
+        """Create decoder.
+
+        :param: parity_check - Matrix or SparseMatrix;
+        :param: bool vectorized - if True and `numpy` is installed then
+                                  soft decoders process batches of frames
+                                  by `numpy` arrays.
+        """
+        if isinstance(parity_check, matrix.Matrix):
+            parity_check = from_matrix(parity_check)
+        if not isinstance(parity_check, SparseMatrix):
+            raise TypeError(
+                'expected `parity_check` is Matrix or SparseMatrix, but '
+                'got {}'.format(type(parity_check)))
+        self._nchecks, self._nvariables = parity_check.shapes
+        self._check_pointers = array('l', [0])
+        self._edge_variables = array('l')
+        for row in parity_check:
+            self._edge_variables.extend(row)
+            self._check_pointers.append(len(self._edge_variables))
+        variable_edges = [[] for _ in range(self._nvariables)]
+        for edge, variable in enumerate(self._edge_variables):
+            variable_edges[variable].append(edge)
+        self._variable_pointers = array('l', [0])
+        self._variable_edges = array('l')
+        for edges in variable_edges:
+            self._variable_edges.extend(edges)
+            self._variable_pointers.append(len(self._variable_edges))
+        self._vectorized = vectorized
+        self._graph = None
+
+    @property
+    def n(self):
+        """Return length of code."""
+        return self._nvariables
+
+    @property
+    def nchecks(self):
+        """Return number of parity checks."""
+        return self._nchecks
+
+    @property
+    def nedges(self):
+        """Return number of edges of Tanner graph."""
+        return len(self._edge_variables)
+
+    def sum_product(self, frames, max_iterations=50):
+        """Decode frames by sum-product algorithm.
+
+        :param: frames - iterable of sequences of `n` LLRs;
+        :param: int max_iterations - maximal number of iterations.
+        :return: list of Vectors - hard decisions (not codewords
+                 if decoding fails).
+        """
+        numpy = self._numpy()
+        if numpy is not None:
+            return self._decode_batches(numpy, frames, max_iterations,
+                                        _sum_product_batch, None)
+        return self._decode(frames, max_iterations, self._sum_product_checks)
+
+    def min_sum(self, frames, max_iterations=50, scale=1.0):
+        """Decode frames by (normalized) min-sum algorithm.
+
+        :param: frames - iterable of sequences of `n` LLRs;
+        :param: int max_iterations - maximal number of iterations;
+        :param: float scale - factor of check messages, values about
+                              0.75 improve performance of min-sum.
+        :return: list of Vectors - hard decisions.
+        """
+        numpy = self._numpy()
+        if numpy is not None:
+            return self._decode_batches(numpy, frames, max_iterations,
+                                        _min_sum_batch, scale)
+
+        def update(messages, replies):
+            self._min_sum_checks(messages, replies, scale)
+        return self._decode(frames, max_iterations, update)
+
+    def bit_flipping(self, words, max_iterations=50):
+        """Decode hard decisions by bit-flipping algorithm.
+
+        At every iteration the bits in the largest number of unsatisfied
+        checks are flipped.
+        :param: words - iterable of Vectors or integers of length `n`;
+        :param: int max_iterations - maximal number of iterations.
+        :return: list of Vectors.
+        """
+        numpy = self._numpy()
+        if numpy is not None:
+            return self._bit_flipping_batches(numpy, words, max_iterations)
+        pointers = self._check_pointers
+        variables = self._edge_variables
+        decoded = []
+        for word in words:
+            bits = bytearray(int(c) for c in format(
+                int(word), '0{}b'.format(self._nvariables)))
+            for _ in range(max_iterations):
+                counts = [0] * self._nvariables
+                unsatisfied = False
+                for check in range(self._nchecks):
+                    edges = range(pointers[check], pointers[check + 1])
+                    parity = 0
+                    for edge in edges:
+                        parity ^= bits[variables[edge]]
+                    if parity:
+                        unsatisfied = True
+                        for edge in edges:
+                            counts[variables[edge]] += 1
+                if not unsatisfied:
+                    break
+                largest = max(counts)
+                for variable, count in enumerate(counts):
+                    if count == largest:
+                        bits[variable] ^= 1
+            decoded.append(_to_vector(bits))
+        return decoded
+
+    def _numpy(self):
+        """Return module `numpy` if it is used by decoder, else None."""
+        if not self._vectorized:
+            return None
+        try:
+            import numpy
+        except ImportError:
+            return None
+        if self._graph is None:
+            self._graph = _Graph(numpy, self)
+        return numpy
+
+    def _decode_batches(self, numpy, frames, max_iterations, update_checks,
+                        scale):
+        """Decode frames by batches of `numpy` arrays."""
+        decoded = []
+        frames = iter(frames)
+        while True:
+            chunk = [list(frame) for frame in
+                     itertools.islice(frames, BATCH_SIZE)]
+            if not chunk:
+                return decoded
+            for frame in chunk:
+                if len(frame) != self._nvariables:
+                    raise ValueError(
+                        'expected frames of length {}, but got '
+                        '{}'.format(self._nvariables, len(frame)))
+            bits = _decode_batch(numpy, self._graph,
+                                 numpy.array(chunk, dtype=numpy.float64),
+                                 max_iterations, update_checks, scale)
+            packed = numpy.packbits(bits, axis=1)
+            decoded.extend(vector.from_bytes(row, self._nvariables)
+                           for row in packed)
+
+    def _bit_flipping_batches(self, numpy, words, max_iterations):
+        """Decode hard decisions by batches of `numpy` arrays."""
+        decoded = []
+        nbytes = -(-self._nvariables // 8)
+        padding = 8 * nbytes - self._nvariables
+        words = iter(words)
+        while True:
+            chunk = [int(word) for word in
+                     itertools.islice(words, BATCH_SIZE)]
+            if not chunk:
+                return decoded
+            packed = numpy.frombuffer(
+                b''.join((word << padding).to_bytes(nbytes, 'big')
+                         for word in chunk),
+                dtype=numpy.uint8).reshape(len(chunk), nbytes)
+            bits = _bit_flipping_batch(
+                numpy, self._graph,
+                numpy.unpackbits(packed, axis=1, count=self._nvariables),
+                max_iterations)
+            decoded.extend(vector.from_bytes(row, self._nvariables)
+                           for row in numpy.packbits(bits, axis=1))
+
+    def _decode(self, frames, max_iterations, update_checks):
+        """Run message passing on batch of frames.
+
+        :param: update_checks - function evaluating check-to-variable
+                                messages from variable-to-check ones.
+        """
+        variables = self._edge_variables
+        batch = []
+        for frame in frames:
+            llrs = array('d', frame)
+            if len(llrs) != self._nvariables:
+                raise ValueError(
+                    'expected frames of length {}, but got '
+                    '{}'.format(self._nvariables, len(llrs)))
+            messages = array('d', (llrs[variable] for variable in variables))
+            batch.append((llrs, messages))
+        decisions = [bytearray(int(llr < 0) for llr in llrs)
+                     for llrs, _ in batch]
+        active = [i for i in range(len(batch))
+                  if not self._is_codeword(decisions[i])]
+        replies = array('d', bytes(8 * self.nedges))
+        for _ in range(max_iterations):
+            if not active:
+                break
+            still_active = []
+            for i in active:
+                llrs, messages = batch[i]
+                update_checks(messages, replies)
+                decisions[i] = self._update_variables(llrs, messages, replies)
+                if not self._is_codeword(decisions[i]):
+                    still_active.append(i)
+            active = still_active
+        return [_to_vector(bits) for bits in decisions]
+
+    def _sum_product_checks(self, messages, replies):
+        """Evaluate check messages by tanh rule with prefix products."""
+        pointers = self._check_pointers
+        for check in range(self._nchecks):
+            start, stop = pointers[check], pointers[check + 1]
+            tanhs = [math.tanh(messages[edge] / 2)
+                     for edge in range(start, stop)]
+            prefix = 1.0
+            prefixes = []
+            for value in tanhs:
+                prefixes.append(prefix)
+                prefix *= value
+            suffix = 1.0
+            for j in range(stop - start - 1, -1, -1):
+                product = prefixes[j] * suffix
+                product = max(-TANH_BOUND, min(TANH_BOUND, product))
+                replies[start + j] = 2 * math.atanh(product)
+                suffix *= tanhs[j]
+
+    def _min_sum_checks(self, messages, replies, scale):
+        """Evaluate check messages by min-sum rule."""
+        pointers = self._check_pointers
+        for check in range(self._nchecks):
+            start, stop = pointers[check], pointers[check + 1]
+            negative = False
+            first = second = math.inf
+            first_edge = -1
+            for edge in range(start, stop):
+                value = messages[edge]
+                if value < 0:
+                    negative = not negative
+                    value = -value
+                if value < first:
+                    first, second, first_edge = value, first, edge
+                elif value < second:
+                    second = value
+            for edge in range(start, stop):
+                magnitude = second if edge == first_edge else first
+                if magnitude == math.inf:
+                    magnitude = 0.0
+                if negative != (messages[edge] < 0):
+                    magnitude = -magnitude
+                replies[edge] = scale * magnitude
+
+    def _update_variables(self, llrs, messages, replies):
+        """Evaluate variable messages and return hard decisions."""
+        pointers = self._variable_pointers
+        edges = self._variable_edges
+        bits = bytearray(self._nvariables)
+        for variable in range(self._nvariables):
+            variable_edges = edges[pointers[variable]:pointers[variable + 1]]
+            total = llrs[variable]
+            for edge in variable_edges:
+                total += replies[edge]
+            for edge in variable_edges:
+                messages[edge] = total - replies[edge]
+            bits[variable] = total < 0
+        return bits
+
+    def _is_codeword(self, bits):
+        """Return True if all checks are satisfied."""
+        pointers = self._check_pointers
+        variables = self._edge_variables
+        for check in range(self._nchecks):
+            parity = 0
+            for edge in range(pointers[check], pointers[check + 1]):
+                parity ^= bits[variables[edge]]
+            if parity:
+                return False
+        return True
+
+
+class _Graph():
+    """Tanner graph as `numpy` arrays."""
+
+    def __init__(self, numpy, decoder):
+        """Convert edge arrays of decoder."""
+        self.edge_variables = numpy.array(decoder._edge_variables,
+                                          dtype=numpy.intp)
+        pointers = numpy.array(decoder._check_pointers, dtype=numpy.intp)
+        degrees = numpy.diff(pointers)
+        # Segments of checks without edges are skipped by `reduceat`.
+        self.check_starts = pointers[:-1][degrees > 0]
+        self.edge_checks = numpy.repeat(
+            numpy.arange(len(self.check_starts)), degrees[degrees > 0])
+        self.variable_edges = numpy.array(decoder._variable_edges,
+                                          dtype=numpy.intp)
+        pointers = numpy.array(decoder._variable_pointers, dtype=numpy.intp)
+        degrees = numpy.diff(pointers)
+        self.variable_starts = pointers[:-1][degrees > 0]
+        self.connected = numpy.flatnonzero(degrees > 0)
+
+
+def _decode_batch(numpy, graph, llrs, max_iterations, update_checks,
+                  scale):
+    """Return array of hard decisions of frames `llrs`."""
+    bits = llrs < 0
+    if not len(graph.edge_variables):
+        return bits
+    active = numpy.flatnonzero(_syndromes(numpy, graph, bits))
+    llrs = llrs[active]
+    messages = llrs[:, graph.edge_variables]
+    for _ in range(max_iterations):
+        if not len(active):
+            break
+        replies = update_checks(numpy, graph, messages, scale)
+        totals = llrs.copy()
+        totals[:, graph.connected] += numpy.add.reduceat(
+            replies[:, graph.variable_edges], graph.variable_starts, axis=1)
+        decisions = totals < 0
+        bits[active] = decisions
+        unsolved = _syndromes(numpy, graph, decisions)
+        active = active[unsolved]
+        llrs = llrs[unsolved]
+        messages = (totals[:, graph.edge_variables] - replies)[unsolved]
+    return bits
+
+
+def _bit_flipping_batch(numpy, graph, bits, max_iterations):
+    """Return array of bits of frames after bit-flipping decoding.
+
+    :param: bits - array `frames x variables` of dtype uint8.
+    """
+    if not len(graph.edge_variables):
+        return bits
+    active = numpy.arange(len(bits))
+    current = bits
+    for _ in range(max_iterations):
+        parities = numpy.bitwise_xor.reduceat(
+            current[:, graph.edge_variables], graph.check_starts, axis=1)
+        unsolved = parities.any(axis=1)
+        bits[active] = current
+        active = active[unsolved]
+        if not len(active):
+            break
+        current = current[unsolved]
+        unsatisfied = parities[unsolved][:, graph.edge_checks]
+        counts = numpy.zeros(current.shape, dtype=numpy.intp)
+        counts[:, graph.connected] = numpy.add.reduceat(
+            unsatisfied[:, graph.variable_edges], graph.variable_starts,
+            axis=1, dtype=numpy.intp)
+        current = current ^ (
+            counts == counts.max(axis=1, keepdims=True)).astype(numpy.uint8)
+    else:
+        bits[active] = current
+    return bits
+
+
+def _syndromes(numpy, graph, bits):
+    """Return boolean array of frames with nonzero syndromes."""
+    parities = numpy.logical_xor.reduceat(
+        bits[:, graph.edge_variables], graph.check_starts, axis=1)
+    return parities.any(axis=1)
+
+
+def _signs(numpy, graph, messages):
+    """Return array of edges with negative product of other messages."""
+    negative = messages < 0
+    parities = numpy.logical_xor.reduceat(negative, graph.check_starts,
+                                          axis=1)
+    return parities[:, graph.edge_checks] != negative
+
+
+def _sum_product_batch(numpy, graph, messages, _):
+    """Evaluate check messages of batch by tanh rule.
+
+    Products of other edges are quotients of sums of logarithms, zero
+    values are replaced by the smallest positive number.
+    """
+    magnitudes = numpy.maximum(numpy.abs(numpy.tanh(messages / 2)),
+                               numpy.finfo(numpy.float64).tiny)
+    logs = numpy.log(magnitudes)
+    sums = numpy.add.reduceat(logs, graph.check_starts, axis=1)
+    products = numpy.minimum(numpy.exp(sums[:, graph.edge_checks] - logs),
+                             TANH_BOUND)
+    replies = 2 * numpy.arctanh(products)
+    return numpy.where(_signs(numpy, graph, messages), -replies, replies)
+
+
+def _min_sum_batch(numpy, graph, messages, scale):
+    """Evaluate check messages of batch by min-sum rule."""
+    magnitudes = numpy.abs(messages)
+    first = numpy.minimum.reduceat(magnitudes, graph.check_starts, axis=1)
+    is_first = magnitudes == first[:, graph.edge_checks]
+    # Ties of the minimum make it the second minimum too.
+    ties = numpy.add.reduceat(is_first, graph.check_starts, axis=1) > 1
+    second = numpy.minimum.reduceat(
+        numpy.where(is_first, numpy.inf, magnitudes), graph.check_starts,
+        axis=1)
+    second = numpy.where(ties, first, second)
+    second[second == numpy.inf] = 0.0
+    replies = scale * numpy.where(is_first, second[:, graph.edge_checks],
+                                  first[:, graph.edge_checks])
+    return numpy.where(_signs(numpy, graph, messages), -replies, replies)
+
+
+def _to_vector(bits):
+    """Return Vector from bytearray of bits."""
+    if not bits:
+        return vector.Vector(0, 0)
+    return vector.Vector(int(bytes(b + 48 for b in bits), 2), len(bits))
@@ -0,0 +1,162 @@
+"""Key generation of McEliece and Niederreiter cryptosystems.
+
+Permutations are stored implicitly as lists of column indices: column `i`
+of the permuted matrix is the column `permutation[i]` of the source
+matrix, so `permute_columns(mat, perm)` equals
+`mat * matrix.permutation(perm)` without the dense `n x n` matrix.
+Scramblers are generated by `sampling.nonsingular` in O(k^2) word
+operations.
+
+The public key is the systematic form `[I | A]` of the permuted matrix,
+the permutation of private key already moves the information set to
+the first positions.
+"""
+
+import multiprocessing
+import random
+from blincodes import matrix, sampling
+from blincodes.codes import systematic
+from blincodes.permutation import Permutation, random as _random_permutation
+
+
+class KeyPair():
+    """Keys of McEliece (Niederreiter) cryptosystem."""
+
+    def __init__(self, public, secret, permutation, scrambler=None):
+        """Create keys.
+
+        :param: Matrix public - the public matrix;
+        :param: Matrix secret - the secret generator (parity check) matrix;
+        :param: permutation - list of column indices;
+        :param: Matrix scrambler - the nonsingular matrix `S` satisfied
+                                   `public = S * permute_columns(secret,
+                                   permutation)`, None for systematic keys.
+        """
+        self._public = public
+        self._secret = secret
+        self._permutation = tuple(permutation)
+        self._scrambler = scrambler
+
+    @property
+    def public(self):
+        """Return the public matrix."""
+        return self._public
+
+    @property
+    def secret(self):
+        """Return the secret generator (parity check) matrix."""
+        return self._secret
+
+    @property
+    def permutation(self):
+        """Return the secret permutation as list of column indices."""
+        return list(self._permutation)
+
+    @property
+    def scrambler(self):
+        """Return the scrambler matrix or None for systematic keys."""
+        return self._scrambler
+
+    def __repr__(self):
+        """Return string representation of keys."""
+        return '{name}(shapes={shapes}, systematic={systematic})'.format(
+            name=self.__class__.__name__,
+            shapes=self._public.shapes,
+            systematic=self._scrambler is None)
+
+
+def permute_columns(mat, permutation):
+    """Return matrix with columns `mat[:, permutation[i]]`."""
+    return Permutation(permutation).permute(mat)
+
+
+def random_permutation(size, rng=None):
+    """Return random permutation of `size` elements as list.
+
+    See `permutation.random`.
+    """
+    return list(_random_permutation(size, rng))
+
+
+def random_scrambler(size, rng=None):
+    """Return random nonsingular matrix `size x size`.
+
+    See `sampling.nonsingular`.
+    """
+    return sampling.nonsingular(size, rng)
+
+
+def keypair(secret, rng=None, systematic_key=True):
+    """Generate keys from the secret matrix.
+
+    :param: Matrix secret - the generator matrix of code (McEliece) or
+                            its parity check matrix (Niederreiter);
+    :param: rng - random numbers generator, by default the module `random`;
+    :param: bool systematic_key - if True the public matrix is `[I | A]`,
+                                  else it is `S * secret * P` with random
+                                  nonsingular `S`.
+    :return: KeyPair.
+    """
+    if not rng:
+        rng = random
+    permutation = random_permutation(secret.ncolumns, rng)
+    permuted = permute_columns(secret, permutation)
+    if not systematic_key:
+        scrambler = random_scrambler(secret.nrows, rng)
+        public = _multiply_rows(scrambler, permuted)
+        return KeyPair(public, secret, permutation, scrambler)
+    form, _, order = systematic.systematic_form(permuted)
+    return KeyPair(permute_columns(form, order), secret,
+                   [permutation[i] for i in order])
+
+
+def mceliece(generator, rng=None, systematic_key=True):
+    """Generate McEliece keys from the generator matrix of code."""
+    return keypair(generator, rng, systematic_key)
+
+
+def niederreiter(parity_check, rng=None, systematic_key=True):
+    """Generate Niederreiter keys from the parity check matrix of code."""
+    return keypair(parity_check, rng, systematic_key)
+
+
+def generate_keys(secret, count, seed=None, processes=None,
+                  systematic_key=True):
+    """Generate many keys from the same secret matrix.
+
+    The key `i` uses its own generator `sampling.stream(seed, i)`,
+    so the result does not depend on the number of processes.
+    :param: Matrix secret - the generator (parity check) matrix;
+    :param: int count - number of keys;
+    :param: seed - the base seed, random by default;
+    :param: int processes - number of worker processes.
+    :return: list of KeyPair.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    rows = tuple(row.value for row in secret)
+    tasks = [(rows, secret.ncolumns, seed, i, systematic_key)
+             for i in range(count)]
+    if not processes or processes <= 1:
+        return [_keypair_task(task) for task in tasks]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_keypair_task, tasks)
+
+
+def _keypair_task(args):
+    """Return KeyPair generated by worker."""
+    rows, ncolumns, seed, index, systematic_key = args
+    return keypair(matrix.Matrix(rows, ncolumns),
+                   sampling.stream(seed, index), systematic_key)
+
+
+def _multiply_rows(left, right):
+    """Return product of matrices as XOR of rows of `right`."""
+    rows = tuple(row.value for row in right)
+    result = []
+    for row in left:
+        value = 0
+        for i in row.support:
+            value ^= rows[i]
+        result.append(value)
+    return matrix.Matrix(result, right.ncolumns)
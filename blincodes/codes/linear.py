@@ -0,0 +1,295 @@
+"""Binary linear code with lazily evaluated and cached invariants."""
+
+from blincodes import matrix, subspace, vector
+from blincodes.basis import IncrementalBasis, from_reduced
+from blincodes.codes import modify, systematic, tools
+
+
+class LinearCode():
+    """Binary linear code given by generator matrix.
+
+    Invariants of the code are evaluated on the first request and cached.
+    Codes obtained by `puncture`, `truncate`, `hull`, `union`, etc. get
+    their reduced basis without elimination of generator matrix. Punctured
+    and truncated codes of code with known dual get their dual codes
+    from the modified dual code, the hull gets its parity check matrix
+    from the same evaluation as its basis.
+    """
+
+    def __init__(self, generator):
+        """Create new code.
+
+        :param: Matrix generator - any matrix which rows span the code,
+                                   for example the output of `rm.generator`.
+        """
+        self._ncolumns = generator.ncolumns
+        self._source = tuple(row.value for row in generator)
+        self._basis = None
+        self._parity_rows = None
+        self._dual = None
+        self._spectrum = None
+        self._minimum_distance = None
+        self._encoder = None
+
+    @property
+    def n(self):
+        """Return length of code."""
+        return self._ncolumns
+
+    @property
+    def k(self):
+        """Return dimension of code."""
+        return self.basis.rank
+
+    @property
+    def basis(self):
+        """Return IncrementalBasis of code in the reduced echelon form."""
+        if self._basis is None:
+            self._basis = IncrementalBasis(self._ncolumns, self._source)
+            self._source = None
+        return self._basis
+
+    @property
+    def generator(self):
+        """Return generator matrix of code in the reduced echelon form."""
+        return matrix.Matrix(self.basis.rows, self._ncolumns)
+
+    @property
+    def systematic_form(self):
+        """Return systematic generator matrix of code.
+
+        The matrix is the reduced echelon form, so it contains the identity
+        matrix in columns of `information_set`.
+        """
+        return self.generator
+
+    @property
+    def information_set(self):
+        """Return sorted list of positions of information set."""
+        return self.basis.pivots
+
+    @property
+    def encoder(self):
+        """Return SystematicEncoder on the information set of code."""
+        if self._encoder is None:
+            self._encoder = systematic.SystematicEncoder(self.generator)
+        return self._encoder
+
+    @property
+    def parity_check(self):
+        """Return parity check matrix of code."""
+        return matrix.Matrix(self._parity_check_rows(), self._ncolumns)
+
+    @property
+    def dual(self):
+        """Return dual code as LinearCode."""
+        if self._dual is None:
+            self._dual = _from_basis(IncrementalBasis(
+                self._ncolumns, self._parity_check_rows()))
+            self._dual._parity_rows = self.basis.rows
+            self._dual._dual = self
+        return self._dual
+
+    @property
+    def spectrum(self):
+        """Return the spectrum of code as dict {weight: count}.
+
+        If the spectrum of dual code is known or the dual code is smaller
+        then the spectrum is evaluated by MacWilliams identity.
+        """
+        if self._spectrum is None:
+            if self._dual is not None and self._dual._spectrum is not None:
+                self._spectrum = tools.macwilliams(
+                    self._dual._spectrum, self._dual.k, self._ncolumns)
+            elif self.k > self._ncolumns - self.k:
+                self._spectrum = tools.macwilliams(
+                    self.dual.spectrum, self._ncolumns - self.k,
+                    self._ncolumns)
+            else:
+                self._spectrum = tools.spectrum(self.generator,
+                                                self._ncolumns)
+        return dict(self._spectrum)
+
+    @property
+    def minimum_distance(self):
+        """Return minimum distance of code.
+
+        The minimum distance of zero code is 0.
+        """
+        if self._minimum_distance is None:
+            self._minimum_distance = min(
+                (weight for weight, count in self.spectrum.items()
+                 if weight and count), default=0)
+        return self._minimum_distance
+
+    def encode(self, message):
+        """Encode message by systematic generator matrix.
+
+        Bits of `message` appear in codeword on positions of
+        `information_set`.
+        :param: message - Vector or integer of length `k`.
+        :return: Vector - codeword.
+        """
+        return self.encoder.encode(message)
+
+    def recover(self, word):
+        """Return message of codeword `word` as Vector of length `k`.
+
+        The message is read from positions of `information_set`.
+        """
+        return self.encoder.recover(word)
+
+    def syndrome(self, word):
+        """Return the syndrome of `word` as Vector of length `n - k`."""
+        value = int(word)
+        syndrome = 0
+        for row in self._parity_check_rows():
+            syndrome = (syndrome << 1) ^ (bin(row & value).count('1') & 1)
+        return vector.Vector(syndrome, self._ncolumns - self.k)
+
+    def puncture(self, columns, remove_zeroes=False):
+        """Return punctured code as LinearCode.
+
+        If the dual code is known then the dual of punctured code is
+        the dual code truncated on the same positions.
+        """
+        modified = modify.ModifiedCode(self.basis).puncture(columns)
+        code = _from_modified(modified, remove_zeroes)
+        if self._dual is not None:
+            _link_dual(code, modify.ModifiedCode(self._dual.basis).truncate(
+                modified.punctured), remove_zeroes)
+        return code
+
+    def truncate(self, columns, remove_zeroes=False):
+        """Return truncated code as LinearCode.
+
+        If the dual code is known then the dual of truncated code is
+        the dual code punctured on the same positions.
+        """
+        modified = modify.ModifiedCode(self.basis).truncate(columns)
+        code = _from_modified(modified, remove_zeroes)
+        if self._dual is not None:
+            _link_dual(code, modify.ModifiedCode(self._dual.basis).puncture(
+                modified.truncated), remove_zeroes)
+        return code
+
+    def hull(self):
+        """Return intersection of code and its dual as LinearCode.
+
+        The dual of hull is the sum of code and its dual, it is evaluated
+        together with the hull and kept as its parity check matrix.
+        """
+        sum_rows, hull_rows = subspace.zassenhaus(self.generator,
+                                                  self.parity_check)
+        code = _from_basis(from_reduced(hull_rows, self._ncolumns))
+        code._parity_rows = sum_rows
+        return code
+
+    def union(self, other):
+        """Return sum of two codes as LinearCode."""
+        if other.n == self._ncolumns:
+            sum_basis = self.basis.copy()
+        else:
+            sum_basis = IncrementalBasis(max(self._ncolumns, other.n),
+                                         self.basis.rows)
+        sum_basis.extend(other.basis.rows)
+        return _from_basis(sum_basis)
+
+    def intersection(self, other):
+        """Return intersection of two codes as LinearCode."""
+        return _from_basis(from_reduced(
+            subspace.zassenhaus(self.generator, other.generator)[1],
+            max(self._ncolumns, other.n)))
+
+    def hadamard_product(self, other=None, processes=None):
+        """Return Hadamard product of two codes as LinearCode.
+
+        If `other` is None then Schur square of code is returned.
+        """
+        if other is None:
+            other = self
+        product = tools.hadamard_product(self.generator, other.generator,
+                                         processes=processes)
+        return _from_basis(from_reduced(
+            (row.value for row in product),
+            max(self._ncolumns, other.n)))
+
+    def is_subcode(self, other):
+        """Return True if code is subcode of code `other`."""
+        for row in self.basis.rows:
+            if other.basis.reduce(row):
+                return False
+        return True
+
+    def __contains__(self, word):
+        """Return True if `word` is codeword."""
+        return not self.basis.reduce(int(word))
+
+    def __eq__(self, other):
+        """Return True if codes are equal."""
+        try:
+            return (self._ncolumns == other.n and
+                    self.basis.rows == other.basis.rows)
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        """Return False if codes are equal."""
+        return not self == other
+
+    def __repr__(self):
+        """Return string representation of code."""
+        return '{name}(n={n}, k={k})'.format(
+            name=self.__class__.__name__, n=self._ncolumns, k=self.k)
+
+    def _parity_check_rows(self):
+        """Return rows of parity check matrix as tuple of integers."""
+        if self._parity_rows is None:
+            self._parity_rows = tuple(subspace.orthogonal_rows(self.basis))
+        return self._parity_rows
+
+
+def _from_basis(row_basis):
+    """Return LinearCode with given IncrementalBasis."""
+    code = LinearCode(matrix.Matrix())
+    code._ncolumns = row_basis.ncolumns
+    code._source = None
+    code._basis = row_basis
+    return code
+
+
+def _link_dual(code, modified_dual, remove_zeroes):
+    """Set the dual code of `code` from modified dual code.
+
+    Without deletion of removed positions any vector on them is
+    orthogonal to `code`, so unit vectors of the positions are added to
+    the basis. They keep the reduced echelon form, since rows of modified
+    code are zero on removed positions.
+    """
+    dual = _from_modified(modified_dual, remove_zeroes)
+    if not remove_zeroes:
+        mask = modified_dual.removed_mask
+        rows = list(dual.basis.rows)
+        while mask:
+            bit = mask & -mask
+            rows.append(bit)
+            mask ^= bit
+        dual = _from_basis(from_reduced(rows, dual.n))
+    code._dual = dual
+    code._parity_rows = dual.basis.rows
+    dual._dual = code
+    dual._parity_rows = code.basis.rows
+
+
+def _from_modified(modified, remove_zeroes):
+    """Return LinearCode of ModifiedCode.
+
+    Removed positions are zero in all rows, so deleting them keeps
+    the reduced echelon form.
+    """
+    generator = modified.generator(remove_zeroes=remove_zeroes)
+    ncolumns = modified.ncolumns
+    if remove_zeroes:
+        ncolumns -= bin(modified.removed_mask).count('1')
+    return _from_basis(from_reduced(
+        (row.value for row in generator), ncolumns))
@@ -0,0 +1,62 @@
+"""Maximum likelihood hard decision decoding by exhaustive search.
+
+Codewords are enumerated in Gray code order in chunks, every received word
+of a batch is compared with the whole chunk by `map` over XOR and popcount
+of integers. A word leaves the batch as soon as the found distance is not
+greater than a known radius of unique decoding, such as `(d - 1) // 2`.
+It is suitable for codes of dimension up to about 30.
+"""
+
+from blincodes import vector
+from blincodes.codes.tools import iter_gray_codewords, popcount
+
+#: Number of codewords compared with words at once.
+CHUNK_SIZE = 1024
+
+
+def decode(generator, words, radius=-1, chunk_size=CHUNK_SIZE):
+    """Return the nearest codewords to words.
+
+    :param: Matrix generator - the generator matrix of code;
+    :param: words - iterable of Vectors or integers of length `n`;
+    :param: int radius - the search stops for a word when the distance
+                         to a codeword is not greater than `radius`,
+                         `(d - 1) // 2` is correct for any code with
+                         minimum distance `d`;
+    :param: int chunk_size - number of codewords compared at once.
+    :return: list of Vectors - the first nearest codeword in Gray code
+             order for every word.
+    """
+    ncolumns = generator.ncolumns
+    rows = tuple(row.value for row in generator)
+    values = [int(word) for word in words]
+    nearest = [0] * len(values)
+    distances = [popcount(value) for value in values]
+    active = [i for i, distance in enumerate(distances) if distance > radius]
+    for chunk in _iter_chunks(rows, chunk_size):
+        if not active:
+            break
+        finished = False
+        for i in active:
+            chunk_distances = list(map(popcount,
+                                       map(values[i].__xor__, chunk)))
+            distance = min(chunk_distances)
+            if distance < distances[i]:
+                distances[i] = distance
+                nearest[i] = chunk[chunk_distances.index(distance)]
+                finished = finished or distance <= radius
+        if finished:
+            active = [i for i in active if distances[i] > radius]
+    return [vector.Vector(value, ncolumns) for value in nearest]
+
+
+def _iter_chunks(rows, chunk_size):
+    """Iterate over lists of nonzero codewords in Gray code order."""
+    chunk = []
+    for word in iter_gray_codewords(rows):
+        chunk.append(word)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
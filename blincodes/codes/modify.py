@@ -0,0 +1,134 @@
+"""Puncturing and truncating (shortening) of binary linear codes.
+
+Positions are selected by bit masks and the code is kept in the reduced
+echelon form, which is updated after every removed position without
+a new Gaussian elimination.
+"""
+
+from blincodes import matrix, vector
+from blincodes.basis import IncrementalBasis
+
+
+class ModifiedCode():
+    """Code obtained from other code by puncturing and truncating."""
+
+    def __init__(self, generator):
+        """Create modified code equal to code with generator `generator`.
+
+        :param: generator - generator Matrix or IncrementalBasis of code.
+        """
+        self._ncolumns = generator.ncolumns
+        if isinstance(generator, IncrementalBasis):
+            self._basis = generator.copy()
+        else:
+            self._basis = IncrementalBasis(generator.ncolumns, generator)
+        self._punctured = 0
+        self._truncated = 0
+
+    @property
+    def ncolumns(self):
+        """Return length of code."""
+        return self._ncolumns
+
+    @property
+    def dimension(self):
+        """Return dimension of code."""
+        return self._basis.rank
+
+    @property
+    def punctured(self):
+        """Return sorted list of punctured positions."""
+        return vector.Vector(self._punctured, self._ncolumns).support
+
+    @property
+    def truncated(self):
+        """Return sorted list of truncated positions."""
+        return vector.Vector(self._truncated, self._ncolumns).support
+
+    @property
+    def removed_mask(self):
+        """Return integer with ones on punctured and truncated positions."""
+        return self._punctured | self._truncated
+
+    def copy(self):
+        """Return copy of modified code."""
+        other = self.__class__(matrix.Matrix())
+        other._ncolumns = self._ncolumns
+        other._basis = self._basis.copy()
+        other._punctured = self._punctured
+        other._truncated = self._truncated
+        return other
+
+    def puncture(self, columns):
+        """Puncture code on positions `columns`.
+
+        Every codeword gets zeroes on the positions.
+        :return: self
+        """
+        for column in _iter_columns(columns):
+            bit = 1 << (self._ncolumns - column - 1)
+            if not self.removed_mask & bit:
+                self._basis.puncture(column)
+            self._punctured |= bit
+        return self
+
+    def truncate(self, columns):
+        """Truncate (shorten) code on positions `columns`.
+
+        Only codewords having zeroes on the positions are kept.
+        :return: self
+        """
+        for column in _iter_columns(columns):
+            bit = 1 << (self._ncolumns - column - 1)
+            if not self.removed_mask & bit:
+                self._basis.shorten(column)
+            self._truncated |= bit
+        return self
+
+    def generator(self, remove_zeroes=False):
+        """Return generator matrix of code in the reduced echelon form.
+
+        :param: bool remove_zeroes - if it is True then punctured and
+                                     truncated positions are deleted.
+        """
+        rows = self._basis.rows
+        if not remove_zeroes:
+            return matrix.Matrix(rows, self._ncolumns)
+        return matrix.Matrix(
+            delete_columns(rows, self.removed_mask, self._ncolumns),
+            self._ncolumns - bin(self.removed_mask).count('1'))
+
+
+def delete_columns(rows, mask, ncolumns):
+    """Return rows without columns marked by ones in `mask`.
+
+    Kept columns are moved by contiguous runs, so the cost of a row is
+    proportional to the number of deleted columns.
+    :param: rows - iterable of integers;
+    :param: int mask - integer with ones on deleted columns;
+    :param: int ncolumns - length of rows.
+    :return: list of integers.
+    """
+    runs = []  # [(shift in row, mask of run, shift in result)]
+    shift = 0
+    bit = 0
+    while bit < ncolumns:
+        if mask >> bit & 1:
+            bit += 1
+            continue
+        start = bit
+        while bit < ncolumns and not mask >> bit & 1:
+            bit += 1
+        runs.append((start, (1 << (bit - start)) - 1, shift))
+        shift += bit - start
+    return [sum(((row >> start) & run_mask) << new_shift
+                for start, run_mask, new_shift in runs)
+            for row in rows]
+
+
+def _iter_columns(columns):
+    """Iterate over columns given by integer or iterable of integers."""
+    if isinstance(columns, int):
+        yield columns
+    elif columns:
+        yield from columns
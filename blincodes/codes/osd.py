@@ -0,0 +1,161 @@
+"""Ordered statistics decoding (OSD) of binary linear codes.
+
+Positions of a frame are sorted by reliability `|LLR|` and the generator
+matrix is reduced to the systematic form on the most reliable basis
+(MRB). The hard decision on MRB is re-encoded together with all test
+error patterns of weight up to the order of decoder, the codeword with
+the least discrepancy with the frame is returned.
+
+Systematic forms are cached by the set of the most reliable positions up
+to the last pivot. The greedy MRB depends on the order of positions, not
+only on their set: the cached information set is the MRB of a new frame
+exactly when every pivot having one in a non-pivot column comes before
+this column in the new order. The condition is checked against cached
+rows before reuse, so the result does not depend on the cache.
+"""
+
+from collections import OrderedDict
+from itertools import combinations
+from blincodes import vector
+from blincodes.codes import systematic
+
+
+class OSD():
+    """Ordered statistics decoder of order `order`."""
+
+    def __init__(self, generator, order=1, cache_size=128):
+        """Create decoder.
+
+        :param: Matrix generator - the generator matrix of code;
+        :param: int order - maximal weight of test error patterns;
+        :param: int cache_size - maximal number of cached eliminations.
+        """
+        if order < 0:
+            raise ValueError(
+                'expected `order` is not less then 0, but '
+                '{} < 0'.format(order))
+        self._generator = generator
+        self._ncolumns = generator.ncolumns
+        self._order = order
+        self._cache_size = cache_size
+        # {prefix length: OrderedDict {set of prefix: (rows, bits)}}
+        self._cache = {}
+        self._hits = 0
+
+    @property
+    def n(self):
+        """Return length of code."""
+        return self._ncolumns
+
+    @property
+    def order(self):
+        """Return order of decoder."""
+        return self._order
+
+    @property
+    def cache_hits(self):
+        """Return number of frames decoded with cached elimination."""
+        return self._hits
+
+    def decode(self, frames):
+        """Decode batch of frames.
+
+        :param: frames - iterable of sequences of `n` LLRs, LLR is
+                         `log(P(bit = 0) / P(bit = 1))`.
+        :return: list of Vectors - codewords.
+        """
+        return [self._decode_frame(frame) for frame in frames]
+
+    def _decode_frame(self, frame):
+        """Return the most likely found codeword of one frame."""
+        frame = list(frame)
+        if len(frame) != self._ncolumns:
+            raise ValueError(
+                'expected frames of length {}, but got '
+                '{}'.format(self._ncolumns, len(frame)))
+        ncolumns = self._ncolumns
+        reliabilities = [abs(llr) for llr in frame]
+        hard = 0
+        for llr in frame:
+            hard = (hard << 1) | (llr < 0)
+        order = sorted(range(ncolumns), key=lambda i: -reliabilities[i])
+        rows, bits = self._elimination(order)
+        base = 0
+        for row, bit in zip(rows, bits):
+            if hard >> bit & 1:
+                base ^= row
+        best, best_cost = base, _discrepancy(base ^ hard, reliabilities,
+                                              ncolumns)
+        for weight in range(1, min(self._order, len(rows)) + 1):
+            for flips in combinations(rows, weight):
+                word = base
+                for row in flips:
+                    word ^= row
+                cost = _discrepancy(word ^ hard, reliabilities, ncolumns)
+                if cost < best_cost:
+                    best, best_cost = word, cost
+        return vector.Vector(best, ncolumns)
+
+    def _elimination(self, order):
+        """Return rows of systematic form on MRB and bits of pivots."""
+        for length, cached in self._cache.items():
+            key = frozenset(order[:length])
+            if key in cached and _is_greedy(*cached[key], order,
+                                            self._ncolumns):
+                cached.move_to_end(key)
+                self._hits += 1
+                return cached[key]
+        form, information_set, _ = systematic.systematic_form(
+            self._generator, order)
+        rows = tuple(row.value for row in form)
+        bits = tuple(self._ncolumns - column - 1
+                     for column in information_set)
+        if self._cache_size:
+            position = {column: i for i, column in enumerate(order)}
+            length = max((position[column] + 1
+                          for column in information_set), default=0)
+            cached = self._cache.setdefault(length, OrderedDict())
+            key = frozenset(order[:length])
+            cached[key] = rows, bits
+            cached.move_to_end(key)
+            if len(cached) > self._cache_size:
+                cached.popitem(last=False)
+        return rows, bits
+
+
+def _is_greedy(rows, bits, order, ncolumns):
+    """Return True if the pivots of rows are the greedy MRB for `order`.
+
+    The column of order is taken into greedy MRB if it is independent of
+    the taken columns, so the pivots are taken and other columns are not
+    exactly when no pivot row has one in a non-pivot column before its
+    pivot.
+    """
+    pivot_rows = dict(zip(bits, rows))
+    skipped = 0
+    remaining = len(rows)
+    for column in order:
+        if not remaining:
+            break
+        bit = ncolumns - column - 1
+        row = pivot_rows.get(bit)
+        if row is None:
+            skipped |= 1 << bit
+        elif row & skipped:
+            return False
+        else:
+            remaining -= 1
+    return True
+
+
+def _discrepancy(difference, reliabilities, length):
+    """Return sum of reliabilities on positions of ones of `difference`."""
+    if not difference:
+        return 0
+    cost = 0
+    bits = format(difference, '0{}b'.format(length))
+    position = bits.find('1')
+    while position >= 0:
+        cost += reliabilities[position]
+        position = bits.find('1', position + 1)
+    return cost
@@ -0,0 +1,395 @@
+"""Structural attack on McEliece cryptosystem based on Reed-Muller codes.
+
+The public code is `RM(r, m) * P` for unknown permutation `P`. The attack
+recovers a permutation `Q` such that the columns of the public matrix
+permuted by `Q` span `RM(r, m)`, so the private decoder can be applied.
+
+1. Reduction (Chizhov and Borodin). The identity
+   `RM(a - b) = dual(dual(RM(a)) * RM(b))` for Schur (Hadamard) product
+   `*` is applied to the permuted codes as to the Euclidean algorithm
+   starting from `RM(m - 1)` (the even weight code) and `RM(r)`. It gives
+   the permuted code `RM(d)`, `d = gcd(r, m - 1)`.
+2. Minimum weight codewords (Minder and Shokrollahi). If `d > 1` then
+   codewords of weight `2^(m - d)` of `RM(d)` are indicators of affine
+   subspaces (flats) of codimension `d`. They are found by random
+   shortening of the code down to small dimension and enumeration.
+   For every flat `f` the parallel flats `f'` are found among codewords
+   vanishing on `f`, a flat is parallel if and only if the code restricted
+   on `f + f'` has dimension of `RM(d, m - d + 1)`. Sums `f + f'` span
+   `RM(d - 1)` and the reduction gives `RM(1)`.
+3. Permutation. The code `RM(1)` contains the all-ones word and any
+   `m` codewords independent modulo it are affine coordinates of
+   the points of columns, so every column gets its point.
+
+Schur products are sampled as products of random codewords by basis rows,
+which needs about `dim(A * B) / dim(B)` random codewords instead of all
+pairs of rows. The minimum weight search is split between processes, its
+cost grows quickly with `d`: the cases `d <= 2` take seconds for `m = 11`,
+while `d >= 3` is practical for small `m` only.
+Every stage is timed: timings are stored in the result and passed to
+the optional `report(stage, seconds)` callback as soon as a stage ends.
+"""
+
+import contextlib
+import multiprocessing
+import random
+import time
+from blincodes import sampling, subspace
+from blincodes.basis import IncrementalBasis
+from blincodes.codes import rm
+from blincodes.codes.modify import ModifiedCode
+from blincodes.codes.tools import (iter_gray_codewords, popcount,
+                                   random_combination)
+from blincodes.permutation import Permutation
+
+#: Codes are shortened down to this dimension before enumeration.
+MAX_DIMENSION = 10
+
+#: Number of shortening trials in one task of minimum weight search.
+TRIALS = 8
+
+#: Maximal number of rounds of tasks of minimum weight search.
+MAX_ROUNDS = 1 << 12
+
+#: Number of rounds of search of flats parallel to one flat.
+PARALLEL_ROUNDS = 16
+
+#: Number of consecutive useless random codewords of Schur product.
+MAX_FAILURES = 40
+
+
+class AttackResult():
+    """Result of the attack on the permuted Reed-Muller code."""
+
+    def __init__(self, param_r, param_m, permutation, timings):
+        """Create result.
+
+        :param: int param_r, param_m - parameters of RM(r, m);
+        :param: Permutation permutation - permutation of columns of
+                                          the public matrix;
+        :param: timings - list of pairs (stage, seconds).
+        """
+        self._param_r = param_r
+        self._param_m = param_m
+        self._permutation = permutation
+        self._timings = list(timings)
+
+    @property
+    def param_r(self):
+        """Return order `r` of the code."""
+        return self._param_r
+
+    @property
+    def param_m(self):
+        """Return number of variables `m` of the code."""
+        return self._param_m
+
+    @property
+    def permutation(self):
+        """Return Permutation moving the public code to RM(r, m)."""
+        return self._permutation
+
+    @property
+    def timings(self):
+        """Return list of pairs (stage, seconds)."""
+        return list(self._timings)
+
+    @property
+    def total_time(self):
+        """Return total time of stages in seconds."""
+        return sum(seconds for _, seconds in self._timings)
+
+    def __repr__(self):
+        """Return string representation of result."""
+        return '{name}(r={r}, m={m}, time={time:.3f})'.format(
+            name=self.__class__.__name__, r=self._param_r,
+            m=self._param_m, time=self.total_time)
+
+
+def dimension(param_r, param_m):
+    """Return dimension of RM(r, m)."""
+    if param_r < 0:
+        return 0
+    size = 1
+    total = 0
+    for i in range(min(param_r, param_m) + 1):
+        total += size
+        size = size * (param_m - i) // (i + 1)
+    return total
+
+
+def attack(public, param_r=None, processes=None, rng=None, report=None,
+           max_dimension=MAX_DIMENSION):
+    """Recover the structure of permuted Reed-Muller code.
+
+    :param: Matrix public - the generator matrix of code `RM(r, m) * P`;
+    :param: int param_r - order of the code, by default it is found
+                          by dimension;
+    :param: int processes - number of worker processes of minimum weight
+                            search;
+    :param: rng - random numbers generator, by default the module `random`;
+    :param: report - callable `report(stage, seconds)` or None;
+    :param: int max_dimension - dimension of shortened codes enumerated
+                                by minimum weight search.
+    :return: AttackResult - its permutation `Q` satisfies
+             `Q.permute(public)` spans RM(r, m).
+    """
+    if not rng:
+        rng = random
+    ncolumns = public.ncolumns
+    param_m = ncolumns.bit_length() - 1
+    if ncolumns < 2 or ncolumns != 1 << param_m:
+        raise ValueError(
+            'expected length of code is power of 2, but '
+            'got {}'.format(ncolumns))
+    rows = IncrementalBasis(ncolumns, public).rows
+    if param_r is None:
+        param_r = next((r for r in range(param_m + 1)
+                        if dimension(r, param_m) == len(rows)), None)
+    if param_r is None or dimension(param_r, param_m) != len(rows):
+        raise ValueError(
+            'expected dimension of RM(r, {}), but '
+            'got {}'.format(param_m, len(rows)))
+    context = _Context(ncolumns, param_m, rng, report)
+    if 0 < param_r < param_m - 1:
+        if processes and processes > 1:
+            with multiprocessing.Pool(processes) as pool:
+                context.pool = pool
+                context.workers = processes
+                permutation = _recover(rows, param_r, context, max_dimension)
+        else:
+            permutation = _recover(rows, param_r, context, max_dimension)
+        with context.stage('verification'):
+            if not subspace.is_equal(permutation.permute(public),
+                                     rm.generator(param_r, param_m)):
+                raise ValueError(
+                    'expected permuted RM({}, {}) code, but the '
+                    'structure was not recovered'.format(param_r, param_m))
+    else:
+        # RM(0, m), RM(m - 1, m) and RM(m, m) are invariant under
+        # all permutations.
+        permutation = Permutation(range(ncolumns))
+    return AttackResult(param_r, param_m, permutation, context.timings)
+
+
+class _Context():
+    """Common parameters and timings of stages of the attack."""
+
+    def __init__(self, ncolumns, param_m, rng, report):
+        """Create context."""
+        self.ncolumns = ncolumns
+        self.param_m = param_m
+        self.rng = rng
+        self.report = report
+        self.pool = None
+        self.workers = 1
+        self.timings = []
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Measure time of stage `name`."""
+        start = time.perf_counter()
+        yield
+        seconds = time.perf_counter() - start
+        self.timings.append((name, seconds))
+        if self.report:
+            self.report(name, seconds)
+
+    def map(self, function, tasks):
+        """Return list of results of tasks evaluated by the pool."""
+        if self.pool is None:
+            return list(map(function, tasks))
+        return self.pool.map(function, tasks)
+
+
+def _recover(rows, param_r, context, max_dimension):
+    """Return Permutation moving the code RM(r) * P to RM(r)."""
+    param_d, rows = _reduce(rows, param_r, context)
+    if param_d > 1:
+        with context.stage('minimum weight RM({})'.format(param_d)):
+            lower = _lower_order(rows, param_d, context, max_dimension)
+        with context.stage('RM(1)'):
+            rows = _difference(rows, param_d, lower, param_d - 1, context)
+    with context.stage('permutation'):
+        return _coordinates(rows, context.ncolumns, context.param_m)
+
+
+def _reduce(rows, param_r, context):
+    """Return gcd(r, m - 1) and basis of permuted RM(gcd(r, m - 1)).
+
+    The subtractive Euclidean algorithm, `RM(m - 1)` is represented by None.
+    """
+    param_a, rows_a = context.param_m - 1, None
+    param_b, rows_b = param_r, rows
+    while param_a % param_b:
+        with context.stage('RM({})'.format(param_a - param_b)):
+            rows_a = _difference(rows_a, param_a, rows_b, param_b, context)
+        param_a -= param_b
+        if param_a < param_b:
+            param_a, rows_a, param_b, rows_b = (
+                param_b, rows_b, param_a, rows_a)
+    return param_b, rows_b
+
+
+def _difference(rows_a, param_a, rows_b, param_b, context):
+    """Return basis of `RM(a - b) = dual(dual(RM(a)) * RM(b))`."""
+    ncolumns = context.ncolumns
+    if rows_a is None:
+        # dual(RM(m - 1)) * RM(b) = RM(0) * RM(b) = RM(b).
+        return tuple(subspace.orthogonal_rows(
+            IncrementalBasis(ncolumns, rows_b)))
+    dual_rows = subspace.orthogonal_rows(IncrementalBasis(ncolumns, rows_a))
+    product = _schur(dual_rows, rows_b, dimension(
+        context.param_m - 1 - param_a + param_b, context.param_m), context)
+    return tuple(subspace.orthogonal_rows(product))
+
+
+def _schur(rows_a, rows_b, target, context):
+    """Return IncrementalBasis of Schur product of dimension `target`.
+
+    Products `x * b` of random codeword `x` of one code by the basis rows
+    `b` of the other one span a subspace of the product code. A proper
+    subspace contains such products for at most half of codewords `x`,
+    so the number of consecutive useless codewords is bounded.
+    """
+    if len(rows_a) > len(rows_b):
+        rows_a, rows_b = rows_b, rows_a
+    rows_a = tuple(rows_a)
+    product = IncrementalBasis(context.ncolumns)
+    failures = 0
+    while product.rank < target:
+        if failures == MAX_FAILURES:
+            raise ValueError(
+                'expected Schur product of dimension {}, but '
+                'got {}'.format(target, product.rank))
+        value = random_combination(rows_a, context.rng)
+        rank = product.rank
+        for row in rows_b:
+            product.insert(value & row)
+            if product.rank == target:
+                break
+        failures = failures + 1 if product.rank == rank else 0
+    return product
+
+
+def _lower_order(rows, param_d, context, max_dimension):
+    """Return basis of permuted RM(d - 1) from basis of RM(d).
+
+    Sums of parallel flats of minimum weight are accumulated until
+    the dimension of RM(d - 1) is reached. A flat `f'` vanishing on `f`
+    is parallel to `f` if and only if the code restricted on `f + f'`
+    has dimension of `RM(d, m - d + 1)`, that is the codewords vanishing
+    on `f` restricted on `f'` span `RM(d - 1, m - d)`. Every found coset
+    is added to the zero positions of the following search.
+    """
+    param_m = context.param_m
+    weight = 1 << (param_m - param_d)
+    target = dimension(param_d - 1, param_m)
+    kernel_rank = dimension(param_d - 1, param_m - param_d)
+    ncosets = (1 << param_d) - 1
+    lower = IncrementalBasis(context.ncolumns)
+    for flat in _iter_min_weight(rows, weight, context, max_dimension,
+                                 MAX_ROUNDS):
+        zero_mask = flat
+        for _ in range(ncosets):
+            other = next(_iter_min_weight(rows, weight, context,
+                                          max_dimension, PARALLEL_ROUNDS,
+                                          flat, zero_mask, kernel_rank), 0)
+            if not other:
+                break
+            lower.insert(flat ^ other)
+            zero_mask |= other
+            if lower.rank == target:
+                break
+        if lower.rank == target:
+            return lower.rows
+    raise ValueError(
+        'expected codewords of weight {} in RM({}, {}), but '
+        'they are not found'.format(weight, param_d, param_m))
+
+
+def _restricted_rank(rows, mask, max_rank=None):
+    """Return dimension of code restricted on ones of `mask`."""
+    restricted = IncrementalBasis(mask.bit_length())
+    restricted.extend((row & mask for row in rows), max_rank)
+    return restricted.rank
+
+
+def _iter_min_weight(rows, weight, context, max_dimension, max_rounds,
+                     flat=0, zero_mask=0, kernel_rank=None):
+    """Iterate over distinct codewords of weight `weight`.
+
+    Only codewords with zeroes on ones of `zero_mask` are searched, if
+    `kernel_rank` is given then only flats parallel to `flat` are kept.
+    Every round runs one task of `TRIALS` random shortenings per worker.
+    """
+    seed = context.rng.getrandbits(64)
+    seen = set()
+    index = 0
+    for _ in range(max_rounds):
+        tasks = [(rows, context.ncolumns, weight, flat, zero_mask,
+                  kernel_rank, max_dimension, seed, index + i)
+                 for i in range(context.workers)]
+        index += len(tasks)
+        for words in context.map(_search_task, tasks):
+            for word in words:
+                if word not in seen:
+                    seen.add(word)
+                    yield word
+
+
+def _search_task(args):
+    """Return codewords of given weight found by random shortening."""
+    (rows, ncolumns, weight, flat, zero_mask, kernel_rank, max_dimension,
+     seed, index) = args
+    rng = sampling.stream(seed, index)
+    code = ModifiedCode(IncrementalBasis(ncolumns, rows))
+    code.truncate(_support(flat, ncolumns))
+    kernel = tuple(row.value for row in code.generator())
+    code.truncate(_support(zero_mask ^ flat, ncolumns))
+    positions = _support(((1 << ncolumns) - 1) ^ zero_mask, ncolumns)
+    found = set()
+    for _ in range(TRIALS):
+        shortened = code.copy()
+        rng.shuffle(positions)
+        for column in positions:
+            if shortened.dimension <= max_dimension:
+                break
+            shortened.truncate(column)
+        generator = tuple(row.value for row in shortened.generator())
+        found.update(word for word in iter_gray_codewords(generator)
+                     if popcount(word) == weight)
+    if kernel_rank is None:
+        return found
+    return [word for word in found
+            if _restricted_rank(kernel, word, kernel_rank + 1) ==
+            kernel_rank]
+
+
+def _support(mask, ncolumns):
+    """Return list of columns with ones of `mask`."""
+    return [column for column in range(ncolumns)
+            if mask >> (ncolumns - column - 1) & 1]
+
+
+def _coordinates(rows, ncolumns, param_m):
+    """Return Permutation moving permuted RM(1, m) to RM(1, m).
+
+    The coordinate `x_p` of the column `t` of RM(1, m) is the bit
+    `m - p - 1` of `t`.
+    """
+    ones = (1 << ncolumns) - 1
+    independent = IncrementalBasis(ncolumns, [ones])
+    coordinates = [row for row in rows if independent.insert(row)]
+    if len(coordinates) != param_m:
+        raise ValueError(
+            'expected RM(1, {}) code, but got code of '
+            'dimension {}'.format(param_m, len(rows)))
+    points = [0] * ncolumns
+    for row in coordinates:
+        points = [(point << 1) | (row >> (ncolumns - column - 1) & 1)
+                  for column, point in enumerate(points)]
+    permutation = [0] * ncolumns
+    for column, point in enumerate(points):
+        permutation[point] = column
+    return Permutation(permutation)
@@ -0,0 +1,197 @@
+"""Syndrome decoding of binary linear codes by table of coset leaders.
+
+Coset leaders are stored in a flat array indexed by the syndrome (as
+integer with the first row of parity check matrix in the most significant
+bit). Error patterns are enumerated in increasing weight, so every leader
+is a vector of minimal weight in its coset, the first in lexicographic
+order of positions. The table has `2^(n - k)` items of the smallest
+machine type holding `n` bits, or of `ceil(n / 8)` bytes for `n > 64`, it
+is suitable for codes with `n - k` up to about 28.
+"""
+
+import multiprocessing
+from array import array
+from itertools import combinations
+from blincodes import vector
+
+
+class SyndromeDecoder():
+    """Decoder by table of coset leaders."""
+
+    def __init__(self, parity_check, processes=None):
+        """Build table of coset leaders.
+
+        :param: Matrix parity_check - the parity check matrix of code,
+                                      for example the output of
+                                      `tools.make_parity_check`;
+        :param: int processes - number of worker processes, if it is
+                                greater than 1 then error patterns of
+                                every weight are split between workers.
+        """
+        self._ncolumns = parity_check.ncolumns
+        self._redundancy = parity_check.nrows
+        columns = tuple(row.value for row in parity_check.transpose())
+        self._leaders = _leaders_table(1 << self._redundancy,
+                                       self._ncolumns)
+        self._byte_tables = _byte_tables(columns)
+        self._max_weight = 0
+        cosets = 1 << parity_check.rank
+        filled = 1
+        weight = 0
+        pool = None
+        if processes and processes > 1:
+            pool = multiprocessing.Pool(processes)
+        try:
+            while filled < cosets and weight < self._ncolumns:
+                weight += 1
+                for syndrome, leader in _iter_leaders(columns, weight,
+                                                      pool):
+                    if syndrome and not self._leaders[syndrome]:
+                        self._leaders[syndrome] = leader
+                        filled += 1
+                        if filled == cosets:
+                            break
+                self._max_weight = weight
+        finally:
+            if pool:
+                # Workers may still enumerate patterns of the last weight
+                # which are not needed when the table is full.
+                pool.terminate()
+                pool.join()
+        self._cosets = filled
+
+    @property
+    def n(self):
+        """Return length of code."""
+        return self._ncolumns
+
+    @property
+    def redundancy(self):
+        """Return number of rows of parity check matrix."""
+        return self._redundancy
+
+    @property
+    def cosets(self):
+        """Return number of cosets (found leaders)."""
+        return self._cosets
+
+    @property
+    def covering_radius(self):
+        """Return the maximal weight of coset leaders."""
+        return self._max_weight
+
+    def syndrome(self, word):
+        """Return syndrome of `word` as integer."""
+        value = int(word)
+        syndrome = 0
+        for table in self._byte_tables:
+            if not value:
+                break
+            syndrome ^= table[value & 255]
+            value >>= 8
+        return syndrome
+
+    def leader(self, syndrome):
+        """Return coset leader of syndrome as Vector."""
+        return vector.Vector(self._leaders[int(syndrome)], self._ncolumns)
+
+    def decode(self, words):
+        """Decode batch of words.
+
+        :param: words - iterable of Vectors or integers of length `n`.
+        :return: list of Vectors - codewords nearest to words.
+        """
+        leaders = self._leaders
+        return [vector.Vector(int(word) ^ leaders[self.syndrome(word)],
+                              self._ncolumns)
+                for word in words]
+
+
+def _leaders_table(size, ncolumns):
+    """Return zero table of `size` leaders of length `ncolumns`."""
+    for typecode in 'BHILQ':
+        if 8 * array(typecode).itemsize >= ncolumns:
+            return array(typecode, bytes(size * array(typecode).itemsize))
+    return _Records(size, -(-ncolumns // 8))
+
+
+class _Records():
+    """Table of integers stored as records of fixed number of bytes."""
+
+    def __init__(self, size, width):
+        """Create zero table of `size` records of `width` bytes."""
+        self._width = width
+        self._data = bytearray(size * width)
+
+    def __len__(self):
+        """Return number of records."""
+        return len(self._data) // self._width
+
+    def __getitem__(self, index):
+        """Return record `index` as integer."""
+        start = index * self._width
+        return int.from_bytes(self._data[start:start + self._width], 'big')
+
+    def __setitem__(self, index, value):
+        """Write integer into record `index`."""
+        start = index * self._width
+        self._data[start:start + self._width] = value.to_bytes(self._width,
+                                                               'big')
+
+
+def _byte_tables(columns):
+    """Return tables of syndromes of bytes of words.
+
+    Table `k` holds syndromes of all 256 values of bits `8k..8k+7`
+    (counting from the least significant bit).
+    """
+    length = len(columns)
+    tables = []
+    for start in range(0, length, 8):
+        table = [0] * 256
+        for bit in range(min(8, length - start)):
+            step = 1 << bit
+            column = columns[length - start - bit - 1]
+            for byte in range(step):
+                table[byte | step] = table[byte] ^ column
+        tables.append(table)
+    return tables
+
+
+def _iter_leaders(columns, weight, pool):
+    """Iterate over (syndrome, pattern) of patterns of weight `weight`.
+
+    Patterns come in lexicographic order of positions. If `pool` is not
+    None then every worker takes patterns with a fixed first position and
+    the results are merged in order of first positions.
+    """
+    if pool is None:
+        for first in range(len(columns)):
+            yield from _patterns((columns, weight, first))
+        return
+    tasks = ((columns, weight, first) for first in range(len(columns)))
+    for pairs in pool.imap(_first_patterns, tasks):
+        yield from pairs
+
+
+def _patterns(args):
+    """Iterate over patterns of weight `weight` with first one `first`."""
+    columns, weight, first = args
+    length = len(columns)
+    head = 1 << (length - first - 1)
+    for rest in combinations(range(first + 1, length), weight - 1):
+        syndrome = columns[first]
+        pattern = head
+        for position in rest:
+            syndrome ^= columns[position]
+            pattern |= 1 << (length - position - 1)
+        yield syndrome, pattern
+
+
+def _first_patterns(args):
+    """Return the first pattern of every syndrome found by worker."""
+    found = {}
+    for syndrome, pattern in _patterns(args):
+        if syndrome not in found:
+            found[syndrome] = pattern
+    return list(found.items())
@@ -0,0 +1,134 @@
+"""Systematic encoding of binary linear codes.
+
+Unlike `Matrix.gaussian_elimination` the systematic form keeps the pivot
+positions (information set), so messages can be placed into and read
+from fixed positions of codewords.
+"""
+
+from blincodes import matrix, vector
+
+
+def systematic_form(generator, columns=None):
+    """Evaluate the systematic form of generator matrix.
+
+    :param: Matrix generator - the generator matrix of code;
+    :param: columns - preferred positions of information set: pivots are
+                      searched in these columns first (in the given order)
+                      and then in the other columns from left to right.
+    :return: tuple (systematic, information_set, permutation):
+             Matrix systematic - the generator matrix with the identity
+                 matrix in columns `information_set`, the i-th row has one
+                 in column `information_set[i]`;
+             list information_set - pivot positions;
+             list permutation - information set followed by the other
+                 positions, so `systematic.submatrix(permutation)` is
+                 `[I | A]` and equals `systematic * permutation(perm)`.
+    """
+    ncolumns = generator.ncolumns
+    rows = [row.value for row in generator if row.value]
+    information_set = []
+    rank = 0
+    for column in _column_order(columns, ncolumns):
+        if rank == len(rows):
+            break
+        bit = 1 << (ncolumns - column - 1)
+        for i in range(rank, len(rows)):
+            if rows[i] & bit:
+                break
+        else:
+            continue
+        rows[rank], rows[i] = rows[i], rows[rank]
+        pivot_row = rows[rank]
+        for j, row in enumerate(rows):
+            if j != rank and row & bit:
+                rows[j] = row ^ pivot_row
+        information_set.append(column)
+        rank += 1
+    chosen = set(information_set)
+    permutation = information_set + [i for i in range(ncolumns)
+                                     if i not in chosen]
+    return (matrix.Matrix(rows[:rank], ncolumns),
+            information_set,
+            permutation)
+
+
+class SystematicEncoder():
+    """Encoder placing message bits on fixed positions of codeword."""
+
+    def __init__(self, generator, columns=None):
+        """Create encoder for code with generator matrix `generator`.
+
+        :param: Matrix generator - the generator matrix of code;
+        :param: columns - preferred positions of information set.
+        """
+        systematic, self._information_set, self._permutation = (
+            systematic_form(generator, columns))
+        self._ncolumns = generator.ncolumns
+        self._rows = tuple(row.value for row in systematic)
+        self._bits = tuple(self._ncolumns - column - 1
+                           for column in self._information_set)
+
+    @property
+    def n(self):
+        """Return length of code."""
+        return self._ncolumns
+
+    @property
+    def k(self):
+        """Return dimension of code."""
+        return len(self._rows)
+
+    @property
+    def generator(self):
+        """Return systematic generator matrix."""
+        return matrix.Matrix(self._rows, self._ncolumns)
+
+    @property
+    def information_set(self):
+        """Return list of positions of message bits."""
+        return list(self._information_set)
+
+    @property
+    def permutation(self):
+        """Return permutation moving information set to the beginning."""
+        return list(self._permutation)
+
+    def encode(self, message):
+        """Return codeword with `message` on positions of information set.
+
+        :param: message - Vector or integer of length `k`.
+        """
+        value = int(message)
+        word = 0
+        for row in reversed(self._rows):
+            if value & 1:
+                word ^= row
+            value >>= 1
+        return vector.Vector(word, self._ncolumns)
+
+    def recover(self, word):
+        """Return message of codeword `word` as Vector of length `k`.
+
+        The message is read from the information set in O(k) operations,
+        `word` is not checked to be a codeword.
+        """
+        value = int(word)
+        message = 0
+        for bit in self._bits:
+            message = (message << 1) | ((value >> bit) & 1)
+        return vector.Vector(message, len(self._bits))
+
+
+def _column_order(columns, ncolumns):
+    """Iterate over preferred columns and then over the others."""
+    if not columns:
+        yield from range(ncolumns)
+        return
+    seen = set()
+    for column in columns:
+        if column not in seen:
+            seen.add(column)
+            yield column
+    for column in range(ncolumns):
+        if column not in seen:
+            yield column
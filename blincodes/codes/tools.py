@@ -1,12 +1,25 @@
 """Various tools to working with binary linear codes."""
 
-from blincodes import matrix, vector
+import math
+import multiprocessing
+import random
+from blincodes import matrix, subspace
+from blincodes.basis import IncrementalBasis
+from blincodes.codes import modify
+
+
+if hasattr(int, 'bit_count'):
+    popcount = int.bit_count
+else:
+    def popcount(value):
+        """Return number of ones of integer."""
+        return bin(value).count('1')
 
 
 def make_generator(mat):
     """Return the generator matrix from general matrix `mat`."""
     return matrix.Matrix(
-        (row.value for row in mat.diagonal_form if row.value),
+        IncrementalBasis(mat.ncolumns, mat).rows,
         mat.ncolumns)
 
 
@@ -15,40 +28,138 @@ def make_parity_check(mat):
     return mat.orthogonal
 
 
-def hadamard_product(generator_a, generator_b):
+def hadamard_product(generator_a, generator_b, processes=None):
     """Evaluate the generator matrix of Hadamard product code.
 
+    Products of rows are reduced into a common basis which stops
+    as soon as the product code becomes the whole space. If both
+    generators span the same code (Schur square) only the products
+    `a_i * a_j` with `i <= j` are evaluated.
+
     :param: Matrix generator_a -  the generator matrix of the first code;
-    :param: Matrix generator_b -  the generator matrix of the second code.
+    :param: Matrix generator_b -  the generator matrix of the second code;
+    :param: int processes - number of worker processes, if it is greater
+                            than 1 then the products are split between
+                            workers and their partial bases are merged.
     :return: Matrix generator - the generator matrix of Hadamard product of
                                 the first and the second codes.
     """
-    hadamard_dict = {}  # {index of the fist 1 in the row: row}
-    hadamard = []
-    for row_a in generator_a:
-        for row_b in generator_b:
-            row = row_a * row_b
-            test_row = row.copy()
-            for i, row_h in hadamard_dict.items():
-                if test_row[i]:
-                    test_row += row_h
-            if test_row.value:
-                hadamard_dict[test_row.support[0]] = test_row
-                hadamard.append(row)
-    return matrix.from_vectors(hadamard)
+    ncolumns = max(generator_a.ncolumns, generator_b.ncolumns)
+    rows_a = IncrementalBasis(ncolumns, generator_a).rows
+    rows_b = IncrementalBasis(ncolumns, generator_b).rows
+    if rows_a == rows_b:
+        rows_b = None
+    hadamard_basis = IncrementalBasis(ncolumns)
+    if not processes or processes <= 1:
+        hadamard_basis.extend(_iter_products(rows_a, rows_b, 0, 1))
+        return matrix.Matrix(hadamard_basis.rows, ncolumns)
+    nchunks = min(len(rows_a), 4 * processes)
+    tasks = ((rows_a, rows_b, ncolumns, start, nchunks)
+             for start in range(nchunks))
+    with multiprocessing.Pool(processes) as pool:
+        for rows in pool.imap_unordered(_hadamard_chunk, tasks):
+            hadamard_basis.extend(rows)
+            if hadamard_basis.is_full:
+                break
+    return matrix.Matrix(hadamard_basis.rows, ncolumns)
+
+
+def hadamard_dimension(generator_a, generator_b, error_probability=1e-9,
+                       max_rank=None, rng=None):
+    """Estimate the dimension of Hadamard product code.
+
+    Products `x * y` of random codewords of the codes are accumulated
+    until the rank reaches `max_rank` or stops growing. Every product
+    escapes a proper subspace of the product code with probability at
+    least 1/4, so the number of consecutive useless samples is chosen
+    to keep the probability of underestimating below `error_probability`.
+
+    :param: Matrix generator_a -  the generator matrix of the first code;
+    :param: Matrix generator_b -  the generator matrix of the second code;
+    :param: float error_probability - upper bound of the probability
+                                      that the result is less than
+                                      the true dimension;
+    :param: int max_rank - stop when the rank reaches this value, it may
+                           be used to test that the dimension is less
+                           than a bound, by default it is `ncolumns`;
+    :param: rng - random numbers generator with `getrandbits` method,
+                  by default it is the module `random`.
+    :return: int - dimension of Hadamard product code.
+    """
+    if not 0 < error_probability < 1:
+        raise ValueError(
+            'expected `error_probability` is in (0, 1), but '
+            'got {}'.format(error_probability))
+    if not rng:
+        rng = random
+    ncolumns = max(generator_a.ncolumns, generator_b.ncolumns)
+    if max_rank is None:
+        max_rank = ncolumns
+    max_rank = min(max_rank, ncolumns)
+    rows_a = tuple(row.value for row in generator_a if row.value)
+    rows_b = tuple(row.value for row in generator_b if row.value)
+    if not rows_a or not rows_b:
+        return 0
+    attempts = math.ceil(math.log(error_probability / max(ncolumns, 1)) /
+                         math.log(0.75))
+    hadamard_basis = IncrementalBasis(ncolumns)
+    failures = 0
+    while failures < attempts and hadamard_basis.rank < max_rank:
+        if hadamard_basis.insert(random_combination(rows_a, rng) &
+                                 random_combination(rows_b, rng)):
+            failures = 0
+        else:
+            failures += 1
+    return hadamard_basis.rank
+
+
+def random_combination(rows, rng):
+    """Return random linear combination of `rows`."""
+    mask = rng.getrandbits(len(rows))
+    value = 0
+    for row in rows:
+        if mask & 1:
+            value ^= row
+        mask >>= 1
+    return value
+
+
+def _iter_products(rows_a, rows_b, start, step):
+    """Iterate over products of rows `rows_a[start::step]` and `rows_b`.
+
+    If `rows_b` is None then products of `rows_a` by itself
+    are evaluated without symmetric duplicates.
+    """
+    for i in range(start, len(rows_a), step):
+        row_a = rows_a[i]
+        for row_b in (rows_a[i:] if rows_b is None else rows_b):
+            yield row_a & row_b
+
+
+def _hadamard_chunk(args):
+    """Return partial basis of products evaluated by worker."""
+    rows_a, rows_b, ncolumns, start, step = args
+    return IncrementalBasis(
+        ncolumns, _iter_products(rows_a, rows_b, start, step)).rows
 
 
 def intersection(generator_a, generator_b):
-    """Return generator matrix of intersection of two codes."""
-    return make_parity_check(matrix.concatenate(
-        make_parity_check(generator_a),
-        make_parity_check(generator_b), by_rows=True))
+    """Return generator matrix of intersection of two codes.
+
+    The trivial intersection is given by the zero matrix `1 x n`.
+    """
+    return _nonempty(subspace.intersection(generator_a, generator_b),
+                     max(generator_a.ncolumns, generator_b.ncolumns))
 
 
 def union(generator_a, generator_b):
     """Return generator matrix of union of two codes."""
-    return make_generator(matrix.concatenate(
-        generator_a, generator_b, by_rows=True))
+    return subspace.union(generator_a, generator_b)
+
+
+def is_subcode(generator_a, generator_b):
+    """Return True if the first code is subcode of the second code."""
+    return subspace.is_subspace(generator_a, generator_b)
 
 
 def puncture(generator, columns=None, remove_zeroes=False):
@@ -59,21 +170,8 @@ def puncture(generator, columns=None, remove_zeroes=False):
 
     Punctured code is NOT subcode of original code!
     """
-    if not columns:
-        columns = []
-    mask = vector.from_support_supplement(generator.ncolumns, columns)
-    puncture_matrix = matrix.Matrix(
-        ((row * mask).value for row in generator),
-        generator.ncolumns).diagonal_form
-    if remove_zeroes:
-        return matrix.Matrix(
-            (row.value for row in puncture_matrix if row.value),
-            generator.ncolumns).submatrix(
-                columns=(i for i in range(generator.ncolumns)
-                         if i not in columns))
-    return matrix.Matrix(
-        (row.value for row in puncture_matrix if row.value),
-        generator.ncolumns)
+    return modify.ModifiedCode(generator).puncture(columns).generator(
+        remove_zeroes=remove_zeroes)
 
 
 def truncate(generator, columns=None, remove_zeroes=False):
@@ -87,31 +185,27 @@ def truncate(generator, columns=None, remove_zeroes=False):
     NOTE! If remove_zeroes is set to True the truncated codes would not be
     a subcode of the original code.
     """
-    if not columns:
-        columns = []
-    mask = vector.from_support(generator.ncolumns, columns)
-    trunc = matrix.Matrix(
-        (row.value for row in generator.gaussian_elimination(columns)
-         if not (row * mask).value),
-        generator.ncolumns).echelon_form
-    trunc = matrix.Matrix((row.value for row in trunc if row.value),
-                          generator.ncolumns)
-    if remove_zeroes:
-        return trunc.submatrix(
-            columns=(i for i in range(generator.ncolumns)
-                     if i not in columns))
-    return trunc
+    return modify.ModifiedCode(generator).truncate(columns).generator(
+        remove_zeroes=remove_zeroes)
 
 
 def hull(generator):
     """Evaluate the generator matrix of the code's hull.
 
-    The code's hull is intersection of code and it's dual.
+    The code's hull is intersection of code and it's dual. The trivial
+    hull is given by the zero matrix `1 x n`.
     """
-    return make_parity_check(
-        matrix.concatenate(generator,
-                           make_parity_check(generator),
-                           by_rows=True))
+    return _nonempty(subspace.hull(generator), generator.ncolumns)
+
+
+def _nonempty(generator, ncolumns):
+    """Return generator matrix or zero matrix `1 x ncolumns` if it is empty.
+
+    It keeps the length of zero code as `Matrix.orthogonal` does.
+    """
+    if generator.nrows:
+        return generator
+    return matrix.Matrix([0], ncolumns)
 
 
 def iter_codewords(generator):
@@ -120,12 +214,162 @@ def iter_codewords(generator):
         yield (matrix.Matrix([i], generator.nrows) * generator)[0]
 
 
-def spectrum(generator):
-    """Return the spectrum of code."""
-    spec = {i: 0 for i in range(generator.ncolumns + 1)}
-    for vec in iter_codewords(generator):
-        spec[vec.hamming_weight] += 1
-    return spec
+def iter_gray_codewords(rows):
+    """Iterate over nonzero codewords in Gray code order.
+
+    Every next codeword differs from the previous one by one of `rows`,
+    rows are integers.
+    """
+    word = 0
+    for i in range(1, 1 << len(rows)):
+        word ^= rows[(i & -i).bit_length() - 1]
+        yield word
+
+
+def spectrum(generator, length=None):
+    """Return the spectrum of code.
+
+    Codewords are enumerated in Gray code order, so every next codeword
+    differs from the previous one by one row of generator matrix.
+
+    :param: Matrix generator - the generator matrix of code;
+    :param: int length - the length of code, by default the number of
+                         columns of generator matrix; it is required for
+                         zero code, its generator matrix has no columns.
+    """
+    if length is None:
+        length = generator.ncolumns
+    spec = [0] * (length + 1)
+    spec[0] = 1
+    for word in iter_gray_codewords(tuple(row.value for row in generator)):
+        spec[popcount(word)] += 1
+    return dict(enumerate(spec))
+
+
+def macwilliams(spec, dimension, length=None):
+    """Return the spectrum of dual code by MacWilliams identity.
+
+    :param: dict spec - the spectrum of code {weight: count};
+    :param: int dimension - the dimension of code;
+    :param: int length - the length of code, by default the maximal
+                         weight of `spec`.
+    :return: dict - the spectrum of dual code.
+    """
+    if length is None:
+        length = max(spec)
+    dual_spec = [0] * (length + 1)
+    for i, count in spec.items():
+        if not count:
+            continue
+        # Krawtchouk polynomials K_j(i) by three-term recurrence.
+        previous, current = 1, length - 2 * i
+        dual_spec[0] += count
+        for j in range(1, length + 1):
+            dual_spec[j] += count * current
+            previous, current = current, (
+                (length - 2 * i) * current - (length - j + 1) * previous
+            ) // (j + 1)
+    return {j: total >> dimension for j, total in enumerate(dual_spec)}
+
+
+def coset_weight_distribution(parity_check, processes=None):
+    """Return the weight distribution of coset leaders.
+
+    Syndromes are visited by breadth-first search: the level `w` is the
+    set of syndromes of cosets with leaders of weight `w`. Levels are
+    stored as bitsets (integers of `2^(n-k)` bits) and the level `w + 1`
+    is the union of translations of the level `w` by columns of parity
+    check matrix without visited syndromes. Translation by a column is
+    evaluated by swaps of blocks of bitset, one for every one of column.
+
+    :param: Matrix parity_check - the parity check matrix of code;
+    :param: int processes - number of worker processes, if it is greater
+                            than 1 then columns are split between workers.
+    :return: dict {weight: number of cosets with leaders of this weight}.
+    """
+    ncolumns = parity_check.ncolumns
+    # Rows reduction keeps weights of leaders and makes pivot columns
+    # unit vectors, so translations by them are single swaps.
+    rows = IncrementalBasis(ncolumns, parity_check).rows
+    size = len(rows)
+    columns = sorted(set(
+        row.value for row in matrix.Matrix(rows, ncolumns).transpose()
+        if row.value), key=lambda column: bin(column).count('1'))
+    full = (1 << (1 << size)) - 1
+    visited = frontier = 1
+    distribution = {0: 1}
+    weight = 0
+    pool = None
+    if processes and processes > 1 and len(columns) > 1:
+        pool = multiprocessing.Pool(processes)
+    try:
+        while visited != full:
+            if pool:
+                tasks = ((frontier, columns[start::processes], size)
+                         for start in range(processes))
+                level = 0
+                for translated in pool.imap_unordered(_translate_level,
+                                                      tasks):
+                    level |= translated
+            else:
+                level = _translate_level((frontier, columns, size))
+            level &= ~visited
+            if not level:
+                break
+            weight += 1
+            distribution[weight] = bin(level).count('1')
+            visited |= level
+            frontier = level
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    return distribution
+
+
+def covering_radius(parity_check, processes=None):
+    """Return the covering radius of code.
+
+    The covering radius is the maximal weight of coset leaders,
+    see `coset_weight_distribution`.
+    """
+    return max(coset_weight_distribution(parity_check, processes))
+
+
+def _translate_level(args):
+    """Return union of translations of bitset `level` by `columns`."""
+    level, columns, size = args
+    masks = _block_masks(size)
+    result = 0
+    for column in columns:
+        translated = level
+        for bit in range(size):
+            if column >> bit & 1:
+                shift = 1 << bit
+                translated = (((translated & masks[bit]) << shift) |
+                              ((translated >> shift) & masks[bit]))
+        result |= translated
+    return result
+
+
+def _block_masks(size):
+    """Return masks of positions `s < 2^size` with zero bit `j` of `s`."""
+    nbits = 1 << size
+    if nbits < 8:
+        return [sum(1 << s for s in range(nbits) if not s >> j & 1)
+                for j in range(size)]
+    nbytes = nbits >> 3
+    patterns = [b'\x55', b'\x33', b'\x0f']
+    masks = []
+    for j in range(size):
+        if j < 3:
+            pattern = patterns[j]
+        else:
+            half = 1 << (j - 3)
+            pattern = b'\xff' * half + b'\x00' * half
+        masks.append(int.from_bytes(pattern * (nbytes // len(pattern)),
+                                    'little'))
+    return masks
 
 
 def encode(generator, vec):
@@ -3,6 +3,7 @@
 from random import randint, sample
 import math
 from blincodes import vector
+from blincodes.basis import IncrementalBasis
 
 
 class Matrix():
@@ -200,6 +201,28 @@ class Matrix():
         """Return representation of matrix as LaTeX string."""
         return '\\\\\n'.join(tuple(row.to_latex_str() for row in self))
 
+    def to_bytes(self, bit_order='big'):
+        """Return packed rows as bytes.
+
+        Every row takes `ceil(ncolumns / 8)` bytes, see `Vector.to_bytes`.
+        """
+        return b''.join(row.to_bytes(bit_order) for row in self._matrix)
+
+    def to_numpy(self):
+        """Return `numpy` array `nrows x ncolumns` with dtype uint8."""
+        import numpy
+        packed = numpy.frombuffer(self.to_bytes(), dtype=numpy.uint8)
+        return numpy.unpackbits(
+            packed.reshape(self.nrows, -(-self.ncolumns // 8)),
+            axis=1, count=self.ncolumns)
+
+    def __reduce__(self):
+        """Return compact state for `pickle`: packed rows.
+
+        Rows are pickled as one bytes object instead of tuple of Vectors.
+        """
+        return from_bytes, (self.to_bytes(), self._ncolumns, self.nrows)
+
     def copy(self):
         """Make copy of the matrix."""
         return Matrix(
@@ -252,9 +275,10 @@ class Matrix():
 
     def is_max_rank(self):
         """Return True if matrix has maximal rank."""
-        if self.rank == min(self.nrows, self.ncolumns):
-            return True
-        return False
+        max_rank = min(self.nrows, self.ncolumns)
+        row_basis = IncrementalBasis(self.ncolumns)
+        row_basis.extend((row.value for row in self), max_rank=max_rank)
+        return row_basis.rank == max_rank
 
     def is_identity(self):
         """Return True if matrix is identity matrix."""
@@ -583,6 +607,55 @@ def from_iterable(value, zerofillers=None, onefillers=None):
         max(len(row) for row in matrix_rows))
 
 
+def from_bytes(data, ncolumns, nrows=None, bit_order='big', stride=None):
+    """Make Matrix object from packed rows.
+
+    :param: data - bytes or any object supporting the buffer protocol,
+                   for example bytearray, memoryview or `numpy` array;
+    :param: int ncolumns - number of columns;
+    :param: int nrows - number of rows, by default all rows of data;
+    :param: str bit_order - 'big' or 'little', see `Vector.to_bytes`;
+    :param: int stride - number of bytes of row, by default it is
+                         `ceil(ncolumns / 8)`.
+    """
+    view = memoryview(data).cast('B')
+    if stride is None:
+        stride = -(-ncolumns // 8)
+    if stride < -(-ncolumns // 8):
+        raise ValueError(
+            'expected `stride` is not less than {}, but '
+            'got {}'.format(-(-ncolumns // 8), stride))
+    if not stride:
+        return Matrix()
+    if nrows is None:
+        nrows = len(view) // stride
+    if len(view) < nrows * stride:
+        raise ValueError(
+            'expected {} bytes, but got {}'.format(nrows * stride, len(view)))
+    return Matrix(
+        (vector.from_bytes(view[start:start + stride], ncolumns,
+                           bit_order).value
+         for start in range(0, nrows * stride, stride)),
+        ncolumns)
+
+
+def from_numpy(array):
+    """Make Matrix object from two-dimensional `numpy` array.
+
+    Nonzero elements are ones, rows are packed by `numpy.packbits`.
+    """
+    import numpy
+    array = numpy.asarray(array)
+    if array.ndim != 2:
+        raise ValueError(
+            'expected two-dimensional array, but got array of '
+            'dimension {}'.format(array.ndim))
+    if array.dtype not in (numpy.bool_, numpy.uint8):
+        array = array != 0
+    nrows, ncolumns = array.shape
+    return from_bytes(numpy.packbits(array, axis=1), ncolumns, nrows)
+
+
 def zero(nrows, ncolumns=None):
     """Return (nrows x ncolumns)-matrix of zeroes."""
     if not ncolumns:
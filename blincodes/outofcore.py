@@ -0,0 +1,221 @@
+"""Gaussian elimination of matrices stored on disk.
+
+Matrices are files of the binary format (see `binary`), rows are read and
+written through memory mapping in panels of consecutive rows, so only
+about `memory_limit` bytes of rows are kept in memory at once.
+
+The elimination has the semantics of `Matrix.echelon_form` and
+`Matrix.gaussian_elimination`: rows are processed in their order, the row
+gets its pivot after it is reduced by pivots of all previous rows.
+
+1. Forward pass. Every panel is reduced by the previous rows read in
+   chunks of the same size and then by its own rows. Every row is
+   reduced by the previous pivot rows in their order, so the result is
+   the same as reduction of the whole matrix in memory. The pivot of
+   every row is kept in memory as its bit number.
+2. Backward pass (Gauss-Jordan elimination only). Every panel is
+   reduced by the following rows in their order.
+3. Rows with pivots are written ordered by pivot columns, rows without
+   them follow in their order.
+"""
+
+import os
+import tempfile
+from array import array
+from blincodes import binary, vector
+
+#: Default limit of memory for rows in bytes.
+MEMORY_LIMIT = 1 << 28
+
+#: Estimation of memory of integer object without its bits in bytes.
+ROW_OVERHEAD = 32
+
+
+class EliminationResult():
+    """Result of elimination of matrix stored on disk."""
+
+    def __init__(self, path, rank, pivots):
+        """Create result.
+
+        :param: path - path to file of the reduced matrix;
+        :param: int rank - rank of the matrix;
+        :param: pivots - sorted list of pivot columns.
+        """
+        self._path = path
+        self._rank = rank
+        self._pivots = list(pivots)
+
+    @property
+    def path(self):
+        """Return path to file of the reduced matrix."""
+        return self._path
+
+    @property
+    def rank(self):
+        """Return rank of the matrix."""
+        return self._rank
+
+    @property
+    def pivots(self):
+        """Return sorted list of pivot columns."""
+        return list(self._pivots)
+
+    def open(self):
+        """Return MappedMatrix of the reduced matrix."""
+        return binary.MappedMatrix(self._path)
+
+    def load(self):
+        """Return the reduced matrix as Matrix."""
+        return binary.load(self._path)
+
+    def __repr__(self):
+        """Return string representation of result."""
+        return '{name}(path={path!r}, rank={rank})'.format(
+            name=self.__class__.__name__, path=self._path, rank=self._rank)
+
+
+def echelon_form(source, target, memory_limit=MEMORY_LIMIT):
+    """Evaluate the echelon form of matrix stored on disk.
+
+    :param: source - path to file of matrix in the binary format;
+    :param: target - path to file of the result, it may be `source`;
+    :param: int memory_limit - limit of memory for rows in bytes.
+    :return: EliminationResult, its matrix equals `Matrix.echelon_form`.
+    """
+    return _eliminate(source, target, None, True, False, memory_limit)
+
+
+def gaussian_elimination(source, target, columns=None, sort=True,
+                         memory_limit=MEMORY_LIMIT):
+    """Evaluate the Gaussian elimination on columns of matrix on disk.
+
+    :param: source - path to file of matrix in the binary format;
+    :param: target - path to file of the result, it may be `source`;
+    :param: `iterable` columns - list or any iterable of columns;
+    :param: bool sort - if True then rows are sorted as in
+                        `Matrix.gaussian_elimination`;
+    :param: int memory_limit - limit of memory for rows in bytes.
+    :return: EliminationResult, its matrix equals
+             `Matrix.gaussian_elimination(columns, sort)`.
+    """
+    return _eliminate(source, target, columns, sort, True, memory_limit)
+
+
+def rank(source, memory_limit=MEMORY_LIMIT):
+    """Return rank of matrix stored on disk."""
+    directory = os.path.dirname(os.path.abspath(source))
+    descriptor, target = tempfile.mkstemp(suffix='.echelon', dir=directory)
+    os.close(descriptor)
+    try:
+        return echelon_form(source, target, memory_limit).rank
+    finally:
+        os.remove(target)
+
+
+def _eliminate(source, target, columns, sort, backward, memory_limit):
+    """Evaluate elimination and write the result into `target`."""
+    with binary.MappedMatrix(source) as mapped:
+        nrows, ncolumns = mapped.shapes
+        bit_order = mapped.bit_order
+        panel = _panel_size(mapped.stride, memory_limit)
+        directory = os.path.dirname(os.path.abspath(target))
+        descriptor, work_path = tempfile.mkstemp(suffix='.work',
+                                                 dir=directory)
+        os.close(descriptor)
+        work = binary.create(work_path, nrows, ncolumns, bit_order)
+        for start in range(0, nrows, panel):
+            work.set_rows(start, mapped.rows(start, start + panel))
+    try:
+        mask = (1 << ncolumns) - 1
+        if columns:
+            columns = set(columns)
+            mask = vector.from_support(ncolumns, support=[
+                column for column in range(ncolumns)
+                if column in columns]).value
+        with work:
+            pivots = _forward(work, mask, panel)
+            if backward:
+                _backward(work, pivots, panel)
+            if sort:
+                _write_sorted(work, pivots, target, panel)
+        if not sort:
+            os.replace(work_path, target)
+    finally:
+        if os.path.exists(work_path):
+            os.remove(work_path)
+    pivot_columns = sorted(ncolumns - bit - 1 for bit in pivots if bit >= 0)
+    return EliminationResult(target, len(pivot_columns), pivot_columns)
+
+
+def _panel_size(stride, memory_limit):
+    """Return number of rows of panel.
+
+    A panel and a chunk of other rows are kept in memory at once.
+    """
+    return max(1, memory_limit // (2 * (stride + ROW_OVERHEAD)))
+
+
+def _forward(work, mask, panel):
+    """Reduce rows by pivots of previous rows.
+
+    :return: array of bit numbers of pivots of rows, -1 for rows
+             without pivots.
+    """
+    pivots = array('q')
+    nrows = work.nrows
+    for start in range(0, nrows, panel):
+        stop = min(nrows, start + panel)
+        rows = work.rows(start, stop)
+        for chunk_start in range(0, start, panel):
+            chunk_stop = min(start, chunk_start + panel)
+            chunk = work.rows(chunk_start, chunk_stop)
+            for pivot_row, bit in zip(chunk,
+                                      pivots[chunk_start:chunk_stop]):
+                if bit >= 0:
+                    rows = [row ^ pivot_row if row >> bit & 1 else row
+                            for row in rows]
+        for i, row in enumerate(rows):
+            bit = (row & mask).bit_length() - 1
+            pivots.append(bit)
+            if bit < 0:
+                continue
+            for k in range(i + 1, len(rows)):
+                if rows[k] >> bit & 1:
+                    rows[k] ^= row
+        work.set_rows(start, rows)
+    return pivots
+
+
+def _backward(work, pivots, panel):
+    """Reduce rows by pivots of the following rows."""
+    nrows = work.nrows
+    for start in range(0, nrows, panel):
+        stop = min(nrows, start + panel)
+        rows = work.rows(start, stop)
+        for chunk_start in range(start, nrows, panel):
+            chunk_stop = min(nrows, chunk_start + panel)
+            chunk = (rows if chunk_start == start
+                     else work.rows(chunk_start, chunk_stop))
+            for i in range(chunk_start, chunk_stop):
+                bit = pivots[i]
+                if bit < 0:
+                    continue
+                # Rows before `i` of the own panel are not changed yet
+                # by pivots after them, so `rows[i]` is the pivot row.
+                pivot_row = chunk[i - chunk_start]
+                for k in range(min(i, stop) - start):
+                    if rows[k] >> bit & 1:
+                        rows[k] ^= pivot_row
+        work.set_rows(start, rows)
+
+
+def _write_sorted(work, pivots, target, panel):
+    """Write rows with pivots ordered by pivot columns and other rows."""
+    order = sorted((i for i, bit in enumerate(pivots) if bit >= 0),
+                   key=pivots.__getitem__, reverse=True)
+    order.extend(i for i, bit in enumerate(pivots) if bit < 0)
+    with binary.create(target, work.nrows, work.ncolumns,
+                       work.bit_order) as result:
+        for start in range(0, len(order), panel):
+            result.set_rows(start, (work.row(i)
+                                    for i in order[start:start + panel]))
@@ -0,0 +1,174 @@
+"""Module for working with permutations of coordinates.
+
+Permutation `p` acts on vectors by gathering: the coordinate `i` of the
+result is the coordinate `p[i]` of the source, so `p.permute(vec)` equals
+`vec * p.to_matrix()` and `p.permute(mat)` permutes columns of matrix
+as `mat * p.to_matrix()`. The gather is precompiled into
+`operator.itemgetter` applied to the binary string of row, so no
+permutation matrix is built.
+"""
+
+import random as _random
+from operator import itemgetter
+from blincodes import matrix, vector
+
+
+class Permutation():
+    """Permutation of `size` elements."""
+
+    def __init__(self, value=None):
+        """Create new permutation.
+
+        :param: value - any iterable of integers `0, ..., size - 1`
+                        in any order, the identity of size 0 by default.
+        """
+        self._value = tuple(value or ())
+        if sorted(self._value) != list(range(len(self._value))):
+            raise ValueError(
+                'expected permutation of 0, ..., {}, but '
+                'got {}'.format(len(self._value) - 1, self._value))
+        self._gather = None
+
+    @property
+    def size(self):
+        """Return number of elements."""
+        return len(self._value)
+
+    def inverse(self):
+        """Return inverse permutation."""
+        inverse = [0] * len(self._value)
+        for i, j in enumerate(self._value):
+            inverse[j] = i
+        return self.__class__(inverse)
+
+    def cycles(self):
+        """Return list of cycles of length greater than 1.
+
+        Every cycle `(a, p[a], p[p[a]], ...)` starts from its minimal
+        element.
+        """
+        seen = [False] * len(self._value)
+        cycles = []
+        for start in range(len(self._value)):
+            if seen[start]:
+                continue
+            cycle = []
+            i = start
+            while not seen[i]:
+                seen[i] = True
+                cycle.append(i)
+                i = self._value[i]
+            if len(cycle) > 1:
+                cycles.append(tuple(cycle))
+        return cycles
+
+    def is_identity(self):
+        """Return True if permutation is identity."""
+        return all(i == j for i, j in enumerate(self._value))
+
+    def permute(self, obj):
+        """Return permuted copy of Vector or columns of Matrix."""
+        if isinstance(obj, matrix.Matrix):
+            self._check_length(obj.ncolumns)
+            return matrix.Matrix(
+                (self._apply(row.value) for row in obj), self.size)
+        if isinstance(obj, vector.Vector):
+            self._check_length(len(obj))
+        return vector.Vector(self._apply(int(obj)), self.size)
+
+    def permute_inplace(self, obj):
+        """Permute Vector or columns of Matrix in place and return it."""
+        self._check_length(obj.ncolumns if isinstance(obj, matrix.Matrix)
+                           else len(obj))
+        rows = obj if isinstance(obj, matrix.Matrix) else (obj,)
+        for row in rows:
+            row.set_value(self._apply(row.value))
+        return obj
+
+    def to_matrix(self, by_rows=False):
+        """Return permutation matrix, see `matrix.permutation`."""
+        return matrix.permutation(self._value, by_rows=by_rows)
+
+    def __len__(self):
+        """Return number of elements."""
+        return len(self._value)
+
+    def __getitem__(self, index):
+        """Return image of element `index`."""
+        return self._value[index]
+
+    def __iter__(self):
+        """Iterate over images of elements."""
+        return iter(self._value)
+
+    def __mul__(self, other):
+        """Return composition `self * other`.
+
+        The product agrees with the product of matrices: applying
+        `self * other` is applying `self` and then `other`.
+        """
+        if len(self) != len(other):
+            raise ValueError(
+                'expected permutations of the same size, but '
+                '{} != {}'.format(len(self), len(other)))
+        return self.__class__(self._value[i] for i in other)
+
+    def __eq__(self, other):
+        """Return True if permutations are equal."""
+        try:
+            return self._value == other._value
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        """Return False if permutations are equal."""
+        return not self == other
+
+    def __hash__(self):
+        """Return hash of permutation."""
+        return hash(self._value)
+
+    def __repr__(self):
+        """Return string representation of permutation."""
+        return '{name}({value})'.format(name=self.__class__.__name__,
+                                        value=list(self._value))
+
+    def _apply(self, value):
+        """Return integer with gathered bits of `value`."""
+        size = len(self._value)
+        if not size:
+            return 0
+        if self._gather is None:
+            self._gather = itemgetter(*self._value)
+        return int(''.join(self._gather(
+            format(value, '0{}b'.format(size))[-size:])), 2)
+
+    def _check_length(self, length):
+        """Raise ValueError if length differs from size of permutation."""
+        if length != len(self._value):
+            raise ValueError(
+                'expected object of length {}, but '
+                'got {}'.format(len(self._value), length))
+
+
+def identity(size):
+    """Return identity permutation of `size` elements."""
+    return Permutation(range(size))
+
+
+def random(size, rng=None):
+    """Return random permutation of `size` elements."""
+    if not rng:
+        rng = _random
+    value = list(range(size))
+    rng.shuffle(value)
+    return Permutation(value)
+
+
+def from_cycles(size, cycles):
+    """Return permutation of `size` elements with given cycles."""
+    value = list(range(size))
+    for cycle in cycles:
+        for i, element in enumerate(cycle):
+            value[element] = cycle[(i + 1) % len(cycle)]
+    return Permutation(value)
@@ -0,0 +1,147 @@
+"""Module for PLE factorization of matrices over GF(2).
+
+The factorization `A = P * L * E` is stored as the recorded row reduction
+`T * A = E`, where `T = (P * L)^(-1)` and `E` is the reduced echelon form
+of `A`. It is evaluated once per matrix and then every right-hand side of
+`A * x^T = b^T` is solved by `nrows` parities of `T` rows and `b`.
+"""
+
+from blincodes import matrix, vector
+from blincodes.basis import from_reduced
+from blincodes.subspace import orthogonal_rows
+
+
+class PLE():
+    """PLE factorization of binary matrix."""
+
+    def __init__(self, mat):
+        """Evaluate factorization of matrix `mat`."""
+        self._nrows = mat.nrows
+        self._ncolumns = mat.ncolumns
+        nrows = self._nrows
+        # Every row is stored together with the row of T in its low bits.
+        rows = [(row.value << nrows) | (1 << (nrows - i - 1))
+                for i, row in enumerate(mat)]
+        self._pivots = []
+        rank = 0
+        for column in range(self._ncolumns):
+            if rank == nrows:
+                break
+            bit = 1 << (self._ncolumns - column - 1 + nrows)
+            for i in range(rank, nrows):
+                if rows[i] & bit:
+                    break
+            else:
+                continue
+            rows[rank], rows[i] = rows[i], rows[rank]
+            pivot_row = rows[rank]
+            for j, row in enumerate(rows):
+                if j != rank and row & bit:
+                    rows[j] = row ^ pivot_row
+            self._pivots.append(column)
+            rank += 1
+        mask = (1 << nrows) - 1
+        self._echelon = tuple(row >> nrows for row in rows[:rank])
+        self._transform = tuple(row & mask for row in rows)
+        self._pivot_bits = tuple(1 << (self._ncolumns - column - 1)
+                                 for column in self._pivots)
+        self._nullspace = None
+
+    @property
+    def rank(self):
+        """Return rank of matrix."""
+        return len(self._pivots)
+
+    @property
+    def pivots(self):
+        """Return list of pivot columns."""
+        return list(self._pivots)
+
+    @property
+    def echelon(self):
+        """Return the reduced echelon form E of matrix without zero rows."""
+        return matrix.Matrix(self._echelon, self._ncolumns)
+
+    @property
+    def transform(self):
+        """Return invertible matrix T satisfied T * A = E.
+
+        The first `rank` rows of T * A are the rows of `echelon`
+        and the others are zero.
+        """
+        return matrix.Matrix(self._transform, self._nrows)
+
+    @property
+    def nullspace(self):
+        """Return basis of solutions of A * x^T = 0 as Matrix."""
+        if self._nullspace is None:
+            self._nullspace = orthogonal_rows(
+                from_reduced(self._echelon, self._ncolumns))
+        return matrix.Matrix(self._nullspace, self._ncolumns)
+
+    def is_consistent(self, vect_b):
+        """Return True if A * x^T = vect_b^T has solution."""
+        value = int(vect_b)
+        for row in self._transform[self.rank:]:
+            if bin(row & value).count('1') & 1:
+                return False
+        return True
+
+    def solve(self, vect_b):
+        """Return particular solution of A * x^T = vect_b^T.
+
+        All solutions are the particular solution plus vectors of
+        `nullspace`.
+        :param: vect_b - Vector or integer of length `nrows`.
+        :return: Vector of length `ncolumns` or None if there is
+                 no solution.
+        """
+        if not self.is_consistent(vect_b):
+            return None
+        value = int(vect_b)
+        solution = 0
+        for row, bit in zip(self._transform, self._pivot_bits):
+            if bin(row & value).count('1') & 1:
+                solution |= bit
+        return vector.Vector(solution, self._ncolumns)
+
+    def solve_many(self, vectors):
+        """Solve A * x^T = b^T for every `b` from `vectors`.
+
+        Right-hand sides are packed into columns of one matrix, so every
+        row operation of T is applied to all of them at once.
+        :param: vectors - iterable of Vectors or integers of length `nrows`.
+        :return: list of Vectors or None for inconsistent systems.
+        """
+        values = [int(vec) for vec in vectors]
+        count = len(values)
+        # Row i of `packed` is the bit i of every right-hand side.
+        packed = [0] * self._nrows
+        for j, value in enumerate(values):
+            bit = 1 << (count - j - 1)
+            for i in range(self._nrows):
+                if value >> (self._nrows - i - 1) & 1:
+                    packed[i] |= bit
+        reduced = []
+        for row in self._transform:
+            combination = 0
+            while row:
+                top = row.bit_length() - 1
+                combination ^= packed[self._nrows - top - 1]
+                row ^= 1 << top
+            reduced.append(combination)
+        inconsistent = 0
+        for combination in reduced[self.rank:]:
+            inconsistent |= combination
+        solutions = []
+        for j in range(count):
+            shift = count - j - 1
+            if inconsistent >> shift & 1:
+                solutions.append(None)
+                continue
+            solution = 0
+            for combination, bit in zip(reduced, self._pivot_bits):
+                if combination >> shift & 1:
+                    solution |= bit
+            solutions.append(vector.Vector(solution, self._ncolumns))
+        return solutions
@@ -0,0 +1,169 @@
+"""Module for fast generation of random matrices.
+
+Matrices are built from integer rows: sets of positions are bit masks
+and products are XORs of rows, so a nonsingular `k x k` matrix costs
+O(k^2) word operations. Every function takes explicit random numbers
+generator `rng`: an object with `getrandbits` method (for example
+`random.Random`), an integer or string seed, or None for the module
+`random`. Batch functions generate the matrix `i` by the stream
+`stream(seed, i)`, so results do not depend on the number of processes.
+"""
+
+import multiprocessing
+import random as _random
+from blincodes import matrix
+from blincodes.basis import IncrementalBasis
+
+
+def stream(seed, index):
+    """Return random numbers generator of the stream `index`."""
+    return _random.Random('{}:{}'.format(seed, index))
+
+
+def nonsingular(size, rng=None):
+    """Return random nonsingular matrix `size x size`.
+
+    The algorithm of Dana Randall: the matrix is the product `A * T` where
+    the row `i` of `T` is a random nonzero vector on free positions, its
+    first one is the pivot of the row `i` of `A`, which also has random
+    bits on the pivots chosen before.
+    """
+    size = max(0, size)
+    a_rows, t_rows = _randall(size, _make_rng(rng))
+    return matrix.Matrix(_combine_rows(a_rows, t_rows), size)
+
+
+def nonsingular_pair(size, rng=None):
+    """Return random nonsingular matrix and its inverse.
+
+    Factors of `M = A * T` are triangular up to the order of pivots,
+    so their inverses are evaluated by substitution and
+    `M^(-1) = T^(-1) * A^(-1)`.
+    :return: tuple (Matrix, Matrix).
+    """
+    size = max(0, size)
+    a_rows, t_rows = _randall(size, _make_rng(rng))
+    # X = A^(-1): A * X = I, X[pivot of row i] depends on X of
+    # the pivots chosen before.
+    pivots = list(t_rows)
+    a_inverse = {}
+    for i, (a_row, pivot) in enumerate(zip(a_rows, pivots)):
+        value = 1 << (size - i - 1)
+        rest = a_row ^ pivot
+        while rest:
+            bit = rest & -rest
+            value ^= a_inverse[bit]
+            rest ^= bit
+        a_inverse[pivot] = value
+    # W = T^(-1): W[pivot] depends on W of the pivots chosen after.
+    t_inverse = {}
+    for pivot in reversed(pivots):
+        value = pivot
+        rest = t_rows[pivot] ^ pivot
+        while rest:
+            bit = rest & -rest
+            value ^= t_inverse[bit]
+            rest ^= bit
+        t_inverse[pivot] = value
+    inverse_rows = (1 << (size - i - 1) for i in range(size))
+    return (matrix.Matrix(_combine_rows(a_rows, t_rows), size),
+            matrix.Matrix(_combine_rows(
+                (t_inverse[bit] for bit in inverse_rows), a_inverse), size))
+
+
+def full_rank(nrows, ncolumns=None, rng=None):
+    """Return random matrix `nrows x ncolumns` of maximal rank.
+
+    Every row is sampled uniformly outside of the span of the previous
+    rows (columns if `nrows > ncolumns`), so the result is uniform over
+    matrices of maximal rank.
+    """
+    if ncolumns is None:
+        ncolumns = nrows
+    rng = _make_rng(rng)
+    if nrows > ncolumns:
+        return full_rank(ncolumns, nrows, rng).transpose()
+    row_basis = IncrementalBasis(ncolumns)
+    rows = []
+    while len(rows) < nrows:
+        row = rng.getrandbits(ncolumns) if ncolumns else 0
+        if row_basis.insert(row):
+            rows.append(row)
+    return matrix.Matrix(rows, ncolumns)
+
+
+def nonsingular_batch(size, count, seed=None, processes=None):
+    """Return list of `count` random nonsingular matrices."""
+    return _batch(nonsingular, (size,), count, seed, processes)
+
+
+def nonsingular_pair_batch(size, count, seed=None, processes=None):
+    """Return list of `count` pairs (matrix, inverse matrix)."""
+    return _batch(nonsingular_pair, (size,), count, seed, processes)
+
+
+def full_rank_batch(nrows, ncolumns, count, seed=None, processes=None):
+    """Return list of `count` random matrices of maximal rank."""
+    return _batch(full_rank, (nrows, ncolumns), count, seed, processes)
+
+
+def _make_rng(rng):
+    """Return random numbers generator from generator or seed."""
+    if rng is None:
+        return _random
+    if isinstance(rng, (int, str)):
+        return _random.Random(rng)
+    return rng
+
+
+def _randall(size, rng):
+    """Return rows of factors A and T of Randall's algorithm.
+
+    :return: tuple (a_rows, t_rows), where `a_rows` is the list of rows of
+             A and `t_rows` is dict {pivot bit: row of T} in order of
+             steps.
+    """
+    free = (1 << size) - 1
+    pivots = 0
+    a_rows = []
+    t_rows = {}
+    for _ in range(size):
+        t_row = rng.getrandbits(size) & free
+        while not t_row:
+            t_row = rng.getrandbits(size) & free
+        pivot = 1 << (t_row.bit_length() - 1)
+        t_rows[pivot] = t_row
+        a_rows.append((rng.getrandbits(size) & pivots) | pivot)
+        pivots |= pivot
+        free ^= pivot
+    return a_rows, t_rows
+
+
+def _combine_rows(left_rows, right_rows):
+    """Return rows of product, `right_rows` is dict {bit: row}."""
+    rows = []
+    for left_row in left_rows:
+        value = 0
+        while left_row:
+            bit = left_row & -left_row
+            value ^= right_rows[bit]
+            left_row ^= bit
+        rows.append(value)
+    return rows
+
+
+def _batch(function, args, count, seed, processes):
+    """Return results of `function(*args, stream(seed, i))`."""
+    if seed is None:
+        seed = _random.getrandbits(64)
+    tasks = [(function, args, seed, index) for index in range(count)]
+    if not processes or processes <= 1:
+        return [_batch_task(task) for task in tasks]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(_batch_task, tasks)
+
+
+def _batch_task(args):
+    """Return one matrix of batch."""
+    function, args, seed, index = args
+    return function(*args, rng=stream(seed, index))
@@ -0,0 +1,150 @@
+"""Matrices in shared memory for worker processes.
+
+`publish` writes a matrix once into a block of
+`multiprocessing.shared_memory` in the binary format (see `binary`) and
+returns SharedMatrix. SharedMatrix is pickled by the name of the block
+only, so it may be passed to every task of `multiprocessing.Pool`
+without copies of rows: a worker attaches to the block by its name and
+reads rows lazily through a read-only view. Attached blocks are cached
+in every process, so a worker attaches to a block once for all tasks.
+
+The process which published the matrix owns the block and must unlink
+it when workers are done, for example by the `with` statement::
+
+    with shared.publish(mat) as shared_mat:
+        weights = pool.map(task, [(shared_mat, i) for i in range(n)])
+
+Shared memory is available since Python 3.8. Without it `share` returns
+the matrix itself, Matrix and Vector are pickled compactly as packed
+rows and integers.
+"""
+
+import sys
+from blincodes import binary
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+_ATTACHED = {}
+
+
+def is_available():
+    """Return True if shared memory is supported."""
+    return shared_memory is not None
+
+
+def publish(mat, bit_order='big'):
+    """Write matrix into new block of shared memory.
+
+    :param: Matrix mat - the matrix;
+    :param: str bit_order - 'big' or 'little', see `binary`.
+    :return: SharedMatrix owning the block.
+    """
+    if shared_memory is None:
+        raise RuntimeError('expected `multiprocessing.shared_memory` is '
+                           'available, but it is not')
+    data = binary.dumps(mat, bit_order)
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        block.buf[:len(data)] = data
+        return SharedMatrix(block, owner=True)
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+
+
+def share(mat):
+    """Return SharedMatrix of matrix or the matrix itself.
+
+    The matrix is returned if shared memory is not available, it is
+    pickled as packed rows then.
+    """
+    if shared_memory is None:
+        return mat
+    return publish(mat)
+
+
+def attach(name):
+    """Return read-only SharedMatrix of the block `name`.
+
+    The attached matrix is cached, so all calls in a process with the
+    same name return the same object until it is closed.
+    """
+    shared_mat = _ATTACHED.get(name)
+    if shared_mat is None:
+        shared_mat = SharedMatrix(_open_block(name))
+        _ATTACHED[name] = shared_mat
+    return shared_mat
+
+
+class SharedMatrix(binary.PackedMatrix):
+    """Read-only matrix in block of shared memory."""
+
+    def __init__(self, block, owner=False):
+        """Use block of shared memory with matrix in the binary format.
+
+        :param: block - `multiprocessing.shared_memory.SharedMemory`;
+        :param: bool owner - if True then `unlink` frees the block.
+        """
+        self._block = block
+        self._owner = owner
+        super().__init__(block.buf.toreadonly())
+
+    @property
+    def name(self):
+        """Return name of the block of shared memory."""
+        return self._block.name
+
+    @property
+    def owner(self):
+        """Return True if the matrix owns the block."""
+        return self._owner
+
+    def close(self):
+        """Detach from the block, it stays available to other processes."""
+        self.release()
+        if _ATTACHED.get(self._block.name) is self:
+            del _ATTACHED[self._block.name]
+        self._block.close()
+
+    def unlink(self):
+        """Close and free the block, it must be called by the owner."""
+        if not self._owner:
+            raise TypeError('expected owner of block, but got attached '
+                            'SharedMatrix')
+        self.close()
+        self._block.unlink()
+        self._owner = False
+
+    def __exit__(self, *args):
+        """Unlink the block by the owner or detach from it."""
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __reduce__(self):
+        """Pickle the matrix by name of its block."""
+        return attach, (self._block.name,)
+
+    def __repr__(self):
+        """Return string representation of shared matrix."""
+        return '{name}(name={block!r}, shapes={shapes})'.format(
+            name=self.__class__.__name__, block=self._block.name,
+            shapes=self.shapes)
+
+
+def _open_block(name):
+    """Return existing block of shared memory.
+
+    Since Python 3.13 the attached block is not tracked, so the resource
+    tracker frees it only after the owner. Before that processes started
+    by `multiprocessing` share the tracker of the owner, which unlinks
+    the block once.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
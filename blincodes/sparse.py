@@ -0,0 +1,237 @@
+"""Module for working with sparse matrices over GF(2).
+
+The matrix is stored by supports of rows in compressed sparse row (CSR)
+format, the compressed sparse column (CSC) format is evaluated on demand.
+The cost of products and syndromes is proportional to the number of
+nonzero elements, not to the size of matrix.
+"""
+
+from array import array
+from blincodes import matrix, vector
+
+
+class SparseMatrix():
+    """Sparse binary matrix abstraction."""
+
+    def __init__(self, value=None, ncolumns=0):
+        """Create new sparse matrix.
+
+        :param: value - any iterable of rows supports (iterables of
+                        positions of ones);
+        :param: int ncolumns - number of columns in the matrix.
+        """
+        if not isinstance(ncolumns, int):
+            raise TypeError(
+                'expected `ncolumns` is integer, but '
+                'got {}'.format(type(ncolumns)))
+        if ncolumns < 0:
+            raise ValueError(
+                'expected `ncolumns` is not less then 0, but '
+                '{} < 0'.format(ncolumns))
+        self._ncolumns = ncolumns
+        self._row_pointers = array('l', [0])
+        self._row_indices = array('l')
+        for support in (value or ()):
+            columns = sorted(set(support))
+            if columns and not (0 <= columns[0] and
+                                columns[-1] < ncolumns):
+                raise ValueError(
+                    'expected positions are in range [0, {}), but got '
+                    '{}'.format(ncolumns, columns))
+            self._row_indices.extend(columns)
+            self._row_pointers.append(len(self._row_indices))
+        self._column_pointers = None
+        self._column_indices = None
+
+    @property
+    def nrows(self):
+        """Return number of rows."""
+        return len(self._row_pointers) - 1
+
+    @property
+    def ncolumns(self):
+        """Return number of columns."""
+        return self._ncolumns
+
+    @property
+    def shapes(self):
+        """Return shapes of the matrix: (nrows, ncolumns)."""
+        return self.nrows, self.ncolumns
+
+    @property
+    def nnz(self):
+        """Return number of ones in the matrix."""
+        return len(self._row_indices)
+
+    @property
+    def row_weights(self):
+        """Return list of Hamming weights of rows."""
+        pointers = self._row_pointers
+        return [pointers[i + 1] - pointers[i] for i in range(self.nrows)]
+
+    @property
+    def column_weights(self):
+        """Return list of Hamming weights of columns."""
+        weights = [0] * self._ncolumns
+        for column in self._row_indices:
+            weights[column] += 1
+        return weights
+
+    @property
+    def T(self):
+        """Return transpose of matrix."""
+        return self.transpose()
+
+    def row(self, index):
+        """Return support of row with index `index` as tuple."""
+        index = _check_index(index, self.nrows)
+        return tuple(self._row_indices[self._row_pointers[index]:
+                                       self._row_pointers[index + 1]])
+
+    def column(self, index):
+        """Return support of column with index `index` as tuple."""
+        index = _check_index(index, self._ncolumns)
+        self._make_columns()
+        return tuple(self._column_indices[self._column_pointers[index]:
+                                          self._column_pointers[index + 1]])
+
+    def weight_distribution(self, by_rows=True):
+        """Return distribution of weights of rows (or columns).
+
+        :return: dict {weight: number of rows (columns) of this weight}.
+        """
+        weights = self.row_weights if by_rows else self.column_weights
+        distribution = {}
+        for weight in weights:
+            distribution[weight] = distribution.get(weight, 0) + 1
+        return distribution
+
+    def transpose(self):
+        """Return transposition of matrix."""
+        self._make_columns()
+        transposed = self.__class__(ncolumns=self.nrows)
+        transposed._row_pointers = array('l', self._column_pointers)
+        transposed._row_indices = array('l', self._column_indices)
+        return transposed
+
+    def to_matrix(self):
+        """Return dense Matrix."""
+        return matrix.Matrix(
+            (sum(1 << (self._ncolumns - column - 1)
+                 for column in self.row(i))
+             for i in range(self.nrows)),
+            self._ncolumns)
+
+    def dot(self, vec):
+        """Return product `self * vec^T` as Vector of length `nrows`.
+
+        The product is the sum of columns from support of `vec`.
+        :param: vec - Vector or integer of length `ncolumns`.
+        """
+        self._make_columns()
+        pointers = self._column_pointers
+        indices = self._column_indices
+        result = bytearray(b'0' * self.nrows)
+        for column in _iter_support(int(vec), self._ncolumns):
+            for i in indices[pointers[column]:pointers[column + 1]]:
+                result[i] ^= 1
+        return vector.Vector(int(result, 2) if result else 0, self.nrows)
+
+    def syndromes(self, words):
+        """Return products `self * word^T` for every word of `words`.
+
+        Words are packed into columns of bit-sliced integers, so every
+        nonzero element of matrix costs one XOR for the whole batch.
+        :param: words - iterable of Vectors or integers of length `ncolumns`.
+        :return: list of Vectors of length `nrows`.
+        """
+        words = [int(word) for word in words]
+        if not words:
+            return []
+        # packed[j] is the column j of the batch: bit of every word.
+        packed = [int(''.join(column), 2) for column in zip(
+            *(format(word, '0{}b'.format(self._ncolumns))[-self._ncolumns:]
+              for word in words))]
+        pointers = self._row_pointers
+        indices = self._row_indices
+        sliced = []
+        for i in range(self.nrows):
+            value = 0
+            for column in indices[pointers[i]:pointers[i + 1]]:
+                value ^= packed[column]
+            sliced.append(format(value, '0{}b'.format(len(words))))
+        if not sliced:
+            return [vector.Vector(0, 0) for _ in words]
+        return [vector.Vector(int(''.join(bits), 2), self.nrows)
+                for bits in zip(*sliced)]
+
+    def __iter__(self):
+        """Iterate over supports of rows."""
+        for i in range(self.nrows):
+            yield self.row(i)
+
+    def __eq__(self, other):
+        """Return True if self == other."""
+        try:
+            return (self.shapes == other.shapes and
+                    self._row_pointers == other._row_pointers and
+                    self._row_indices == other._row_indices)
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        """Return False if self == other."""
+        return not self == other
+
+    def __repr__(self):
+        """Return string representation of matrix to use in terminal."""
+        return '{name}(shapes={shapes}, nnz={nnz})'.format(
+            name=self.__class__.__name__, shapes=self.shapes, nnz=self.nnz)
+
+    def _make_columns(self):
+        """Evaluate the CSC format of matrix."""
+        if self._column_pointers is not None:
+            return
+        pointers = array('l', [0] * (self._ncolumns + 1))
+        for column in self._row_indices:
+            pointers[column + 1] += 1
+        for column in range(self._ncolumns):
+            pointers[column + 1] += pointers[column]
+        indices = array('l', [0] * self.nnz)
+        position = array('l', pointers[:-1])
+        for i in range(self.nrows):
+            for column in self._row_indices[self._row_pointers[i]:
+                                            self._row_pointers[i + 1]]:
+                indices[position[column]] = i
+                position[column] += 1
+        self._column_pointers = pointers
+        self._column_indices = indices
+
+
+def from_matrix(mat):
+    """Return SparseMatrix from dense Matrix."""
+    return SparseMatrix(
+        (_iter_support(row.value, mat.ncolumns) for row in mat),
+        mat.ncolumns)
+
+
+def _iter_support(value, length):
+    """Iterate over positions of ones of integer `value` of length `length`.
+
+    Ones are found by `str.find`, so zero runs are skipped in bulk.
+    """
+    if not value:
+        return
+    bits = format(value, '0{}b'.format(length))[-length:]
+    position = bits.find('1')
+    while position >= 0:
+        yield position
+        position = bits.find('1', position + 1)
+
+
+def _check_index(index, size):
+    """Return normalized index or raise IndexError."""
+    if not -size <= index < size:
+        raise IndexError(
+            'index out of range, expected |index| < {}'.format(size))
+    return index % size
@@ -0,0 +1,415 @@
+"""Module for solving large sparse linear systems over GF(2).
+
+The system is first shrunk by structured Gaussian elimination: variables
+are eliminated with Markowitz pivoting (the pivot with the least fill-in
+`(row weight - 1) * (column weight - 1)` is chosen among the lightest
+columns). The remaining core is solved by dense elimination (`PLE`) if it
+fits into the memory limit and by block Lanczos algorithm otherwise.
+Block Lanczos keeps only a few blocks of `n` words in memory.
+
+Inhomogeneous systems `A * x^T = b^T` are solved as nullspaces of `[A | b]`.
+"""
+
+import heapq
+import random
+from blincodes import matrix, sparse, vector
+from blincodes.basis import IncrementalBasis
+from blincodes.ple import PLE
+
+#: Default limit of memory for dense core elimination in bytes.
+MEMORY_LIMIT = 1 << 28
+#: Default limit of fill-in of one pivot.
+MAX_FILL = 64
+#: Number of bits in block of block Lanczos algorithm.
+BLOCK_SIZE = 64
+
+
+class StructuredElimination():
+    """Structured Gaussian elimination of sparse matrix."""
+
+    def __init__(self, mat, max_fill=MAX_FILL, protected=None):
+        """Eliminate variables of system `mat * x^T = 0`.
+
+        :param: mat - SparseMatrix or Matrix;
+        :param: int max_fill - maximal fill-in of one pivot;
+        :param: protected - columns which are never eliminated.
+        """
+        if isinstance(mat, matrix.Matrix):
+            mat = sparse.from_matrix(mat)
+        self._ncolumns = mat.ncolumns
+        protected = set(protected or ())
+        rows = {i: set(row) for i, row in enumerate(mat) if row}
+        columns = {}
+        for i, row in rows.items():
+            for column in row:
+                columns.setdefault(column, set()).add(i)
+        self._pivots = []  # [(column, tuple(row))]
+        heap = [(len(rows_set), column)
+                for column, rows_set in columns.items()
+                if column not in protected]
+        heapq.heapify(heap)
+        while heap:
+            weight, column = heapq.heappop(heap)
+            column_rows = columns.get(column)
+            if not column_rows or weight != len(column_rows):
+                continue  # eliminated, empty or stale entry
+            pivot = min(column_rows, key=lambda i: len(rows[i]))
+            if (len(rows[pivot]) - 1) * (weight - 1) > max_fill:
+                continue
+            pivot_row = rows.pop(pivot)
+            for other in pivot_row:
+                columns[other].discard(pivot)
+            for i in list(column_rows):
+                rows[i] ^= pivot_row
+                for other in pivot_row:
+                    if other in rows[i]:
+                        columns[other].add(i)
+                    else:
+                        columns[other].discard(i)
+                if not rows[i]:
+                    del rows[i]
+            del columns[column]
+            for other in pivot_row:
+                if other != column and other not in protected:
+                    heapq.heappush(heap, (len(columns[other]), other))
+            self._pivots.append((column, tuple(pivot_row)))
+        eliminated = set(column for column, _ in self._pivots)
+        self._core_columns = [column for column in range(self._ncolumns)
+                              if column not in eliminated]
+        index = {column: i for i, column in enumerate(self._core_columns)}
+        self._core = sparse.SparseMatrix(
+            ((index[column] for column in row) for row in rows.values()),
+            len(self._core_columns))
+
+    @property
+    def core(self):
+        """Return SparseMatrix of the remaining core system."""
+        return self._core
+
+    @property
+    def core_columns(self):
+        """Return list of columns (variables) of the core system."""
+        return list(self._core_columns)
+
+    @property
+    def pivots(self):
+        """Return list of eliminated columns in order of elimination."""
+        return [column for column, _ in self._pivots]
+
+    def lift(self, core_vectors):
+        """Return solutions of the whole system from core solutions.
+
+        Eliminated variables are evaluated by back substitution for all
+        vectors at once: the value of a variable is an integer whose bit
+        `t` belongs to the vector `t`.
+        :param: core_vectors - list of integers of length of core.
+        :return: list of integers of length `ncolumns`.
+        """
+        count = len(core_vectors)
+        if not count:
+            return []
+        ncore = len(self._core_columns)
+        values = [0] * self._ncolumns
+        for t, core_vector in enumerate(core_vectors):
+            for i in _iter_ones(core_vector, ncore):
+                values[self._core_columns[i]] |= 1 << t
+        for column, row in reversed(self._pivots):
+            value = 0
+            for other in row:
+                if other != column:
+                    value ^= values[other]
+            values[column] = value
+        return _transpose(values, count)
+
+
+def nullspace(mat, memory_limit=MEMORY_LIMIT, max_fill=MAX_FILL,
+              method=None, rng=None):
+    """Return vectors of nullspace of sparse matrix.
+
+    :param: mat - SparseMatrix or Matrix;
+    :param: int memory_limit - maximal size of dense core in bytes;
+    :param: int max_fill - maximal fill-in of one pivot;
+    :param: str method - 'dense' or 'lanczos' to force core method;
+    :param: rng - random numbers generator for block Lanczos.
+    :return: Matrix - the basis of nullspace if the core is solved by
+             dense elimination or the basis of a random subspace of
+             nullspace (of dimension up to about 60) if block Lanczos
+             algorithm is used.
+    """
+    reduction = StructuredElimination(mat, max_fill=max_fill)
+    vectors = reduction.lift(
+        _core_nullspace(reduction.core, memory_limit, method, rng))
+    return matrix.Matrix(IncrementalBasis(mat.ncolumns, vectors).rows,
+                         mat.ncolumns)
+
+
+def solve(mat, vect_b, memory_limit=MEMORY_LIMIT, max_fill=MAX_FILL,
+          method=None, rng=None):
+    """Return solution of sparse system `mat * x^T = vect_b^T`.
+
+    :param: mat - SparseMatrix or Matrix;
+    :param: vect_b - Vector or integer of length `mat.nrows`;
+    :return: Vector of length `mat.ncolumns` or None if there is no
+             solution (with block Lanczos algorithm None is returned with
+             negligible probability for consistent system).
+    """
+    if isinstance(mat, matrix.Matrix):
+        mat = sparse.from_matrix(mat)
+    ncolumns = mat.ncolumns
+    value_b = int(vect_b)
+    extended = sparse.SparseMatrix(
+        (row + ((ncolumns,) if value_b >> (mat.nrows - i - 1) & 1 else ())
+         for i, row in enumerate(mat)),
+        ncolumns + 1)
+    reduction = StructuredElimination(extended, max_fill=max_fill,
+                                      protected=(ncolumns,))
+    for solution in reduction.lift(
+            _core_nullspace(reduction.core, memory_limit, method, rng)):
+        if solution & 1:
+            return vector.Vector(solution >> 1, ncolumns)
+    return None
+
+
+def block_lanczos(mat, block_size=BLOCK_SIZE, rng=None):
+    """Return vectors of nullspace of sparse matrix by block Lanczos.
+
+    The algorithm of P. Montgomery is applied to the symmetric matrix
+    `A = mat^T * mat` and the found vectors are combined to vectors of
+    nullspace of `mat`.
+    :param: SparseMatrix mat - the matrix;
+    :param: int block_size - number of vectors processed together;
+    :param: rng - random numbers generator with `getrandbits` method.
+    :return: list of integers of length `mat.ncolumns`, they span
+             a random subspace of nullspace.
+    """
+    if not rng:
+        rng = random
+    size = block_size
+    ncolumns = mat.ncolumns
+    rows = [tuple(row) for row in mat]
+    full = (1 << size) - 1
+
+    def apply(block):
+        """Return A * block."""
+        product = [0] * ncolumns
+        for row in rows:
+            value = 0
+            for column in row:
+                value ^= block[column]
+            if value:
+                for column in row:
+                    product[column] ^= value
+        return product
+
+    random_block = [rng.getrandbits(size) for _ in range(ncolumns)]
+    start = apply(random_block)
+    current = start
+    solution = [0] * ncolumns
+    previous = [0] * ncolumns
+    previous2 = [0] * ncolumns
+    winv_previous = [0] * size
+    winv_previous2 = [0] * size
+    vav_previous = [0] * size
+    vaav_previous = [0] * size
+    mask_previous = full
+    identity = [1 << a for a in range(size)]
+    for _ in range(ncolumns // max(size - 4, 1) + 10):
+        applied = apply(current)
+        vav = _inner(current, applied, size)
+        if not any(vav):
+            break
+        vaav = _inner(applied, applied, size)
+        winv, mask = _select(vav, mask_previous, size)
+        solution = _add(solution, _times(
+            current, _mul(winv, _inner(current, start, size))))
+        d_next = _add_small(identity, _mul(winv, _add_small(
+            [row & mask for row in vaav], vav)))
+        e_next = _mul(winv_previous, [row & mask for row in vav])
+        f_next = [row & mask for row in _mul(
+            _mul(winv_previous2,
+                 _add_small(identity, _mul(vav_previous, winv_previous))),
+            _add_small([row & mask_previous for row in vaav_previous],
+                       vav_previous))]
+        following = [(a & mask) ^ b ^ c ^ d for a, b, c, d in zip(
+            applied, _times(current, d_next), _times(previous, e_next),
+            _times(previous2, f_next))]
+        previous2, previous, current = previous, current, following
+        winv_previous2, winv_previous = winv_previous, winv
+        vav_previous, vaav_previous = vav, vaav
+        mask_previous = mask
+    # Combinations of columns of [X - Y | V] vanished by `mat`.
+    combined = [((x ^ y) << size) | v
+                for x, y, v in zip(solution, random_block, current)]
+    images = []
+    for row in rows:
+        value = 0
+        for column in row:
+            value ^= combined[column]
+        images.append(value)
+    kernel = PLE(matrix.Matrix(images, 2 * size)).nullspace
+    vectors = []
+    for combination in kernel:
+        value = 0
+        for word in combined:
+            value = (value << 1) | (bin(word & combination.value).count('1')
+                                    & 1)
+        if value:
+            vectors.append(value)
+    return vectors
+
+
+def _core_nullspace(core, memory_limit, method, rng):
+    """Return list of vectors of nullspace of the core system."""
+    if method not in (None, 'dense', 'lanczos'):
+        raise ValueError(
+            "expected `method` is 'dense' or 'lanczos', but "
+            "got {}".format(method))
+    if not core.ncolumns:
+        return []
+    if not core.nrows:
+        return [1 << i for i in range(core.ncolumns)]
+    if method is None:
+        dense_size = core.nrows * core.ncolumns // 8
+        method = 'dense' if dense_size <= memory_limit else 'lanczos'
+    if method == 'dense':
+        return [row.value for row in PLE(core.to_matrix()).nullspace
+                if row.value]
+    return block_lanczos(core, rng=rng)
+
+
+def _select(vav, mask_previous, size):
+    """Return (Winv, mask) of the step of block Lanczos algorithm.
+
+    Columns of `V^T A V` are selected so that the chosen submatrix is
+    invertible, columns not chosen at the previous step come first.
+    `Winv = S (S^T V^T A V S)^(-1) S^T` where `S` selects `mask` columns.
+    """
+    left = list(vav)
+    right = [1 << a for a in range(size)]
+    order = ([a for a in range(size) if not mask_previous >> a & 1] +
+             [a for a in range(size) if mask_previous >> a & 1])
+    mask = 0
+    for j, column in enumerate(order):
+        bit = 1 << column
+        for k in order[j:]:
+            if left[k] & bit:
+                break
+        else:
+            k = None
+        if k is not None:
+            left[column], left[k] = left[k], left[column]
+            right[column], right[k] = right[k], right[column]
+            mask |= bit
+            for row in range(size):
+                if row != column and left[row] & bit:
+                    left[row] ^= left[column]
+                    right[row] ^= right[column]
+            continue
+        for k in order[j:]:
+            if right[k] & bit:
+                break
+        left[column], left[k] = left[k], left[column]
+        right[column], right[k] = right[k], right[column]
+        for row in range(size):
+            if row != column and right[row] & bit:
+                left[row] ^= left[column]
+                right[row] ^= right[column]
+        left[column] = right[column] = 0
+    return right, mask
+
+
+def _inner(block_a, block_b, size):
+    """Return `block_a^T * block_b` as list of `size` integers.
+
+    The method of four Russians: rows of `block_b` are accumulated in
+    tables indexed by bytes of rows of `block_a`.
+    """
+    nbytes = (size + 7) // 8
+    tables = [[0] * 256 for _ in range(nbytes)]
+    for word_a, word_b in zip(block_a, block_b):
+        if word_a and word_b:
+            for k in range(nbytes):
+                tables[k][(word_a >> (8 * k)) & 255] ^= word_b
+    result = [0] * size
+    for k, table in enumerate(tables):
+        for bit in range(min(8, size - 8 * k)):
+            value = 0
+            for byte in range(256):
+                if byte >> bit & 1:
+                    value ^= table[byte]
+            result[8 * k + bit] = value
+    return result
+
+
+def _times(block, small):
+    """Return `block * small` where `small` is list of `size` integers."""
+    size = len(small)
+    nbytes = (size + 7) // 8
+    tables = []
+    for k in range(nbytes):
+        table = [0] * 256
+        for bit in range(min(8, size - 8 * k)):
+            step = 1 << bit
+            for byte in range(step):
+                table[byte | step] = table[byte] ^ small[8 * k + bit]
+        tables.append(table)
+    return [_combine(word, tables) for word in block]
+
+
+def _combine(word, tables):
+    """Return XOR of table entries indexed by bytes of `word`."""
+    value = 0
+    k = 0
+    while word:
+        value ^= tables[k][word & 255]
+        word >>= 8
+        k += 1
+    return value
+
+
+def _mul(small_a, small_b):
+    """Return product of two small square matrices."""
+    result = []
+    for row in small_a:
+        value = 0
+        column = 0
+        while row:
+            if row & 1:
+                value ^= small_b[column]
+            row >>= 1
+            column += 1
+        result.append(value)
+    return result
+
+
+def _add(block_a, block_b):
+    """Return sum of two blocks."""
+    return [a ^ b for a, b in zip(block_a, block_b)]
+
+
+def _add_small(small_a, small_b):
+    """Return sum of two small square matrices."""
+    return [a ^ b for a, b in zip(small_a, small_b)]
+
+
+def _iter_ones(value, length):
+    """Iterate over positions of ones of integer of length `length`."""
+    while value:
+        bit = value.bit_length() - 1
+        yield length - bit - 1
+        value ^= 1 << bit
+
+
+def _transpose(values, count):
+    """Return `count` integers made of bits `t` of `values`."""
+    vectors = [0] * count
+    length = len(values)
+    for i, value in enumerate(values):
+        bit = 1 << (length - i - 1)
+        t = 0
+        while value:
+            if value & 1:
+                vectors[t] |= bit
+            value >>= 1
+            t += 1
+    return vectors
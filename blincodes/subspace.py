@@ -0,0 +1,110 @@
+"""Module for algebra of subspaces of GF(2)^n given by spanning matrices.
+
+Sum and intersection of two spaces are evaluated by the Zassenhaus
+algorithm: the rows `(a | a)` of the first matrix and `(b | 0)` of the
+second one are reduced into one echelon basis of length `2n`. The left
+halves of rows with nonzero left half span the sum, and the right halves
+of the other rows span the intersection.
+"""
+
+from blincodes import matrix
+from blincodes.basis import IncrementalBasis
+
+
+def zassenhaus(matrix_a, matrix_b):
+    """Return bases of sum and intersection of two row spaces.
+
+    :return: tuple (sum_rows, intersection_rows) of tuples of integers,
+             both bases are in the reduced echelon form.
+    """
+    ncolumns = max(matrix_a.ncolumns, matrix_b.ncolumns)
+    stacked = IncrementalBasis(2 * ncolumns)
+    stacked.extend((row.value << ncolumns) | row.value for row in matrix_a)
+    stacked.extend(row.value << ncolumns for row in matrix_b)
+    sum_rows = []
+    intersection_rows = []
+    for row in stacked.rows:
+        if row >> ncolumns:
+            sum_rows.append(row >> ncolumns)
+        else:
+            intersection_rows.append(row)
+    return tuple(sum_rows), tuple(intersection_rows)
+
+
+def union(matrix_a, matrix_b):
+    """Return basis of sum of two row spaces as Matrix."""
+    ncolumns = max(matrix_a.ncolumns, matrix_b.ncolumns)
+    sum_basis = IncrementalBasis(ncolumns, matrix_a)
+    sum_basis.extend(matrix_b)
+    return matrix.Matrix(sum_basis.rows, ncolumns)
+
+
+def intersection(matrix_a, matrix_b):
+    """Return basis of intersection of two row spaces as Matrix."""
+    return matrix.Matrix(
+        zassenhaus(matrix_a, matrix_b)[1],
+        max(matrix_a.ncolumns, matrix_b.ncolumns))
+
+
+def intersection_dimension(matrix_a, matrix_b):
+    """Return dimension of intersection of two row spaces."""
+    return len(zassenhaus(matrix_a, matrix_b)[1])
+
+
+def dual(mat):
+    """Return basis of orthogonal complement of row space as Matrix.
+
+    The basis is read directly from the reduced echelon form: every
+    non-pivot column `f` gives the vector with ones in `f` and in pivots
+    of rows having one in `f`.
+    """
+    return matrix.Matrix(
+        orthogonal_rows(IncrementalBasis(mat.ncolumns, mat)),
+        mat.ncolumns)
+
+
+def hull(mat):
+    """Return basis of intersection of row space and its dual as Matrix."""
+    return matrix.Matrix(
+        zassenhaus(mat, dual(mat))[1],
+        mat.ncolumns)
+
+
+def is_subspace(matrix_a, matrix_b):
+    """Return True if row space of `matrix_a` is subspace of `matrix_b`."""
+    ncolumns = max(matrix_a.ncolumns, matrix_b.ncolumns)
+    basis_b = IncrementalBasis(ncolumns, matrix_b)
+    for row in matrix_a:
+        if basis_b.reduce(row.value):
+            return False
+    return True
+
+
+def is_equal(matrix_a, matrix_b):
+    """Return True if row spaces of two matrices are equal."""
+    ncolumns = max(matrix_a.ncolumns, matrix_b.ncolumns)
+    return (IncrementalBasis(ncolumns, matrix_a).rows ==
+            IncrementalBasis(ncolumns, matrix_b).rows)
+
+
+def orthogonal_rows(row_basis):
+    """Return rows of orthogonal complement of IncrementalBasis.
+
+    :return: list of integers.
+    """
+    ncolumns = row_basis.ncolumns
+    free_mask = ((1 << ncolumns) - 1) ^ row_basis.pivot_mask
+    dual_rows = {}
+    free = free_mask
+    while free:
+        bit = free.bit_length() - 1
+        dual_rows[bit] = 1 << bit
+        free ^= 1 << bit
+    for row in row_basis.rows:
+        pivot = 1 << (row.bit_length() - 1)
+        free = row & free_mask
+        while free:
+            bit = free.bit_length() - 1
+            dual_rows[bit] |= pivot
+            free ^= 1 << bit
+    return [dual_rows[bit] for bit in sorted(dual_rows, reverse=True)]
@@ -0,0 +1,263 @@
+"""Streaming readers and writers of matrices and vectors in text files.
+
+Supported formats:
+
+* lines of '0' and '1' (or other fillers), one vector per line;
+* rows separated by `row_sep`, as in `matrix.from_string`, newlines
+  between rows are ignored;
+* the alist format of sparse matrices (D. MacKay)::
+
+      ncolumns nrows
+      max_column_weight max_row_weight
+      column weights
+      row weights
+      ncolumns lines of 1-based row indices of ones in columns
+      nrows lines of 1-based column indices of ones in rows
+
+  Indices may be padded by zeroes up to the maximal weight.
+
+Files are read by chunks of `chunk_size` lines or characters and every
+row is converted by one call of `int(row, 2)`, fillers are replaced by
+`str.translate` for the whole chunk. Readers yield rows as soon as they
+are read and `read_matrix` keeps only integer rows until the matrix is
+built. A file is a path or a text file object.
+"""
+
+import contextlib
+import itertools
+from blincodes import matrix, sparse, vector
+
+#: Number of lines (or characters for `row_sep` format) read at once.
+CHUNK_SIZE = 1 << 16
+
+
+def iter_vectors(file, zerofillers=None, onefillers=None, row_sep=None,
+                 chunk_size=CHUNK_SIZE):
+    """Iterate over vectors of text file.
+
+    :param: file - path or text file object;
+    :param: list or string `zerofillers` - possible fillers of '0';
+    :param: list or string `onefillers` - possible fillers of '1';
+    :param: str row_sep - separator of rows, by default rows are lines;
+    :param: int chunk_size - number of lines (characters) read at once.
+    """
+    for chunk in _iter_chunks(file, zerofillers, onefillers, row_sep,
+                              chunk_size):
+        for row in chunk:
+            yield vector.Vector(_to_int(row), len(row))
+
+
+def read_matrix(file, zerofillers=None, onefillers=None, row_sep=None,
+                chunk_size=CHUNK_SIZE):
+    """Return Matrix from text file.
+
+    The number of columns is the maximal length of rows as in
+    `matrix.from_string`. See `iter_vectors` for parameters.
+    """
+    values = []
+    ncolumns = 0
+    for chunk in _iter_chunks(file, zerofillers, onefillers, row_sep,
+                              chunk_size):
+        values.extend(map(_to_int, chunk))
+        ncolumns = max(ncolumns, max(map(len, chunk), default=0))
+    return matrix.Matrix(values, ncolumns)
+
+
+def write_vectors(vectors, file, zerofiller=None, onefiller=None,
+                  row_sep='\n'):
+    """Write vectors into text file, every vector ends by `row_sep`.
+
+    :param: vectors - iterable of Vectors, Matrix for example;
+    :param: file - path or text file object;
+    :param: str zerofiller, onefiller - symbols of '0' and '1'.
+    """
+    table = str.maketrans({'0': zerofiller or '0', '1': onefiller or '1'})
+    with _open(file, 'w') as stream:
+        lines = []
+        for vec in vectors:
+            lines.append(format(vec.value, '0{}b'.format(len(vec)))
+                         if len(vec) else '')
+            if len(lines) == CHUNK_SIZE:
+                stream.write(_join(lines, row_sep, table))
+                lines = []
+        if lines:
+            stream.write(_join(lines, row_sep, table))
+
+
+def write_matrix(mat, file, zerofiller=None, onefiller=None, row_sep='\n'):
+    """Write rows of matrix into text file, see `write_vectors`."""
+    write_vectors(mat, file, zerofiller, onefiller, row_sep)
+
+
+def iter_alist(file):
+    """Iterate over supports of rows of matrix in the alist format.
+
+    The first item is the tuple (nrows, ncolumns), the following items are
+    sorted lists of 0-based positions of ones in rows.
+    """
+    with _open(file, 'r') as stream:
+        lines = _iter_lines(stream)
+        ncolumns, nrows = _read_numbers(lines, 2)
+        _read_numbers(lines, 2)
+        _read_numbers(lines, ncolumns)
+        row_weights = _read_numbers(lines, nrows)
+        yield nrows, ncolumns
+        for _ in range(ncolumns):
+            next(lines)
+        for weight in row_weights:
+            support = sorted(index - 1 for index in map(int, next(lines))
+                             if index)
+            if len(support) != weight or (
+                    support and not 0 <= support[0] <= support[-1] <
+                    ncolumns):
+                raise ValueError(
+                    'expected {} positions in range [1, {}], but '
+                    'got {}'.format(weight, ncolumns,
+                                    [i + 1 for i in support]))
+            yield support
+
+
+def read_alist(file, sparse_matrix=False):
+    """Return matrix from file in the alist format.
+
+    :param: file - path or text file object;
+    :param: bool sparse_matrix - if True then SparseMatrix is returned,
+                                 else Matrix.
+    """
+    rows = iter_alist(file)
+    _, ncolumns = next(rows)
+    if sparse_matrix:
+        return sparse.SparseMatrix(rows, ncolumns)
+    return matrix.Matrix(
+        (vector.from_support(ncolumns, support).value for support in rows),
+        ncolumns)
+
+
+def write_alist(mat, file):
+    """Write Matrix or SparseMatrix into file in the alist format."""
+    if not isinstance(mat, sparse.SparseMatrix):
+        mat = sparse.from_matrix(mat)
+    nrows, ncolumns = mat.shapes
+    row_weights = mat.row_weights
+    column_weights = mat.column_weights
+    max_row = max(row_weights, default=0)
+    max_column = max(column_weights, default=0)
+    with _open(file, 'w') as stream:
+        stream.write('{} {}\n{} {}\n'.format(ncolumns, nrows,
+                                             max_column, max_row))
+        stream.write(' '.join(map(str, column_weights)) + '\n')
+        stream.write(' '.join(map(str, row_weights)) + '\n')
+        for index in range(ncolumns):
+            stream.write(_alist_line(mat.column(index), max_column))
+        for index in range(nrows):
+            stream.write(_alist_line(mat.row(index), max_row))
+
+
+@contextlib.contextmanager
+def _open(file, mode):
+    """Open path or pass text file object through."""
+    if isinstance(file, (str, bytes)) or hasattr(file, '__fspath__'):
+        with open(file, mode) as stream:
+            yield stream
+    else:
+        yield file
+
+
+def _iter_chunks(file, zerofillers, onefillers, row_sep, chunk_size):
+    """Iterate over lists of cleaned strings of rows."""
+    clean = _make_cleaner(zerofillers, onefillers)
+    with _open(file, 'r') as stream:
+        if row_sep is None:
+            while True:
+                lines = list(itertools.islice(stream, chunk_size))
+                if not lines:
+                    return
+                yield _split_rows(clean(''.join(lines)), '\n')
+        tail = ''
+        while True:
+            block = stream.read(chunk_size)
+            text = tail + block
+            end = text.rfind(row_sep) if block else len(text)
+            if end < 0:
+                tail = text
+                continue
+            tail = text[end + len(row_sep):]
+            yield _split_rows(clean(text[:end]), row_sep)
+            if not block:
+                return
+
+
+def _split_rows(text, row_sep):
+    """Return list of non-empty rows of text without whitespaces."""
+    if row_sep != '\n':
+        text = text.replace('\n', '')
+    rows = text.split(row_sep)
+    if ' ' in text or '\t' in text or '\r' in text:
+        rows = (''.join(row.split()) for row in rows)
+    return [row for row in rows if row]
+
+
+def _make_cleaner(zerofillers, onefillers):
+    """Return function replacing fillers in string by '0' and '1'."""
+    replaces = []
+    for fillers, symbol in ((zerofillers, '0'), (onefillers, '1')):
+        if isinstance(fillers, str):
+            fillers = [fillers]
+        replaces.extend((filler, symbol) for filler in fillers or ())
+    for filler, _ in replaces:
+        if not isinstance(filler, str):
+            raise TypeError(
+                'expected filler is string, '
+                'but got `{}` is {}'.format(filler, type(filler)))
+    if not replaces:
+        return lambda string: string
+    if all(len(filler) == 1 for filler, _ in replaces):
+        table = str.maketrans(dict(replaces))
+        return lambda string: string.translate(table)
+
+    def clean(string):
+        """Replace fillers one by one."""
+        for filler, symbol in replaces:
+            string = string.replace(filler, symbol)
+        return string
+    return clean
+
+
+def _to_int(row):
+    """Return integer value of cleaned string of row."""
+    try:
+        return int(row, 2)
+    except ValueError:
+        raise ValueError(
+            'cannot convert string `{}` to binary vector'.format(row))
+
+
+def _join(lines, row_sep, table):
+    """Return text of lines each ended by `row_sep`."""
+    return (row_sep.join(lines) + row_sep).translate(table)
+
+
+def _iter_lines(stream):
+    """Iterate over lists of tokens of non-empty lines."""
+    for line in stream:
+        tokens = line.split()
+        if tokens:
+            yield tokens
+
+
+def _read_numbers(lines, count):
+    """Return list of `count` integers read from lines."""
+    numbers = []
+    while len(numbers) < count:
+        numbers.extend(map(int, next(lines)))
+    if len(numbers) != count:
+        raise ValueError(
+            'expected {} numbers, but got {}'.format(count, len(numbers)))
+    return numbers
+
+
+def _alist_line(support, width):
+    """Return line of 1-based indices padded by zeroes."""
+    indices = [index + 1 for index in support]
+    indices.extend([0] * (width - len(indices)))
+    return ' '.join(map(str, indices)) + '\n'
@@ -91,6 +91,18 @@ class Vector():
         self._len = length
         return self
 
+    def set_value(self, value):
+        """Change value of a vector, the length is not changed.
+
+        10011.set_value(0b110) -> 00110
+        10011.set_value(0b1100110) -> 00110
+        """
+        if not isinstance(value, int):
+            raise TypeError('expected `value` is integer, not {}'
+                            ''.format(type(value)))
+        self._vector = value & ((1 << self._len) - 1)
+        return self
+
     def resize(self, delta_length):
         """Change size of vector by 'delta_length'."""
         if not isinstance(delta_length, int):
@@ -126,6 +138,31 @@ class Vector():
             str_vec = str_vec.replace("0", zerofiller)
         return str_vec
 
+    def to_bytes(self, bit_order='big'):
+        """Return packed bits of vector as bytes.
+
+        The element `i` is the bit `7 - i % 8` (`i % 8` for `bit_order`
+        'little') of the byte `i // 8`, unused bits are zeroes. It is
+        the layout of `numpy.packbits`.
+        """
+        nbytes = -(-self._len // 8)
+        if _check_bit_order(bit_order) == 'big':
+            return (self._vector << (8 * nbytes - self._len)).to_bytes(
+                nbytes, 'big')
+        return reverse_bits(self._vector, self._len).to_bytes(
+            nbytes, 'little')
+
+    def to_numpy(self):
+        """Return `numpy` array of elements with dtype uint8."""
+        import numpy
+        return numpy.unpackbits(
+            numpy.frombuffer(self.to_bytes(), dtype=numpy.uint8),
+            count=self._len)
+
+    def __reduce__(self):
+        """Return compact state for `pickle`: value and length."""
+        return self.__class__, (self._vector, self._len)
+
     def concatenate(self, other):
         """Concatenate of two vectors."""
         self._vector = (self.value << (len(other))) ^ other.value
@@ -441,15 +478,9 @@ def from_iterable(value, zerofillers=None, onefillers=None):
     (('110**|0_1', True, False, 0, 1 ,10, [1, 2] , []),
         zerofillers=['*', '_'], onefillers='|') -> 1100010011001110
     """
-    vector = ''
     try:
-        for i in value:
-            if isinstance(i, str):
-                vector += i
-            elif i:
-                vector += '1'
-            else:
-                vector += '0'
+        vector = ''.join(i if isinstance(i, str) else '1' if i else '0'
+                         for i in value)
     except TypeError:
         raise TypeError(
             'expected `value` has any iterable type, got {}'
@@ -459,6 +490,46 @@ def from_iterable(value, zerofillers=None, onefillers=None):
                        onefillers=onefillers)
 
 
+def from_bytes(data, length=None, bit_order='big'):
+    """Return vector from packed bits.
+
+    :param: data - bytes or any object supporting the buffer protocol,
+                   for example bytearray, memoryview or `numpy` array;
+    :param: int `length` - length of the vector, by default all bits;
+    :param: str `bit_order` - 'big' or 'little', see `Vector.to_bytes`.
+    """
+    data = memoryview(data).cast('B')
+    nbits = 8 * len(data)
+    if length is None:
+        length = nbits
+    if not 0 <= length <= nbits:
+        raise ValueError(
+            'expected `length` is in range [0, {}], but '
+            'got {}'.format(nbits, length))
+    if _check_bit_order(bit_order) == 'big':
+        return Vector(int.from_bytes(data, 'big') >> (nbits - length),
+                      length)
+    return Vector(reverse_bits(int.from_bytes(data, 'little'), length),
+                  length)
+
+
+def from_numpy(array):
+    """Return vector from one-dimensional `numpy` array.
+
+    Nonzero elements are ones, bool and uint8 arrays are packed by
+    `numpy.packbits` without conversion of elements to Python objects.
+    """
+    import numpy
+    array = numpy.asarray(array)
+    if array.ndim != 1:
+        raise ValueError(
+            'expected one-dimensional array, but got array of '
+            'dimension {}'.format(array.ndim))
+    if array.dtype not in (numpy.bool_, numpy.uint8):
+        array = array != 0
+    return from_bytes(numpy.packbits(array), len(array))
+
+
 def hamming_distance(vector_a, vector_b):
     """Return Hamming distance between vectors."""
     return (vector_a + vector_b).hamming_weight
@@ -476,6 +547,14 @@ def concatenate(first, second):
         len(first) + len(second))
 
 
+def reverse_bits(value, nbits):
+    """Return integer with reversed order of `nbits` lower bits."""
+    if not nbits:
+        return 0
+    return int(format(value & ((1 << nbits) - 1),
+                      '0{}b'.format(nbits))[::-1], 2)
+
+
 def __clear_str_from_fillers(string, symbol, filler):
     """Replace all occurrence of `filler` in `string` with `symbol`."""
     if not filler:
@@ -496,3 +575,12 @@ def __clear_str_from_fillers(string, symbol, filler):
                 'expected filler is string, '
                 'but got `{}` is {}'.format(filler, type(filler)))
     return string
+
+
+def _check_bit_order(bit_order):
+    """Return `bit_order` if it is 'big' or 'little'."""
+    if bit_order not in ('big', 'little'):
+        raise ValueError(
+            "expected `bit_order` is 'big' or 'little', but "
+            "got {!r}".format(bit_order))
+    return bit_order
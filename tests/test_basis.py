@@ -0,0 +1,88 @@
+"""Unit tests for basis module."""
+
+import unittest
+from blincodes.basis import IncrementalBasis
+from blincodes.matrix import Matrix
+from blincodes.vector import Vector
+
+
+class IncrementalBasisTestCase(unittest.TestCase):
+    """Test to build basis row by row."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.rows = [
+            0b1111111111111111,
+            0b1111111100000000,
+            0b0000000011111111,
+            0b0000111100001111,
+            0b1111000000001111,
+            0b0110011001100110,
+            0b0011001100110011,
+            0b1010101010101010,
+            0b0101010101010101,
+        ]
+        self.diagonal_form = [
+            0b1001011001101001,
+            0b0101010101010101,
+            0b0011001100110011,
+            0b0000111100001111,
+            0b0000000011111111,
+        ]
+
+    def test_insert(self):
+        """Test to insert independent and dependent rows."""
+        row_basis = IncrementalBasis(16)
+        self.assertTrue(row_basis.insert(self.rows[0]))
+        self.assertTrue(row_basis.insert(Vector(self.rows[1], 16)))
+        self.assertFalse(row_basis.insert(self.rows[2]))
+        self.assertTrue(row_basis.insert(self.rows[3]))
+        self.assertFalse(row_basis.insert(self.rows[0]))
+        self.assertFalse(row_basis.insert(0))
+        self.assertEqual(row_basis.rank, 3)
+        self.assertEqual(len(row_basis), 3)
+        with self.assertRaises(TypeError):
+            row_basis.insert('1010')
+
+    def test_reduced_form(self):
+        """Test the basis is the diagonal form of the rows."""
+        row_basis = IncrementalBasis(16, self.rows)
+        self.assertEqual(row_basis.rank, 5)
+        self.assertEqual(list(row_basis.rows), self.diagonal_form)
+        self.assertEqual(list(row_basis), self.diagonal_form)
+        self.assertEqual(row_basis.pivots, [0, 1, 2, 4, 8])
+        self.assertEqual(row_basis.pivot_mask, 0b1110100010000000)
+        self.assertEqual(
+            Matrix(row_basis.rows, 16),
+            Matrix([row.value for row in Matrix(self.rows, 16).diagonal_form
+                    if row.value], 16))
+
+    def test_membership(self):
+        """Test to check the membership and reduce rows."""
+        row_basis = IncrementalBasis(16, self.rows[:3])
+        self.assertIn(self.rows[1] ^ self.rows[2], row_basis)
+        self.assertNotIn(self.rows[3], row_basis)
+        self.assertEqual(row_basis.reduce(self.rows[0]), 0)
+        self.assertEqual(row_basis.reduce(self.rows[3]), self.rows[3])
+
+    def test_extend_early_exit(self):
+        """Test to stop extending when the rank is reached."""
+        row_basis = IncrementalBasis(16)
+        self.assertEqual(row_basis.extend(self.rows, max_rank=3), 3)
+        self.assertEqual(row_basis.rank, 3)
+        self.assertEqual(row_basis.extend(self.rows, max_rank=3), 0)
+        full = IncrementalBasis(3, [0b100, 0b110, 0b111, 0b001])
+        self.assertTrue(full.is_full)
+        self.assertEqual(full.rows, (0b100, 0b010, 0b001))
+
+    def test_copy(self):
+        """Test to copy basis."""
+        row_basis = IncrementalBasis(16, self.rows[:2])
+        other = row_basis.copy()
+        other.insert(self.rows[3])
+        self.assertEqual(row_basis.rank, 2)
+        self.assertEqual(other.rank, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Unit tests for binary module."""
+
+import io
+import os
+import tempfile
+import unittest
+from blincodes import binary, matrix
+from blincodes.vector import Vector
+
+
+class BinaryFormatTestCase(unittest.TestCase):
+    """Test to save and load matrices in the binary format."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.matr = matrix.from_string(
+            '1100101110001;'
+            '0101000000011;'
+            '1111111111111;'
+            '0000000000001'
+        )
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'matrix.bin')
+
+    def tearDown(self):
+        """Remove temporary files."""
+        self.directory.cleanup()
+
+    def test_dumps(self):
+        """Test to pack matrix into bytes."""
+        data = binary.dumps(self.matr)
+        self.assertEqual(len(data), binary.HEADER_SIZE + 4 * 8)
+        self.assertEqual(data[:4], binary.MAGIC)
+        self.assertEqual(data[32:40], bytes([0b11001011, 0b10001000]) +
+                         bytes(6))
+        little = binary.dumps(self.matr, bit_order='little')
+        self.assertEqual(little[32:40], bytes([0b11010011, 0b00010001]) +
+                         bytes(6))
+        for data in (binary.dumps(self.matr), little):
+            self.assertEqual(binary.loads(data), self.matr)
+        self.assertEqual(binary.loads(binary.dumps(matrix.Matrix())),
+                         matrix.Matrix())
+        self.assertEqual(binary.row_stride(64), 8)
+        self.assertEqual(binary.row_stride(65), 16)
+        wide = matrix.random(5, 130)
+        self.assertEqual(binary.loads(binary.dumps(wide, 'little')), wide)
+        self.assertEqual(binary.loads(binary.dumps(matrix.Matrix())),
+                         matrix.Matrix())
+
+    def test_save_load(self):
+        """Test to save and load matrix by path and file object."""
+        binary.save(self.matr, self.path)
+        self.assertEqual(binary.load(self.path), self.matr)
+        stream = io.BytesIO()
+        binary.save(self.matr, stream, 'little')
+        stream.seek(0)
+        self.assertEqual(binary.load(stream), self.matr)
+
+    def test_mapped(self):
+        """Test to read rows of memory-mapped matrix."""
+        binary.save(self.matr, self.path, 'little')
+        with binary.MappedMatrix(self.path) as mapped:
+            self.assertEqual(mapped.shapes, (4, 13))
+            self.assertEqual(mapped.bit_order, 'little')
+            self.assertEqual(mapped.stride, 8)
+            self.assertEqual(len(mapped), 4)
+            self.assertEqual(mapped[1], self.matr[1])
+            self.assertEqual(mapped.row(-1), 1)
+            self.assertEqual(mapped.rows(1, 3),
+                             [self.matr[1].value, self.matr[2].value])
+            self.assertEqual(mapped[::2], matrix.Matrix(
+                [self.matr[0].value, self.matr[2].value], 13))
+            self.assertEqual(list(mapped), list(self.matr))
+            self.assertEqual(mapped.to_matrix(), self.matr)
+            with self.assertRaises(IndexError):
+                mapped.row(4)
+            with self.assertRaises(TypeError):
+                mapped.set_row(0, 0)
+
+    def test_packed(self):
+        """Test to read and write rows of matrix in buffer."""
+        packed = binary.PackedMatrix(binary.dumps(self.matr))
+        self.assertEqual(packed.to_matrix(), self.matr)
+        self.assertEqual(packed[2], self.matr[2])
+        with self.assertRaises(TypeError):
+            packed.set_row(0, 0)
+        with self.assertRaises(TypeError):
+            binary.PackedMatrix(binary.dumps(self.matr), writable=True)
+        data = bytearray(binary.dumps(self.matr))
+        with binary.PackedMatrix(data, writable=True) as packed:
+            packed.set_row(0, 1)
+        self.assertEqual(binary.loads(data)[0], Vector(1, 13))
+
+    def test_create(self):
+        """Test to create and write memory-mapped matrix."""
+        with binary.create(self.path, 3, 70) as mapped:
+            self.assertEqual(mapped.to_matrix(), matrix.zero(3, 70))
+            mapped.set_row(1, Vector(1 << 69 | 5, 70))
+            mapped.set_row(-1, 7)
+        self.assertEqual(binary.load(self.path),
+                         matrix.Matrix([0, 1 << 69 | 5, 7], 70))
+
+    def test_errors(self):
+        """Test to reject broken data."""
+        data = binary.dumps(self.matr)
+        with self.assertRaises(ValueError):
+            binary.loads(data[:40])
+        with self.assertRaises(ValueError):
+            binary.loads(b'XXXX' + data[4:])
+        with self.assertRaises(ValueError):
+            binary.loads(data[:10])
+        with self.assertRaises(ValueError):
+            binary.dumps(self.matr, bit_order='middle')
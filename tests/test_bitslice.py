@@ -0,0 +1,89 @@
+"""Unit tests for bitslice module."""
+
+import random
+import unittest
+from blincodes import bitslice, matrix
+
+
+class MatrixBatchTestCase(unittest.TestCase):
+    """Test to evaluate bit-sliced batches of matrices."""
+
+    def setUp(self):
+        """Set the test value."""
+        rng = random.Random(0)
+        self.mats = [
+            matrix.Matrix([rng.getrandbits(9) & rng.getrandbits(9)
+                           for _ in range(6)], 9)
+            for _ in range(70)]
+        self.mats[0] = matrix.Matrix([0] * 6, 9)
+        self.mats[1] = matrix.from_string(
+            '110010111;'
+            '010100000;'
+            '100110111;'
+            '000000001;'
+            '110010110;'
+            '001000000'
+        )
+        self.batch = bitslice.from_matrices(self.mats)
+
+    def test_convert(self):
+        """Test to convert batch from and to matrices."""
+        self.assertEqual(self.batch.size, 70)
+        self.assertEqual(len(self.batch), 70)
+        self.assertEqual(self.batch.shapes, (6, 9))
+        self.assertEqual(self.batch.to_matrices(), self.mats)
+        self.assertEqual(list(self.batch), self.mats)
+        self.assertEqual(self.batch[1], self.mats[1])
+        self.assertEqual(self.batch[-1], self.mats[-1])
+        self.assertEqual(self.batch.words[0][0] >> 1 & 1, 1)
+        self.assertEqual(bitslice.from_matrix(self.mats[1], 3).to_matrices(),
+                         [self.mats[1]] * 3)
+        self.assertEqual(bitslice.from_matrices([]), bitslice.MatrixBatch())
+        with self.assertRaises(IndexError):
+            self.batch[70]
+        with self.assertRaises(ValueError):
+            bitslice.from_matrices([self.mats[1], matrix.identity(9)])
+
+    def test_rank(self):
+        """Test to evaluate ranks of matrices."""
+        self.assertEqual(self.batch.rank, [mat.rank for mat in self.mats])
+        self.assertEqual(self.batch.rank[:2], [0, 4])
+
+    def test_elimination(self):
+        """Test to evaluate echelon forms and Gaussian eliminations."""
+        self.assertEqual(self.batch.echelon_form.to_matrices(),
+                         [mat.echelon_form for mat in self.mats])
+        for columns in (None, [0, 3, 4, 8]):
+            for sort in (True, False):
+                self.assertEqual(
+                    self.batch.gaussian_elimination(columns,
+                                                    sort).to_matrices(),
+                    [mat.gaussian_elimination(columns, sort)
+                     for mat in self.mats])
+
+    def test_multiply(self):
+        """Test to multiply batches of matrices."""
+        rng = random.Random(1)
+        others = [matrix.Matrix([rng.getrandbits(5) for _ in range(9)], 5)
+                  for _ in range(70)]
+        self.assertEqual(
+            (self.batch * bitslice.from_matrices(others)).to_matrices(),
+            [mat * other for mat, other in zip(self.mats, others)])
+        self.assertEqual((self.batch * others[0]).to_matrices(),
+                         [mat * others[0] for mat in self.mats])
+        with self.assertRaises(ValueError):
+            self.batch * self.batch
+        with self.assertRaises(ValueError):
+            self.batch * bitslice.from_matrices(others[:3])
+
+    def test_random(self):
+        """Test to generate batch of random matrices."""
+        batch = bitslice.random(100, 4, 7, rng=random.Random(2))
+        self.assertEqual((batch.size, batch.shapes), (100, (4, 7)))
+        self.assertEqual(batch, bitslice.random(100, 4, 7,
+                                                rng=random.Random(2)))
+        self.assertEqual(batch.rank, [mat.rank for mat in batch])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""Unit tests for bp module."""
+
+import random
+import unittest
+from blincodes import matrix
+from blincodes.codes.bp import BeliefPropagation
+from blincodes.sparse import SparseMatrix
+from blincodes.vector import Vector
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BeliefPropagationTestCase(unittest.TestCase):
+    """Test to decode by iterative decoders."""
+
+    def setUp(self):
+        """Set the test value: Gallager (3, 6)-regular code."""
+        rng = random.Random(36)
+        ncolumns = 48
+        rows = []
+        for layer in range(3):
+            permutation = list(range(ncolumns))
+            if layer:
+                rng.shuffle(permutation)
+            for i in range(0, ncolumns, 6):
+                rows.append(permutation[i:i + 6])
+        self.parity_check = SparseMatrix(rows, ncolumns)
+        self.decoder = BeliefPropagation(self.parity_check)
+        self.errors = (5, 30)
+
+    def test_init(self):
+        """Test to build Tanner graph."""
+        self.assertEqual(self.decoder.n, 48)
+        self.assertEqual(self.decoder.nchecks, 24)
+        self.assertEqual(self.decoder.nedges, 144)
+        decoder = BeliefPropagation(matrix.Matrix([0b1101, 0b0111], 4))
+        self.assertEqual(decoder.nedges, 6)
+        with self.assertRaises(TypeError):
+            BeliefPropagation([[0, 1]])
+
+    def test_soft_decoding(self):
+        """Test to decode by sum-product and min-sum algorithms."""
+        frame = [3.0] * 48
+        for position in self.errors:
+            frame[position] = -1.0
+        zero = Vector(0, 48)
+        for decoder in (self.decoder,
+                        BeliefPropagation(self.parity_check,
+                                          vectorized=False)):
+            for decoded in (decoder.sum_product([frame, [2.0] * 48]),
+                            decoder.min_sum([frame, [2.0] * 48]),
+                            decoder.min_sum([frame, [2.0] * 48],
+                                            scale=0.75)):
+                self.assertEqual(decoded, [zero, zero])
+            unsolved = decoder.sum_product([frame], max_iterations=0)
+            self.assertEqual(unsolved[0].support, list(self.errors))
+            self.assertEqual(decoder.sum_product([]), [])
+            with self.assertRaises(ValueError):
+                decoder.sum_product([[1.0] * 47])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_vectorized(self):
+        """Test to decode batch by numpy arrays as frame by frame."""
+        rng = random.Random(1)
+        frames = [[rng.gauss(2.0, 1.5) for _ in range(48)]
+                  for _ in range(40)]
+        frames[0][3] = 0.0
+        python_decoder = BeliefPropagation(self.parity_check,
+                                           vectorized=False)
+        for method, args in (('sum_product', ()), ('min_sum', (20, 0.75))):
+            decoded = getattr(self.decoder, method)(frames, *args)
+            self.assertEqual(
+                decoded, getattr(python_decoder, method)(frames, *args))
+        decoder = BeliefPropagation(matrix.Matrix([0b1100, 0b0000], 4))
+        self.assertEqual(decoder.min_sum([[-1.0, 2.0, 2.0, -3.0]]),
+                         [Vector(0b0001, 4)])
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_vectorized_bit_flipping(self):
+        """Test to decode batch by bit flipping as frame by frame."""
+        rng = random.Random(2)
+        words = [Vector(0, 48), 0]
+        for weight in (1, 2, 3, 4, 8):
+            for _ in range(10):
+                words.append(Vector(sum(1 << i for i in rng.sample(
+                    range(48), weight)), 48))
+        python_decoder = BeliefPropagation(self.parity_check,
+                                           vectorized=False)
+        for max_iterations in (0, 1, 3, 50):
+            self.assertEqual(
+                self.decoder.bit_flipping(words, max_iterations),
+                python_decoder.bit_flipping(words, max_iterations))
+        parity_check = matrix.Matrix([0b1100, 0b0000], 4)
+        words = [0b1001, 0b1100, 0b0001]
+        self.assertEqual(
+            BeliefPropagation(parity_check).bit_flipping(words, 5),
+            BeliefPropagation(parity_check,
+                              vectorized=False).bit_flipping(words, 5))
+
+    def test_bit_flipping(self):
+        """Test to decode by bit-flipping algorithm."""
+        word = Vector(1 << (47 - self.errors[0]), 48)
+        self.assertEqual(self.decoder.bit_flipping([word, 0]),
+                         [Vector(0, 48), Vector(0, 48)])
@@ -0,0 +1,64 @@
+"""Unit tests for keygen module."""
+
+import random
+import unittest
+from blincodes import matrix
+from blincodes.codes import keygen, rm, tools
+
+
+class KeyGenerationTestCase(unittest.TestCase):
+    """Test to generate keys of McEliece and Niederreiter cryptosystems."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.rng = random.Random(41)
+        self.generator = rm.generator(2, 5)
+
+    def test_permute_columns(self):
+        """Test to permute columns without permutation matrix."""
+        permutation = keygen.random_permutation(32, self.rng)
+        self.assertEqual(sorted(permutation), list(range(32)))
+        self.assertEqual(
+            keygen.permute_columns(self.generator, permutation),
+            self.generator * matrix.permutation(permutation))
+
+    def test_random_scrambler(self):
+        """Test to generate nonsingular matrices."""
+        for size in (0, 1, 7, 40):
+            scrambler = keygen.random_scrambler(size, self.rng)
+            self.assertEqual(scrambler.shapes, (size, size))
+            self.assertEqual(scrambler.rank, size)
+
+    def test_systematic_keys(self):
+        """Test to generate systematic public keys."""
+        for secret in (self.generator, rm.parity_check(2, 5)):
+            keys = keygen.mceliece(secret, self.rng)
+            self.assertIsNone(keys.scrambler)
+            self.assertEqual(keys.secret, secret)
+            self.assertEqual(
+                keys.public.submatrix(range(secret.nrows)),
+                matrix.identity(secret.nrows))
+            permuted = keygen.permute_columns(secret, keys.permutation)
+            self.assertTrue(tools.is_subcode(keys.public, permuted))
+            self.assertTrue(tools.is_subcode(permuted, keys.public))
+        keys = keygen.niederreiter(rm.parity_check(1, 4), self.rng)
+        self.assertEqual(repr(keys), 'KeyPair(shapes=(11, 16), '
+                                     'systematic=True)')
+
+    def test_scrambled_keys(self):
+        """Test to generate public keys S * G * P."""
+        keys = keygen.mceliece(self.generator, self.rng,
+                               systematic_key=False)
+        self.assertEqual(
+            keys.public,
+            keys.scrambler * keygen.permute_columns(self.generator,
+                                                    keys.permutation))
+
+    def test_generate_keys(self):
+        """Test to generate keys in bulk."""
+        keys = keygen.generate_keys(self.generator, 3, seed=1)
+        parallel = keygen.generate_keys(self.generator, 3, seed=1,
+                                        processes=2)
+        self.assertEqual([key.public for key in keys],
+                         [key.public for key in parallel])
+        self.assertNotEqual(keys[0].permutation, keys[1].permutation)
@@ -0,0 +1,180 @@
+"""Unit tests for codes.linear module."""
+
+import unittest
+from blincodes import matrix
+from blincodes.matrix import Matrix
+from blincodes.vector import Vector
+from blincodes.codes import rm, tools
+from blincodes.codes.linear import LinearCode
+
+
+class LinearCodeInvariantsTestCase(unittest.TestCase):
+    """Test to evaluate invariants of code."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.rm14_add = Matrix([
+            0b1111111111111111,
+            0b1111111100000000,
+            0b0000000011111111,
+            0b0000111100001111,
+            0b1111000000001111,
+            0b0110011001100110,
+            0b0011001100110011,
+            0b1010101010101010,
+            0b0101010101010101,
+        ], 16)
+        self.rm14_generator = Matrix([
+            0b1001011001101001,
+            0b0101010101010101,
+            0b0011001100110011,
+            0b0000111100001111,
+            0b0000000011111111,
+        ], 16)
+        self.code = LinearCode(self.rm14_add)
+
+    def test_shapes(self):
+        """Test to evaluate length and dimension."""
+        self.assertEqual(self.code.n, 16)
+        self.assertEqual(self.code.k, 5)
+        self.assertEqual(repr(self.code), 'LinearCode(n=16, k=5)')
+
+    def test_generator(self):
+        """Test to evaluate generator and systematic form."""
+        self.assertEqual(self.code.generator, self.rm14_generator)
+        self.assertEqual(self.code.systematic_form, self.rm14_generator)
+        self.assertEqual(self.code.information_set, [0, 1, 2, 4, 8])
+        self.assertTrue(self.code.systematic_form.submatrix(
+            self.code.information_set).is_identity())
+
+    def test_parity_check(self):
+        """Test to evaluate parity check and dual code."""
+        parity_check = self.code.parity_check
+        self.assertEqual(parity_check.nrows, 11)
+        self.assertTrue((self.code.generator * parity_check.T).is_zero())
+        dual = self.code.dual
+        self.assertEqual(dual, LinearCode(rm.generator(2, 4)))
+        self.assertIs(dual.dual, self.code)
+        self.assertEqual(dual.parity_check, self.code.generator)
+
+    def test_spectrum(self):
+        """Test to evaluate spectrum and minimum distance."""
+        spectrum = {i: 0 for i in range(17)}
+        spectrum.update({0: 1, 8: 30, 16: 1})
+        self.assertEqual(self.code.spectrum, spectrum)
+        self.assertEqual(self.code.minimum_distance, 8)
+        dual = self.code.dual
+        self.assertEqual(dual.spectrum, tools.spectrum(rm.generator(2, 4)))
+        self.assertEqual(dual.minimum_distance, 4)
+        big = LinearCode(rm.generator(3, 5))
+        self.assertEqual(big.spectrum, tools.macwilliams(
+            tools.spectrum(rm.generator(1, 5)), 6))
+        self.assertEqual(big.minimum_distance, 4)
+
+    def test_spectrum_trivial(self):
+        """Test to evaluate spectrum of codes of dimension 0 and n."""
+        full = LinearCode(matrix.Matrix([0b1000, 0b0100, 0b0010, 0b0001], 4))
+        self.assertEqual(full.k, 4)
+        self.assertEqual(full.spectrum, {0: 1, 1: 4, 2: 6, 3: 4, 4: 1})
+        self.assertEqual(full.minimum_distance, 1)
+        zero = LinearCode(matrix.Matrix([0], 4))
+        self.assertEqual(zero.k, 0)
+        self.assertEqual(zero.spectrum, {0: 1, 1: 0, 2: 0, 3: 0, 4: 0})
+        self.assertEqual(zero.minimum_distance, 0)
+        self.assertEqual(full.dual.spectrum, zero.spectrum)
+        product = LinearCode(rm.generator(1, 4)).hadamard_product(
+            LinearCode(rm.generator(3, 4)))
+        self.assertEqual(product.k, 16)
+        self.assertEqual(product.spectrum[1], 16)
+        self.assertEqual(product.minimum_distance, 1)
+        self.assertEqual(tools.spectrum(matrix.Matrix(), 3),
+                         {0: 1, 1: 0, 2: 0, 3: 0})
+        self.assertEqual(tools.macwilliams({0: 1}, 0, 3),
+                         {0: 1, 1: 3, 2: 3, 3: 1})
+
+    def test_encode_and_syndrome(self):
+        """Test to encode messages and evaluate syndromes."""
+        for message in range(32):
+            word = self.code.encode(Vector(message, 5))
+            self.assertIn(word, self.code)
+            self.assertEqual(
+                word.to_str()[0] + word.to_str()[1] + word.to_str()[2] +
+                word.to_str()[4] + word.to_str()[8],
+                Vector(message, 5).to_str())
+            self.assertEqual(self.code.syndrome(word), Vector(0, 11))
+            self.assertEqual(self.code.recover(word), Vector(message, 5))
+        error = Vector(0b0100000000000000, 16)
+        self.assertNotIn(error, self.code)
+        self.assertEqual(
+            self.code.syndrome(self.code.encode(0b10110) + error),
+            self.code.syndrome(error))
+        self.assertEqual(
+            self.code.syndrome(error),
+            tools.syndrome(self.code.parity_check, error))
+
+
+class LinearCodeConstructionsTestCase(unittest.TestCase):
+    """Test to construct new codes."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.rm14 = LinearCode(rm.generator(1, 4))
+        self.rm24 = LinearCode(rm.generator(2, 4))
+        self.random = LinearCode(matrix.random(6, 16))
+
+    def test_puncture_and_truncate(self):
+        """Test to puncture and truncate code."""
+        columns = (0, 4, 8, 9, 15)
+        for code in (self.rm24, self.random):
+            self.assertEqual(
+                code.puncture(columns).generator,
+                tools.puncture(code.generator, columns))
+            self.assertEqual(
+                code.puncture(columns, remove_zeroes=True).generator,
+                tools.puncture(code.generator, columns, remove_zeroes=True))
+            self.assertEqual(
+                code.truncate(columns).generator,
+                tools.truncate(code.generator, columns))
+        truncated = self.rm24.truncate([0, 1, 2, 3], remove_zeroes=True)
+        self.assertEqual(truncated.n, 12)
+        self.assertEqual(truncated.k, 11 - 4)
+
+    def test_inherited_dual(self):
+        """Test modified codes of code with known dual get dual codes."""
+        columns = (0, 4, 8, 9, 15)
+        for code in (self.rm24, self.random):
+            code.dual
+            for remove_zeroes in (False, True):
+                for modified in (code.puncture(columns, remove_zeroes),
+                                 code.truncate(columns, remove_zeroes)):
+                    self.assertIsNotNone(modified._dual)
+                    self.assertIs(modified.dual.dual, modified)
+                    self.assertEqual(
+                        modified.dual,
+                        LinearCode(modified.generator).dual)
+                    for row in modified.basis.rows:
+                        self.assertFalse(modified.syndrome(row).value)
+        self.assertIsNone(self.rm14.puncture(columns)._dual)
+
+    def test_hull_union_intersection(self):
+        """Test to evaluate hull, union and intersection of codes."""
+        self.assertEqual(self.rm24.hull(), self.rm14)
+        hull = self.random.hull()
+        self.assertEqual(hull.dual, LinearCode(hull.generator).dual
+                         if hull.k else LinearCode(matrix.identity(16)))
+        self.assertEqual(self.rm24.hull().parity_check,
+                         self.rm24.generator)
+        self.assertEqual(self.rm14.union(self.random),
+                         self.random.union(self.rm14))
+        self.assertEqual(self.rm14.union(self.rm24), self.rm24)
+        self.assertEqual(self.rm24.intersection(self.rm14), self.rm14)
+        self.assertEqual(self.rm14.hadamard_product(), self.rm24)
+        self.assertEqual(self.rm14.hadamard_product(self.rm24),
+                         LinearCode(rm.generator(3, 4)))
+        self.assertTrue(self.rm14.is_subcode(self.rm24))
+        self.assertFalse(self.rm24.is_subcode(self.rm14))
+        self.assertNotEqual(self.rm14, self.rm24)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+"""Unit tests for ml module."""
+
+import random
+import unittest
+from blincodes.codes import ml, rm, tools
+from blincodes.vector import Vector
+
+
+class MaximumLikelihoodTestCase(unittest.TestCase):
+    """Test to decode by exhaustive search."""
+
+    def setUp(self):
+        """Set the test value: RM(1, 5) code."""
+        self.generator = rm.generator(1, 5)
+        self.codewords = [word.value
+                          for word in tools.iter_codewords(self.generator)]
+
+    def test_decode(self):
+        """Test to find the nearest codewords."""
+        rng = random.Random(40)
+        words = [rng.getrandbits(32) for _ in range(20)]
+        for radius, chunk_size in ((-1, 7), (7, 1024)):
+            decoded = ml.decode(self.generator, words, radius=radius,
+                                chunk_size=chunk_size)
+            for word, codeword in zip(words, decoded):
+                self.assertIn(codeword.value, self.codewords)
+                self.assertEqual(
+                    bin(codeword.value ^ word).count('1'),
+                    min(bin(value ^ word).count('1')
+                        for value in self.codewords))
+
+    def test_unique_decoding(self):
+        """Test to stop search within radius of unique decoding."""
+        codeword = self.codewords[21]
+        word = codeword ^ 0b10010000000000000000000100100001
+        self.assertEqual(
+            ml.decode(self.generator, [Vector(word, 32), codeword, 0],
+                      radius=7),
+            [Vector(codeword, 32), Vector(codeword, 32), Vector(0, 32)])
+        self.assertEqual(ml.decode(self.generator, []), [])
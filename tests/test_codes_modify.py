@@ -0,0 +1,92 @@
+"""Unit tests for codes.modify module."""
+
+import random
+import unittest
+from blincodes import matrix
+from blincodes.matrix import Matrix
+from blincodes.codes import modify, rm
+
+
+def _puncture(generator, columns):
+    """Return punctured code by full elimination."""
+    mask = sum(1 << (generator.ncolumns - i - 1) for i in columns)
+    return Matrix(
+        (row.value for row in Matrix(
+            (row.value & ~mask for row in generator),
+            generator.ncolumns).diagonal_form if row.value),
+        generator.ncolumns)
+
+
+def _truncate(generator, columns):
+    """Return truncated code by full elimination."""
+    parity_check = generator.orthogonal
+    for i in columns:
+        parity_check.concatenate(
+            Matrix([1 << (generator.ncolumns - i - 1)], generator.ncolumns),
+            by_rows=True)
+    return Matrix(
+        (row.value for row in parity_check.orthogonal.diagonal_form
+         if row.value),
+        generator.ncolumns)
+
+
+class ModifiedCodeTestCase(unittest.TestCase):
+    """Test to puncture and truncate codes position by position."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.rm25 = rm.generator(2, 5)
+        self.random = matrix.random(7, 20)
+
+    def test_puncture(self):
+        """Test to puncture code position by position."""
+        rng = random.Random(1)
+        for generator in (self.rm25, self.random):
+            code = modify.ModifiedCode(generator)
+            columns = rng.sample(range(generator.ncolumns),
+                                 generator.ncolumns // 2)
+            for i, column in enumerate(columns):
+                code.puncture(column)
+                self.assertEqual(code.generator(),
+                                 _puncture(generator, columns[:i + 1]))
+            self.assertEqual(code.punctured, sorted(columns))
+            self.assertEqual(code.truncated, [])
+
+    def test_truncate(self):
+        """Test to truncate code position by position."""
+        rng = random.Random(2)
+        for generator in (self.rm25, self.random):
+            code = modify.ModifiedCode(generator)
+            columns = rng.sample(range(generator.ncolumns), 10)
+            for i, column in enumerate(columns):
+                code.truncate(column)
+                self.assertEqual(code.generator(),
+                                 _truncate(generator, columns[:i + 1]))
+            self.assertEqual(code.truncated, sorted(columns))
+
+    def test_branching(self):
+        """Test to modify copies of the same code."""
+        code = modify.ModifiedCode(self.rm25).truncate([0, 1])
+        punctured = code.copy().puncture(range(2, 6))
+        truncated = code.copy().truncate(range(2, 6))
+        self.assertEqual(code.dimension, 14)
+        self.assertEqual(punctured.removed_mask, 0b111111 << 26)
+        self.assertEqual(
+            truncated.generator(),
+            _truncate(self.rm25, range(6)))
+        self.assertEqual(
+            punctured.generator(remove_zeroes=True),
+            _puncture(_truncate(self.rm25, range(2)), range(6)).submatrix(
+                range(6, 32)))
+
+    def test_delete_columns(self):
+        """Test to delete columns of rows."""
+        self.assertEqual(
+            modify.delete_columns([0b10110111, 0b01001000], 0b10011001, 8),
+            [0b0111, 0b1000])
+        self.assertEqual(modify.delete_columns([0b101], 0, 3), [0b101])
+        self.assertEqual(modify.delete_columns([0b101], 0b111, 3), [0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Unit tests for osd module."""
+
+import random
+import unittest
+from blincodes.codes import rm, systematic
+from blincodes.codes.osd import OSD
+from blincodes.vector import Vector
+
+
+class OSDTestCase(unittest.TestCase):
+    """Test to decode by ordered statistics decoder."""
+
+    def setUp(self):
+        """Set the test value: RM(1, 4) code."""
+        self.generator = rm.generator(1, 4)
+        self.codewords = []
+        for message in range(1 << self.generator.nrows):
+            word = 0
+            for i, row in enumerate(self.generator):
+                if message >> i & 1:
+                    word ^= row.value
+            self.codewords.append(word)
+
+    def maximum_likelihood(self, frame):
+        """Return codeword with the least discrepancy with frame."""
+        def discrepancy(word):
+            return sum(abs(llr) for i, llr in enumerate(frame)
+                       if (word >> (15 - i)) & 1 != (llr < 0))
+        return min(self.codewords, key=discrepancy)
+
+    def test_decode(self):
+        """Test to decode frames with errors."""
+        frame = [2.0] * 16
+        for position, llr in ((1, -0.5), (6, -0.3), (12, -1.0)):
+            frame[position] = llr
+        decoder = OSD(self.generator, order=1)
+        self.assertEqual(decoder.n, 16)
+        self.assertEqual(decoder.order, 1)
+        scaled = [2 * llr for llr in frame]
+        self.assertEqual(decoder.decode([frame, scaled]),
+                         [Vector(0, 16), Vector(0, 16)])
+        self.assertEqual(decoder.cache_hits, 1)
+        with self.assertRaises(ValueError):
+            decoder.decode([[1.0] * 15])
+        with self.assertRaises(ValueError):
+            OSD(self.generator, order=-1)
+
+    def test_maximum_likelihood(self):
+        """Test OSD of order k is maximum likelihood decoder."""
+        rng = random.Random(37)
+        frames = []
+        for _ in range(20):
+            word = rng.choice(self.codewords)
+            frames.append([2.0 * (1 - 2 * ((word >> (15 - i)) & 1)) +
+                           rng.gauss(0, 1.5) for i in range(16)])
+        decoded = OSD(self.generator, order=5, cache_size=0).decode(frames)
+        self.assertEqual([word.value for word in decoded],
+                         [self.maximum_likelihood(frame)
+                          for frame in frames])
+
+    def test_cache(self):
+        """Test cached eliminations do not change decoded codewords."""
+        generator = rm.generator(2, 5)
+        rng = random.Random(37)
+        # Orders of positions with the same set of 20 most reliable
+        # positions, the last pivot of every MRB is the 20th position,
+        # but MRBs are different.
+        positions = list(range(32))
+        rng.shuffle(positions)
+        orders = []
+        bases = set()
+        while len(orders) < 4:
+            top = positions[:20]
+            rng.shuffle(top)
+            order = top + positions[20:]
+            _, information_set, _ = systematic.systematic_form(generator,
+                                                               order)
+            basis = frozenset(information_set)
+            if order[19] in basis and basis not in bases:
+                bases.add(basis)
+                orders.append(order)
+        frames = []
+        for _ in range(400):
+            frame = [0.0] * 32
+            for rank, position in enumerate(rng.choice(orders)):
+                sign = -1 if rng.random() < 0.1 else 1
+                frame[position] = sign * (40 - rank + rng.random() / 2)
+            frames.append(frame)
+        cached = OSD(generator, order=0)
+        decoded = cached.decode(frames)
+        self.assertGreater(cached.cache_hits, 0)
+        self.assertEqual(decoded,
+                         OSD(generator, order=0, cache_size=0).decode(frames))
+
+    def test_cache_reordered(self):
+        """Test to reuse elimination for reordered reliable positions."""
+        decoder = OSD(self.generator, order=0)
+        frame = [16.0 - i for i in range(16)]
+        swapped = list(frame)
+        swapped[0], swapped[1] = swapped[1], swapped[0]
+        # The same 9 most reliable positions, but column 0 is the sum of
+        # columns 1, 2 and 3, so MRB is other.
+        reordered = list(frame)
+        reordered[0] = -12.5
+        decoder.decode([frame, swapped])
+        self.assertEqual(decoder.cache_hits, 1)
+        self.assertEqual(decoder.decode([reordered]),
+                         OSD(self.generator, order=0,
+                             cache_size=0).decode([reordered]))
+        self.assertEqual(decoder.cache_hits, 1)
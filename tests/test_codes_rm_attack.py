@@ -0,0 +1,75 @@
+"""Unit tests for attack on permuted Reed-Muller codes."""
+
+import random
+import unittest
+from blincodes import matrix, subspace
+from blincodes.codes import keygen, rm, rm_attack
+
+
+class RMAttackTestCase(unittest.TestCase):
+    """Test to recover structure of permuted Reed-Muller codes."""
+
+    def check_attack(self, param_r, param_m, processes=None):
+        """Check that the attack recovers permuted RM(r, m)."""
+        rng = random.Random(param_r * 100 + param_m)
+        keys = keygen.keypair(rm.generator(param_r, param_m), rng,
+                              systematic_key=False)
+        stages = []
+        result = rm_attack.attack(
+            keys.public, processes=processes, rng=rng,
+            report=lambda stage, seconds: stages.append(stage))
+        self.assertEqual((result.param_r, result.param_m),
+                         (param_r, param_m))
+        self.assertTrue(subspace.is_equal(
+            result.permutation.permute(keys.public),
+            rm.generator(param_r, param_m)))
+        self.assertEqual([stage for stage, _ in result.timings], stages)
+        return stages
+
+    def test_dimension(self):
+        """Test to evaluate dimension of RM(r, m)."""
+        self.assertEqual(rm_attack.dimension(2, 5), 16)
+        self.assertEqual(rm_attack.dimension(-1, 5), 0)
+        self.assertEqual(rm_attack.dimension(7, 5), 32)
+        for param_r in range(5):
+            self.assertEqual(rm_attack.dimension(param_r, 4),
+                             rm.generator(param_r, 4).nrows)
+
+    def test_first_order(self):
+        """Test to attack RM(1, m)."""
+        self.assertEqual(self.check_attack(1, 5),
+                         ['permutation', 'verification'])
+
+    def test_reduction(self):
+        """Test to attack RM(r, m) with gcd(r, m - 1) = 1."""
+        self.assertEqual(self.check_attack(2, 6),
+                         ['RM(3)', 'RM(1)', 'permutation', 'verification'])
+        self.check_attack(3, 5)
+
+    def test_minimum_weight(self):
+        """Test to attack RM(r, m) with gcd(r, m - 1) > 1."""
+        self.assertEqual(self.check_attack(2, 5),
+                         ['minimum weight RM(2)', 'RM(1)', 'permutation',
+                          'verification'])
+        self.check_attack(2, 7)
+        self.check_attack(2, 5, processes=2)
+
+    def test_trivial(self):
+        """Test to attack codes invariant under permutations."""
+        for param_r in (0, 3, 4):
+            result = rm_attack.attack(rm.generator(param_r, 4))
+            self.assertTrue(result.permutation.is_identity())
+            self.assertEqual(result.timings, [])
+
+    def test_errors(self):
+        """Test to reject codes which are not Reed-Muller codes."""
+        with self.assertRaises(ValueError):
+            rm_attack.attack(matrix.Matrix([0b111], 3))
+        with self.assertRaises(ValueError):
+            rm_attack.attack(matrix.Matrix([0b1111, 0b0011], 4))
+        with self.assertRaises(ValueError):
+            rm_attack.attack(rm.generator(2, 5), param_r=1)
+        with self.assertRaises(ValueError):
+            rm_attack.attack(matrix.Matrix(
+                [row.value ^ 1 if i == 3 else row.value
+                 for i, row in enumerate(rm.generator(1, 5))], 32))
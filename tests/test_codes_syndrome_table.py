@@ -0,0 +1,95 @@
+"""Unit tests for syndrome_table module."""
+
+import unittest
+from blincodes import matrix
+from blincodes.codes import rm, tools
+from blincodes.codes.syndrome_table import SyndromeDecoder
+from blincodes.vector import Vector
+
+
+class SyndromeDecoderTestCase(unittest.TestCase):
+    """Test to decode by table of coset leaders."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.hamming = matrix.Matrix([
+            0b0001111,
+            0b0110011,
+            0b1010101,
+        ], 7)
+        self.reed_muller = SyndromeDecoder(
+            tools.make_parity_check(rm.generator(1, 4)))
+
+    def test_hamming(self):
+        """Test to decode Hamming code."""
+        decoder = SyndromeDecoder(self.hamming)
+        self.assertEqual(decoder.n, 7)
+        self.assertEqual(decoder.redundancy, 3)
+        self.assertEqual(decoder.cosets, 8)
+        self.assertEqual(decoder.covering_radius, 1)
+        self.assertEqual(decoder.syndrome(0b0000100), 0b101)
+        self.assertEqual(decoder.leader(0b101), Vector(0b0000100, 7))
+        self.assertEqual(decoder.decode([0b1110001, Vector(0b1110000, 7)]),
+                         [Vector(0b1110000, 7), Vector(0b1110000, 7)])
+
+    def test_leaders(self):
+        """Test leaders are vectors of minimal weight of cosets."""
+        decoder = self.reed_muller
+        self.assertEqual(decoder.cosets, 1 << 11)
+        self.assertEqual(decoder.covering_radius, 6)
+        codewords = []
+        for message in range(32):
+            word = 0
+            for i, row in enumerate(rm.generator(1, 4)):
+                if message >> i & 1:
+                    word ^= row.value
+            codewords.append(word)
+        for word in range(0, 1 << 16, 997):
+            decoded = decoder.decode([word])[0].value
+            self.assertIn(decoded, codewords)
+            self.assertEqual(
+                bin(decoded ^ word).count('1'),
+                min(bin(codeword ^ word).count('1')
+                    for codeword in codewords))
+
+    def test_parallel(self):
+        """Test to build table by several processes."""
+        decoder = SyndromeDecoder(
+            tools.make_parity_check(rm.generator(1, 4)), processes=2)
+        self.assertEqual(decoder.cosets, self.reed_muller.cosets)
+        for syndrome in range(1 << 11):
+            self.assertEqual(decoder.leader(syndrome),
+                             self.reed_muller.leader(syndrome))
+
+    def test_early_exit(self):
+        """Test to stop enumeration of patterns when the table is full."""
+        # The leader of syndrome 10 has weight 2, it is found among the
+        # first patterns of weight 2 of about 4.5 million.
+        half = 1500
+        parity_check = matrix.Matrix([((1 << half) - 1) << half,
+                                      (1 << (2 * half)) - 1], 2 * half)
+        for processes in (None, 2):
+            decoder = SyndromeDecoder(parity_check, processes=processes)
+            self.assertEqual(decoder.cosets, 4)
+            self.assertEqual(decoder.covering_radius, 2)
+            self.assertEqual(decoder.leader(0b10).support, [0, half])
+
+    def test_storage(self):
+        """Test to store leaders of any length."""
+        for ncolumns, itemsize in ((7, 1), (16, 2), (33, 8), (64, 8)):
+            parity_check = matrix.Matrix([(1 << ncolumns) - 1], ncolumns)
+            decoder = SyndromeDecoder(parity_check)
+            self.assertEqual(decoder._leaders.itemsize, itemsize)
+            self.assertEqual(decoder.leader(1), Vector(1 << ncolumns - 1,
+                                                       ncolumns))
+        parity_check = matrix.Matrix([
+            (1 << 70) - 1,
+            1,
+        ], 71)
+        decoder = SyndromeDecoder(parity_check)
+        self.assertEqual(len(decoder._leaders), 4)
+        self.assertEqual(decoder.leader(0b10), Vector(1 << 69, 71))
+        self.assertEqual(decoder.leader(0b11), Vector(1, 71))
+        self.assertEqual(decoder.leader(0b01), Vector((1 << 69) | 1, 71))
+        self.assertEqual(decoder.decode([(1 << 70) | 0b111]),
+                         [Vector((1 << 70) | 0b110, 71)])
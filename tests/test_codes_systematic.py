@@ -0,0 +1,74 @@
+"""Unit tests for codes.systematic module."""
+
+import unittest
+from blincodes import matrix
+from blincodes.matrix import Matrix
+from blincodes.vector import Vector
+from blincodes.codes import rm, tools
+from blincodes.codes import systematic
+
+
+class SystematicFormTestCase(unittest.TestCase):
+    """Test to evaluate systematic form of generator matrix."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.rm14 = rm.generator(1, 4)
+
+    def test_systematic_form(self):
+        """Test to evaluate systematic form with default columns."""
+        generator, information_set, permutation = (
+            systematic.systematic_form(self.rm14))
+        self.assertEqual(information_set, [0, 1, 2, 4, 8])
+        self.assertEqual(generator, self.rm14.diagonal_form)
+        self.assertEqual(permutation[:5], information_set)
+        self.assertEqual(sorted(permutation), list(range(16)))
+        self.assertTrue(generator.submatrix(information_set).is_identity())
+        self.assertEqual(generator.submatrix(permutation),
+                         generator * matrix.permutation(permutation))
+
+    def test_preferred_columns(self):
+        """Test to evaluate systematic form on chosen columns."""
+        columns = (15, 14, 13, 11, 7, 3)
+        generator, information_set, permutation = (
+            systematic.systematic_form(self.rm14, columns))
+        self.assertEqual(information_set, [15, 14, 13, 11, 7])
+        self.assertTrue(generator.submatrix(information_set).is_identity())
+        self.assertTrue(tools.is_subcode(generator, self.rm14))
+        self.assertTrue(tools.is_subcode(self.rm14, generator))
+        self.assertEqual(permutation[5:],
+                         [i for i in range(16) if i not in columns[:5]])
+
+    def test_dependent_rows(self):
+        """Test to drop dependent rows."""
+        mat = Matrix([0b1100, 0b0110, 0b1010, 0], 4)
+        generator, information_set, _ = systematic.systematic_form(mat)
+        self.assertEqual(generator, Matrix([0b1010, 0b0110], 4))
+        self.assertEqual(information_set, [0, 1])
+
+
+class SystematicEncoderTestCase(unittest.TestCase):
+    """Test to encode and recover messages."""
+
+    def test_encode_recover(self):
+        """Test to encode messages and recover them from codewords."""
+        for generator in (rm.generator(2, 5), matrix.random(7, 19)):
+            encoder = systematic.SystematicEncoder(
+                generator, columns=range(generator.ncolumns - 1, -1, -1))
+            self.assertEqual(encoder.n, generator.ncolumns)
+            self.assertEqual(encoder.k, generator.rank)
+            self.assertEqual(encoder.generator.submatrix(
+                encoder.information_set), matrix.identity(encoder.k))
+            for message in range(0, 1 << encoder.k, 7):
+                word = encoder.encode(Vector(message, encoder.k))
+                self.assertTrue(tools.is_subcode(
+                    Matrix([word.value], generator.ncolumns), generator))
+                self.assertEqual(
+                    [word[i] for i in encoder.information_set],
+                    list(Vector(message, encoder.k)))
+                self.assertEqual(encoder.recover(word),
+                                 Vector(message, encoder.k))
+
+
+if __name__ == "__main__":
+    unittest.main()
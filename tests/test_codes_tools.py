@@ -1,5 +1,6 @@
 """Unit tests for codes.tools module."""
 
+import random
 import unittest
 from blincodes.matrix import Matrix
 from blincodes.vector import Vector
@@ -260,6 +261,41 @@ class CodeOperationsTestCase(unittest.TestCase):
                 self.rm14, self.rm24_add).orthogonal,
             Matrix([0b1111111111111111], 16))
 
+    def test_hadamard_square(self):
+        """Test to evaluate of Schur square of a code."""
+        self.assertEqual(
+            tools.hadamard_product(self.rm14, self.rm14_add).diagonal_form,
+            tools.hadamard_product(self.rm14, self.rm14).diagonal_form)
+        self.assertEqual(
+            tools.hadamard_product(self.rm14, self.rm14).nrows, 11)
+        self.assertTrue(tools.hadamard_product(
+            self.rm24, self.rm24).diagonal_form.is_identity())
+
+    def test_hadamard_product_parallel(self):
+        """Test to evaluate of Hadamard product by worker processes."""
+        self.assertEqual(
+            tools.hadamard_product(self.rm14, self.rm24_add, processes=2),
+            tools.hadamard_product(self.rm14, self.rm24_add))
+        self.assertEqual(
+            tools.hadamard_product(self.rm14, self.rm14_add,
+                                   processes=2).diagonal_form,
+            self.rm24_generator)
+
+    def test_hadamard_dimension(self):
+        """Test to estimate dimension of Hadamard product."""
+        rng = random.Random(0)
+        self.assertEqual(
+            tools.hadamard_dimension(self.rm14, self.rm14_add, rng=rng), 11)
+        self.assertEqual(
+            tools.hadamard_dimension(self.rm24, self.rm24_add, rng=rng), 16)
+        self.assertEqual(
+            tools.hadamard_dimension(self.rm14, self.rm14, max_rank=8,
+                                     rng=rng), 8)
+        self.assertEqual(tools.hadamard_dimension(self.rm14, Matrix()), 0)
+        with self.assertRaises(ValueError):
+            tools.hadamard_dimension(self.rm14, self.rm14,
+                                     error_probability=0)
+
     def test_intersection(self):
         """Test to intersect of codes."""
         self.assertEqual(tools.intersection(
@@ -268,6 +304,10 @@ class CodeOperationsTestCase(unittest.TestCase):
         self.assertEqual(tools.intersection(
             self.rm24_add, self.rm24).diagonal_form,
                          self.rm24_generator)
+        trivial = tools.intersection(Matrix([0b1000, 0b0100], 4),
+                                     Matrix([0b0010, 0b0001], 4))
+        self.assertEqual(trivial.shapes, (1, 4))
+        self.assertTrue(trivial.is_zero())
 
     def test_union(self):
         """Test to union of codes."""
@@ -275,12 +315,21 @@ class CodeOperationsTestCase(unittest.TestCase):
             self.rm14, self.rm24_add).diagonal_form,
                          self.rm24_generator)
 
+    def test_is_subcode(self):
+        """Test to check that the code is subcode of other."""
+        self.assertTrue(tools.is_subcode(self.rm14, self.rm24_add))
+        self.assertTrue(tools.is_subcode(self.rm14_add, self.rm14))
+        self.assertFalse(tools.is_subcode(self.rm24, self.rm14_add))
+
     def test_hull(self):
         """Test to evaluate of code's hull."""
         self.assertEqual(tools.hull(self.rm24_add).diagonal_form,
                          self.rm14_generator)
         self.assertEqual(tools.hull(self.rm14_add).diagonal_form,
                          self.rm14_generator)
+        trivial = tools.hull(Matrix([0b1000], 4))
+        self.assertEqual(trivial.shapes, (1, 4))
+        self.assertTrue(trivial.is_zero())
 
     def test_puncture(self):
         """Test to puncture of a code."""
@@ -383,6 +432,17 @@ class CodeWordsOperationsTestCase(unittest.TestCase):
         self.assertEqual(len(code_words), 32)
         self.assertEqual(code_words, self.code_words)
 
+    def test_iter_gray_codewords(self):
+        """Test to iterate over nonzero code words in Gray code order."""
+        rows = tuple(row.value for row in self.rm14)
+        code_words = list(tools.iter_gray_codewords(rows))
+        self.assertEqual(sorted(code_words), sorted(self.code_words[1:]))
+        for word, next_word in zip(code_words, code_words[1:]):
+            self.assertIn(word ^ next_word, rows)
+        self.assertEqual(list(tools.iter_gray_codewords(())), [])
+        self.assertEqual([tools.popcount(word) for word in code_words],
+                         [bin(word).count('1') for word in code_words])
+
     def test_spectrum(self):
         """Test to evaluate of spectrum."""
         spectr = {i: 0 for i in range(17)}
@@ -409,6 +469,26 @@ class CodeWordsOperationsTestCase(unittest.TestCase):
             tools.syndrome(self.rm14, Matrix([0b1110000000000000], 16)),
             Vector(0b10011, 5))
 
+    def test_coset_weight_distribution(self):
+        """Test to evaluate weight distribution of coset leaders."""
+        parity_check = tools.make_parity_check(self.rm14)
+        distribution = {0: 1, 1: 16, 2: 120, 3: 560, 4: 875, 5: 448, 6: 28}
+        self.assertEqual(tools.coset_weight_distribution(parity_check),
+                         distribution)
+        self.assertEqual(
+            tools.coset_weight_distribution(parity_check, processes=2),
+            distribution)
+        self.assertEqual(tools.coset_weight_distribution(
+            Matrix([0b0001111, 0b0110011, 0b1010101, 0b0111100], 7)),
+            {0: 1, 1: 7})
+
+    def test_covering_radius(self):
+        """Test to evaluate covering radius."""
+        self.assertEqual(
+            tools.covering_radius(tools.make_parity_check(self.rm14)), 6)
+        self.assertEqual(tools.covering_radius(self.rm14), 2)
+        self.assertEqual(tools.covering_radius(Matrix([0b11], 2)), 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,15 @@
 """Unit tests for matrix module."""
 
+import pickle
 import unittest
 from blincodes import matrix
 from blincodes.vector import Vector
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class InitMatrixTestCase(unittest.TestCase):
     """Test to init of Matrix object."""
@@ -1113,5 +1119,60 @@ class GenerateMatrixTestCase(unittest.TestCase):
         self.assertEqual(perm, matrix.Matrix(perm_matrix, 8).transpose())
 
 
+class BytesMatrixTestCase(unittest.TestCase):
+    """Test to convert matrices from and to packed rows."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.matr = matrix.from_string(
+            '1100101110001;'
+            '0101000000011;'
+            '0000000000001'
+        )
+
+    def test_pickle(self):
+        """Test to pickle matrix as packed rows."""
+        for matr in (self.matr, matrix.Matrix(), matrix.zero(3, 70)):
+            data = pickle.dumps(matr)
+            self.assertEqual(pickle.loads(data), matr)
+            self.assertEqual(pickle.loads(data).shapes, matr.shapes)
+        self.assertLess(len(pickle.dumps(self.matr)), 100)
+
+    def test_bytes(self):
+        """Test to pack and unpack matrix."""
+        data = self.matr.to_bytes()
+        self.assertEqual(data, bytes([0b11001011, 0b10001000,
+                                      0b01010000, 0b00011000,
+                                      0b00000000, 0b00001000]))
+        self.assertEqual(matrix.from_bytes(data, 13), self.matr)
+        self.assertEqual(matrix.from_bytes(memoryview(data), 13, 2),
+                         matrix.Matrix([self.matr[0].value,
+                                        self.matr[1].value], 13))
+        self.assertEqual(
+            matrix.from_bytes(self.matr.to_bytes('little'), 13,
+                              bit_order='little'),
+            self.matr)
+        padded = b''.join(row.to_bytes() + bytes(6) for row in self.matr)
+        self.assertEqual(matrix.from_bytes(padded, 13, stride=8),
+                         self.matr)
+        self.assertEqual(matrix.from_bytes(b'', 0), matrix.Matrix())
+        with self.assertRaises(ValueError):
+            matrix.from_bytes(data, 13, 4)
+        with self.assertRaises(ValueError):
+            matrix.from_bytes(data, 13, stride=1)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        """Test to convert matrix from and to numpy array."""
+        array = self.matr.to_numpy()
+        self.assertEqual(array.shape, (3, 13))
+        self.assertEqual(array.tolist(), [list(row) for row in self.matr])
+        self.assertEqual(matrix.from_numpy(array), self.matr)
+        self.assertEqual(matrix.from_numpy(array.astype(bool)), self.matr)
+        self.assertEqual(matrix.from_numpy(array.astype(int)), self.matr)
+        with self.assertRaises(ValueError):
+            matrix.from_numpy(numpy.zeros(3))
+
+
 if __name__ == "__main__":
     unittest.main()
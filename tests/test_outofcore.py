@@ -0,0 +1,70 @@
+"""Unit tests for outofcore module."""
+
+import os
+import random
+import tempfile
+import unittest
+from blincodes import binary, matrix, outofcore
+
+
+class OutOfCoreTestCase(unittest.TestCase):
+    """Test to eliminate matrices stored on disk."""
+
+    def setUp(self):
+        """Set the test value."""
+        rng = random.Random(7)
+        self.matrices = [
+            matrix.Matrix([rng.getrandbits(70) & rng.getrandbits(70)
+                           for _ in range(23)], 70),
+            matrix.Matrix([rng.getrandbits(9) for _ in range(30)], 9),
+            matrix.Matrix([0b01011, 0b10110, 0b00101, 0b10010], 5),
+        ]
+        self.directory = tempfile.TemporaryDirectory()
+        self.source = os.path.join(self.directory.name, 'source.bin')
+        self.target = os.path.join(self.directory.name, 'target.bin')
+
+    def tearDown(self):
+        """Remove temporary files."""
+        self.directory.cleanup()
+
+    def test_echelon_form(self):
+        """Test to evaluate the echelon form in panels."""
+        for matr in self.matrices:
+            binary.save(matr, self.source)
+            for memory_limit in (1, 200, outofcore.MEMORY_LIMIT):
+                result = outofcore.echelon_form(self.source, self.target,
+                                                memory_limit)
+                self.assertEqual(result.load(), matr.echelon_form)
+                self.assertEqual(result.rank, matr.rank)
+                with result.open() as mapped:
+                    self.assertEqual(mapped.to_matrix(), matr.echelon_form)
+            self.assertEqual(outofcore.rank(self.source, 200), matr.rank)
+        self.assertEqual(sorted(os.listdir(self.directory.name)),
+                         ['source.bin', 'target.bin'])
+
+    def test_gaussian_elimination(self):
+        """Test to evaluate Gaussian elimination in panels."""
+        for matr in self.matrices:
+            binary.save(matr, self.source, 'little')
+            for columns in (None, [1, 3, 4, -1, 7]):
+                for sort in (True, False):
+                    expected = matr.gaussian_elimination(columns, sort)
+                    for memory_limit in (1, 300):
+                        result = outofcore.gaussian_elimination(
+                            self.source, self.target, columns, sort,
+                            memory_limit)
+                        self.assertEqual(result.load(), expected)
+            result = outofcore.gaussian_elimination(self.source, self.target)
+            basis = matr.gaussian_elimination()
+            self.assertEqual(result.pivots, [
+                row.support[0] for row in basis if row.value])
+
+    def test_inplace(self):
+        """Test to write the result into the source file."""
+        matr = self.matrices[0]
+        binary.save(matr, self.source)
+        outofcore.echelon_form(self.source, self.source, 100)
+        self.assertEqual(binary.load(self.source), matr.echelon_form)
+        binary.save(matrix.Matrix(), self.source)
+        self.assertEqual(outofcore.echelon_form(
+            self.source, self.target).load(), matrix.Matrix())
@@ -0,0 +1,72 @@
+"""Unit tests for permutation module."""
+
+import random
+import unittest
+from blincodes import matrix, permutation
+from blincodes.permutation import Permutation
+from blincodes.vector import Vector
+
+
+class PermutationTestCase(unittest.TestCase):
+    """Test to work with permutations."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.perm = Permutation([2, 0, 1, 4, 3, 5])
+        self.matr = matrix.Matrix([
+            0b110010,
+            0b011001,
+            0b101100,
+        ], 6)
+
+    def test_init(self):
+        """Test to init permutation."""
+        self.assertEqual(len(self.perm), 6)
+        self.assertEqual(self.perm.size, 6)
+        self.assertEqual(list(self.perm), [2, 0, 1, 4, 3, 5])
+        self.assertEqual(self.perm[3], 4)
+        self.assertEqual(repr(self.perm), 'Permutation([2, 0, 1, 4, 3, 5])')
+        self.assertEqual(len(Permutation()), 0)
+        self.assertTrue(permutation.identity(4).is_identity())
+        self.assertFalse(self.perm.is_identity())
+        with self.assertRaises(ValueError):
+            Permutation([0, 2, 2])
+
+    def test_group_operations(self):
+        """Test to compose and inverse permutations."""
+        other = permutation.random(6, random.Random(42))
+        self.assertEqual((self.perm * other).to_matrix(),
+                         self.perm.to_matrix() * other.to_matrix())
+        self.assertEqual(self.perm * self.perm.inverse(),
+                         permutation.identity(6))
+        self.assertEqual(self.perm.inverse() * self.perm,
+                         permutation.identity(6))
+        self.assertEqual(len({self.perm, Permutation(self.perm)}), 1)
+        with self.assertRaises(ValueError):
+            self.perm * permutation.identity(5)
+
+    def test_cycles(self):
+        """Test to decompose permutation into cycles."""
+        self.assertEqual(self.perm.cycles(), [(0, 2, 1), (3, 4)])
+        self.assertEqual(permutation.from_cycles(6, self.perm.cycles()),
+                         self.perm)
+        self.assertEqual(permutation.identity(3).cycles(), [])
+
+    def test_permute(self):
+        """Test to permute vectors and matrices."""
+        self.assertEqual(self.perm.to_matrix(),
+                         matrix.permutation([2, 0, 1, 4, 3, 5]))
+        vec = Vector(0b110010, 6)
+        self.assertEqual(self.perm.permute(vec),
+                         (matrix.from_vectors([vec]) *
+                          self.perm.to_matrix())[0])
+        self.assertEqual(self.perm.permute(0b110010), Vector(0b011100, 6))
+        self.assertEqual(self.perm.permute(self.matr),
+                         self.matr * self.perm.to_matrix())
+        permuted = self.matr.copy()
+        self.assertIs(self.perm.permute_inplace(permuted), permuted)
+        self.assertEqual(permuted, self.matr * self.perm.to_matrix())
+        self.perm.permute_inplace(vec)
+        self.assertEqual(vec, Vector(0b011100, 6))
+        with self.assertRaises(ValueError):
+            self.perm.permute(Vector(0, 5))
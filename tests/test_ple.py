@@ -0,0 +1,82 @@
+"""Unit tests for ple module."""
+
+import random
+import unittest
+from blincodes import matrix, subspace
+from blincodes.ple import PLE
+from blincodes.vector import Vector
+
+
+class PLEFactorizationTestCase(unittest.TestCase):
+    """Test to factorize matrices and solve linear equations."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.matr_max_rank = matrix.Matrix([
+            0b0111,
+            0b1000,
+            0b1100,
+            0b1110,
+        ], 4)
+        self.matr_non_max_rank = matrix.Matrix([
+            0b01110,
+            0b00101,
+            0b11001,
+            0b11100,
+        ], 5)
+
+    def test_factorization(self):
+        """Test to evaluate factorization T * A = E."""
+        for mat in (self.matr_max_rank, self.matr_non_max_rank,
+                    matrix.random(9, 13), matrix.random(13, 9)):
+            ple = PLE(mat)
+            self.assertEqual(ple.rank, mat.rank)
+            self.assertEqual(ple.echelon, matrix.Matrix(
+                [row.value for row in mat.diagonal_form if row.value],
+                mat.ncolumns))
+            product = ple.transform * mat
+            self.assertEqual(product[:ple.rank], ple.echelon)
+            self.assertTrue(product[ple.rank:].is_zero())
+            self.assertTrue(ple.transform.is_max_rank())
+        self.assertEqual(PLE(self.matr_non_max_rank).pivots, [0, 1, 2])
+
+    def test_solve(self):
+        """Test to solve equation with one right-hand side."""
+        ple = PLE(self.matr_max_rank)
+        solution = ple.solve(Vector(0b1010, 4))
+        self.assertEqual(
+            self.matr_max_rank * matrix.from_vectors([solution]).T,
+            matrix.Matrix([1, 0, 1, 0], 1))
+        self.assertFalse(ple.nullspace)
+        ple = PLE(self.matr_non_max_rank)
+        self.assertIsNone(ple.solve(Vector(0b1010, 4)))
+        self.assertFalse(ple.is_consistent(0b1010))
+        solution = ple.solve(0b1110)
+        self.assertEqual(
+            self.matr_non_max_rank * matrix.from_vectors([solution]).T,
+            matrix.Matrix([1, 1, 1, 0], 1))
+        self.assertTrue(subspace.is_equal(
+            ple.nullspace, matrix.Matrix([0b11010, 0b01101], 5)))
+
+    def test_solve_many(self):
+        """Test to solve equations with many right-hand sides."""
+        rng = random.Random(3)
+        mat = matrix.random(12, 10)
+        ple = PLE(mat)
+        values = [rng.getrandbits(12) for _ in range(40)]
+        values += [(mat * matrix.Matrix([rng.getrandbits(10)], 10).T
+                    ).T[0].value for _ in range(40)]
+        solutions = ple.solve_many(values)
+        self.assertEqual(solutions, [ple.solve(value) for value in values])
+        for value, solution in zip(values, solutions):
+            if solution is None:
+                self.assertFalse(ple.is_consistent(value))
+                continue
+            self.assertEqual(
+                (mat * matrix.from_vectors([solution]).T).T[0],
+                Vector(value, 12))
+        self.assertEqual(ple.solve_many([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+"""Unit tests for sampling module."""
+
+import random
+import unittest
+from blincodes import sampling
+
+
+class SamplingTestCase(unittest.TestCase):
+    """Test to generate random matrices."""
+
+    def test_nonsingular(self):
+        """Test to generate nonsingular matrices."""
+        rng = random.Random(43)
+        for size in (0, 1, 2, 9, 70):
+            matr = sampling.nonsingular(size, rng)
+            self.assertEqual(matr.shapes, (size, size))
+            self.assertEqual(matr.rank, size)
+        self.assertEqual(sampling.nonsingular(30, 1),
+                         sampling.nonsingular(30, 1))
+
+    def test_nonsingular_pair(self):
+        """Test to generate matrix together with its inverse."""
+        for size in (1, 2, 9, 70):
+            matr, inverse = sampling.nonsingular_pair(size, size)
+            self.assertTrue((matr * inverse).is_identity())
+            self.assertTrue((inverse * matr).is_identity())
+
+    def test_full_rank(self):
+        """Test to generate matrices of maximal rank."""
+        rng = random.Random(43)
+        for nrows, ncolumns in ((5, 9), (9, 5), (8, 8), (0, 4)):
+            matr = sampling.full_rank(nrows, ncolumns, rng)
+            if nrows:
+                self.assertEqual(matr.shapes, (nrows, ncolumns))
+            self.assertEqual(matr.rank, min(nrows, ncolumns))
+
+    def test_batch(self):
+        """Test to generate matrices in bulk."""
+        batch = sampling.nonsingular_batch(12, 4, seed='batch')
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch[1], sampling.nonsingular(
+            12, sampling.stream('batch', 1)))
+        self.assertEqual(
+            sampling.nonsingular_batch(12, 4, seed='batch', processes=2),
+            batch)
+        for matr, inverse in sampling.nonsingular_pair_batch(6, 3, seed=1):
+            self.assertTrue((matr * inverse).is_identity())
+        for matr in sampling.full_rank_batch(3, 7, 3, seed=1):
+            self.assertEqual(matr.rank, 3)
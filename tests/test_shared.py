@@ -0,0 +1,70 @@
+"""Unit tests for shared module."""
+
+import multiprocessing
+import pickle
+import unittest
+from blincodes import matrix, shared
+
+
+def _row_weight_task(args):
+    """Return weight of row of shared matrix and name of attached block."""
+    shared_mat, index = args
+    return shared_mat[index].hamming_weight, shared_mat.name
+
+
+@unittest.skipIf(not shared.is_available(), 'shared memory is not available')
+class SharedMatrixTestCase(unittest.TestCase):
+    """Test to publish matrices in shared memory."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.matr = matrix.from_string(
+            '1100101110001;'
+            '0101000000011;'
+            '1111111111111;'
+            '0000000000001'
+        )
+
+    def test_publish(self):
+        """Test to publish matrix and attach to it by name."""
+        with shared.publish(self.matr) as owner:
+            self.assertTrue(owner.owner)
+            self.assertEqual(owner.shapes, (4, 13))
+            self.assertEqual(owner.to_matrix(), self.matr)
+            attached = shared.attach(owner.name)
+            self.assertIs(shared.attach(owner.name), attached)
+            self.assertFalse(attached.owner)
+            self.assertEqual(list(attached), list(self.matr))
+            with self.assertRaises(TypeError):
+                attached.set_row(0, 0)
+            with self.assertRaises(TypeError):
+                attached.unlink()
+            attached.close()
+            self.assertIsNot(shared.attach(owner.name), attached)
+            shared.attach(owner.name).close()
+
+    def test_pickle(self):
+        """Test to pickle shared matrix by name."""
+        with shared.publish(matrix.random(100, 1000)) as owner:
+            data = pickle.dumps(owner)
+            self.assertLess(len(data), 200)
+            attached = pickle.loads(data)
+            self.assertEqual(attached.to_matrix(), owner.to_matrix())
+            attached.close()
+
+    def test_workers(self):
+        """Test to read shared matrix by worker processes."""
+        with shared.publish(self.matr) as owner:
+            with multiprocessing.Pool(2) as pool:
+                results = pool.map(_row_weight_task,
+                                   [(owner, i) for i in range(4)])
+        self.assertEqual([weight for weight, _ in results],
+                         [row.hamming_weight for row in self.matr])
+        self.assertEqual({name for _, name in results}, {owner.name})
+
+    def test_empty(self):
+        """Test to publish empty matrix."""
+        with shared.publish(matrix.Matrix()) as owner:
+            self.assertEqual(owner.to_matrix(), matrix.Matrix())
+        with shared.share(self.matr) as owner:
+            self.assertIsInstance(owner, shared.SharedMatrix)
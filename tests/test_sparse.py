@@ -0,0 +1,78 @@
+"""Unit tests for sparse module."""
+
+import random
+import unittest
+from blincodes import matrix, sparse
+from blincodes.sparse import SparseMatrix
+from blincodes.vector import Vector
+
+
+class SparseMatrixTestCase(unittest.TestCase):
+    """Test to work with sparse matrices."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.dense = matrix.Matrix([
+            0b1101000,
+            0b0110100,
+            0b0011010,
+            0b0001101,
+        ], 7)
+        self.sparse = SparseMatrix(
+            [[0, 1, 3], [1, 2, 4], [2, 3, 5], [3, 4, 6]], 7)
+
+    def test_init(self):
+        """Test to init sparse matrix."""
+        self.assertEqual(self.sparse.shapes, (4, 7))
+        self.assertEqual(self.sparse.nnz, 12)
+        self.assertEqual(self.sparse.row(1), (1, 2, 4))
+        self.assertEqual(self.sparse.row(-1), (3, 4, 6))
+        self.assertEqual(list(self.sparse)[2], (2, 3, 5))
+        self.assertEqual(SparseMatrix([[3, 1, 3]], 4).row(0), (1, 3))
+        self.assertEqual(SparseMatrix().shapes, (0, 0))
+        self.assertEqual(
+            repr(self.sparse), 'SparseMatrix(shapes=(4, 7), nnz=12)')
+        with self.assertRaises(ValueError):
+            SparseMatrix([[0, 7]], 7)
+        with self.assertRaises(IndexError):
+            self.sparse.row(4)
+
+    def test_conversion(self):
+        """Test to convert sparse matrix to dense and back."""
+        self.assertEqual(sparse.from_matrix(self.dense), self.sparse)
+        self.assertEqual(self.sparse.to_matrix(), self.dense)
+        dense = matrix.random(20, 50)
+        self.assertEqual(sparse.from_matrix(dense).to_matrix(), dense)
+
+    def test_transpose(self):
+        """Test to transpose sparse matrix."""
+        self.assertEqual(self.sparse.T.to_matrix(), self.dense.T)
+        self.assertEqual(self.sparse.column(3), (0, 2, 3))
+        self.assertEqual(self.sparse.column(0), (0,))
+        self.assertEqual(self.sparse.T.T, self.sparse)
+
+    def test_weights(self):
+        """Test to evaluate weights of rows and columns."""
+        self.assertEqual(self.sparse.row_weights, [3, 3, 3, 3])
+        self.assertEqual(self.sparse.column_weights, [1, 2, 2, 3, 2, 1, 1])
+        self.assertEqual(self.sparse.weight_distribution(), {3: 4})
+        self.assertEqual(self.sparse.weight_distribution(by_rows=False),
+                         {1: 3, 2: 3, 3: 1})
+
+    def test_dot_and_syndromes(self):
+        """Test to multiply sparse matrix by vectors."""
+        rng = random.Random(4)
+        dense = matrix.random(30, 70)
+        sparse_matrix = sparse.from_matrix(dense)
+        words = [rng.getrandbits(70) for _ in range(25)] + [0]
+        expected = [(dense * matrix.Matrix([word], 70).T).T[0]
+                    for word in words]
+        self.assertEqual(
+            [sparse_matrix.dot(Vector(word, 70)) for word in words],
+            expected)
+        self.assertEqual(sparse_matrix.syndromes(words), expected)
+        self.assertEqual(sparse_matrix.syndromes([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
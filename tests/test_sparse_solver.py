@@ -0,0 +1,70 @@
+"""Unit tests for sparse_solver module."""
+
+import random
+import unittest
+from blincodes import sparse_solver
+from blincodes.sparse import SparseMatrix
+
+
+def random_sparse(nrows, ncolumns, weight, rng):
+    """Return random sparse matrix with rows of weight `weight`."""
+    return SparseMatrix(
+        [rng.sample(range(ncolumns), weight) for _ in range(nrows)],
+        ncolumns)
+
+
+class SparseSolverTestCase(unittest.TestCase):
+    """Test to solve sparse linear systems."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.rng = random.Random(35)
+        self.mat = random_sparse(90, 120, 4, self.rng)
+
+    def test_structured_elimination(self):
+        """Test to shrink system by structured elimination."""
+        reduction = sparse_solver.StructuredElimination(self.mat)
+        self.assertLess(reduction.core.ncolumns, self.mat.ncolumns)
+        self.assertEqual(
+            sorted(reduction.core_columns + reduction.pivots),
+            list(range(self.mat.ncolumns)))
+        reduction = sparse_solver.StructuredElimination(
+            SparseMatrix([[0, 1], [1, 2]], 3), protected=(0, 1, 2))
+        self.assertEqual(reduction.pivots, [])
+        self.assertEqual(reduction.core.shapes, (2, 3))
+
+    def test_nullspace(self):
+        """Test to evaluate nullspace of sparse matrix."""
+        rank = self.mat.to_matrix().rank
+        kernel = sparse_solver.nullspace(self.mat)
+        self.assertEqual(kernel.nrows, self.mat.ncolumns - rank)
+        for row in kernel:
+            self.assertEqual(self.mat.dot(row).value, 0)
+        kernel = sparse_solver.nullspace(self.mat, method='lanczos',
+                                         rng=self.rng)
+        self.assertGreater(kernel.nrows, 0)
+        self.assertEqual(kernel.rank, kernel.nrows)
+        for row in kernel:
+            self.assertEqual(self.mat.dot(row).value, 0)
+        with self.assertRaises(ValueError):
+            sparse_solver.nullspace(self.mat, method='qr')
+
+    def test_block_lanczos(self):
+        """Test to find nullspace vectors by block Lanczos algorithm."""
+        vectors = sparse_solver.block_lanczos(self.mat, rng=self.rng)
+        self.assertTrue(vectors)
+        for value in vectors:
+            self.assertNotEqual(value, 0)
+            self.assertEqual(self.mat.dot(value).value, 0)
+
+    def test_solve(self):
+        """Test to solve sparse system."""
+        for method in ('dense', 'lanczos', None):
+            vect_b = self.mat.dot(self.rng.getrandbits(self.mat.ncolumns))
+            solution = sparse_solver.solve(self.mat, vect_b, method=method,
+                                           rng=self.rng)
+            self.assertEqual(self.mat.dot(solution), vect_b)
+        inconsistent = SparseMatrix([[0, 1], [0, 1]], 3)
+        self.assertIsNone(sparse_solver.solve(inconsistent, 0b10))
+        self.assertIsNone(sparse_solver.solve(
+            inconsistent, 0b10, method='lanczos', rng=self.rng))
@@ -0,0 +1,72 @@
+"""Unit tests for subspace module."""
+
+import unittest
+from blincodes import matrix, subspace
+from blincodes.matrix import Matrix
+from blincodes.codes import rm
+
+
+class SubspaceAlgebraTestCase(unittest.TestCase):
+    """Test to evaluate relations between subspaces."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.rm14 = rm.generator(1, 4)
+        self.rm24 = rm.generator(2, 4)
+        self.rm13 = rm.generator(1, 3)
+        self.rm15 = rm.generator(1, 5)
+        self.rm25 = rm.generator(2, 5)
+
+    def test_zassenhaus(self):
+        """Test to evaluate sum and intersection at once."""
+        first = Matrix([0b1100, 0b0110], 4)
+        second = Matrix([0b0110, 0b0011], 4)
+        sum_rows, intersection_rows = subspace.zassenhaus(first, second)
+        self.assertEqual(sum_rows, (0b1001, 0b0101, 0b0011))
+        self.assertEqual(intersection_rows, (0b0110,))
+
+    def test_union_and_intersection(self):
+        """Test to evaluate sum and intersection of spaces."""
+        self.assertEqual(
+            subspace.union(self.rm14, self.rm24),
+            self.rm24.diagonal_form)
+        self.assertEqual(
+            subspace.intersection(self.rm24, self.rm14),
+            self.rm14.diagonal_form)
+        self.assertEqual(
+            subspace.intersection(Matrix([0b1100], 4), Matrix([0b0011], 4)),
+            Matrix())
+        self.assertEqual(subspace.intersection_dimension(
+            self.rm14, self.rm24), 5)
+
+    def test_dual(self):
+        """Test to evaluate orthogonal complement."""
+        dual = subspace.dual(self.rm25)
+        self.assertEqual(dual.nrows, 32 - self.rm25.nrows)
+        self.assertTrue((dual * self.rm25.T).is_zero())
+        self.assertTrue(subspace.is_equal(dual, rm.generator(2, 5)))
+        self.assertTrue(subspace.is_equal(
+            subspace.dual(self.rm13), self.rm13))
+        self.assertTrue(
+            subspace.dual(matrix.identity(5)).is_zero())
+
+    def test_hull(self):
+        """Test to evaluate hull of space."""
+        self.assertTrue(subspace.is_equal(subspace.hull(self.rm24),
+                                          self.rm14))
+        self.assertTrue(subspace.is_equal(subspace.hull(self.rm15),
+                                          self.rm15))
+        self.assertTrue(subspace.is_equal(subspace.hull(self.rm13),
+                                          self.rm13))
+
+    def test_inclusion(self):
+        """Test to check inclusion and equality of spaces."""
+        self.assertTrue(subspace.is_subspace(self.rm14, self.rm24))
+        self.assertFalse(subspace.is_subspace(self.rm24, self.rm14))
+        self.assertTrue(subspace.is_equal(
+            self.rm14, self.rm14.diagonal_form))
+        self.assertFalse(subspace.is_equal(self.rm14, self.rm24))
+
+
+if __name__ == "__main__":
+    unittest.main()
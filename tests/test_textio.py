@@ -0,0 +1,101 @@
+"""Unit tests for textio module."""
+
+import io
+import os
+import tempfile
+import unittest
+from blincodes import matrix, sparse, textio
+from blincodes.vector import Vector
+
+
+class TextIOTestCase(unittest.TestCase):
+    """Test to read and write matrices in text files."""
+
+    def setUp(self):
+        """Set the test value."""
+        self.matr = matrix.from_string(
+            '10110;'
+            '01101;'
+            '11100;'
+            '00011'
+        )
+        self.alist = (
+            '5 4\n'
+            '3 3\n'
+            '2 2 3 2 2\n'
+            '3 3 3 2\n'
+            '1 3 0\n2 3 0\n1 2 3\n1 4 0\n2 4 0\n'
+            '1 3 4\n'
+            '2 3 5\n'
+            '1 2 3\n'
+            '4 5 0\n'
+        )
+
+    def test_read_lines(self):
+        """Test to read vectors from lines."""
+        text = '10110\n01101\n\n111\n0*0|1\n'
+        self.assertEqual(
+            list(textio.iter_vectors(io.StringIO(text), zerofillers='*',
+                                     onefillers=['|'], chunk_size=4)),
+            [Vector(0b10110, 5), Vector(0b01101, 5), Vector(0b111, 3),
+             Vector(0b00011, 5)])
+        self.assertEqual(
+            textio.read_matrix(io.StringIO('10110\n01101\n11100\n00011\n'),
+                               chunk_size=1),
+            self.matr)
+        self.assertEqual(textio.read_matrix(io.StringIO('')),
+                         matrix.Matrix())
+        self.assertEqual(
+            list(textio.iter_vectors(io.StringIO('1--0\n'),
+                                     zerofillers=['--'])),
+            [Vector(0b100, 3)])
+        with self.assertRaises(ValueError):
+            textio.read_matrix(io.StringIO('1021\n'))
+
+    def test_read_row_sep(self):
+        """Test to read rows separated by `row_sep`."""
+        text = '10110;01101;\n11100;00011;'
+        for chunk_size in (1, 3, textio.CHUNK_SIZE):
+            self.assertEqual(
+                textio.read_matrix(io.StringIO(text), row_sep=';',
+                                   chunk_size=chunk_size),
+                matrix.from_string(text.replace('\n', '')))
+        self.assertEqual(
+            textio.read_matrix(io.StringIO('1*|;0*1'), zerofillers='*',
+                               onefillers='|', row_sep=';'),
+            matrix.from_string('1*|;0*1', zerofillers='*', onefillers='|'))
+
+    def test_write(self):
+        """Test to write vectors and matrices."""
+        stream = io.StringIO()
+        textio.write_matrix(self.matr, stream)
+        self.assertEqual(stream.getvalue(), '10110\n01101\n11100\n00011\n')
+        stream = io.StringIO()
+        textio.write_vectors([Vector(0b101, 3), Vector(0, 2)], stream,
+                             zerofiller='-', row_sep=';')
+        self.assertEqual(stream.getvalue(), '1-1;--;')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'matrix.txt')
+            textio.write_matrix(self.matr, path, row_sep=';')
+            self.assertEqual(textio.read_matrix(path, row_sep=';'),
+                             self.matr)
+
+    def test_alist(self):
+        """Test to read and write the alist format."""
+        self.assertEqual(textio.read_alist(io.StringIO(self.alist)),
+                         self.matr)
+        sparse_matr = textio.read_alist(io.StringIO(self.alist),
+                                        sparse_matrix=True)
+        self.assertEqual(sparse_matr, sparse.from_matrix(self.matr))
+        rows = textio.iter_alist(io.StringIO(self.alist))
+        self.assertEqual(next(rows), (4, 5))
+        self.assertEqual(next(rows), [0, 2, 3])
+        stream = io.StringIO()
+        textio.write_alist(self.matr, stream)
+        self.assertEqual(stream.getvalue(), self.alist)
+        stream = io.StringIO()
+        textio.write_alist(sparse_matr, stream)
+        self.assertEqual(stream.getvalue(), self.alist)
+        with self.assertRaises(ValueError):
+            textio.read_alist(io.StringIO(self.alist.replace('4 5 0',
+                                                             '4 9 0')))
@@ -1,7 +1,13 @@
 """Unit Tests for module vector."""
+import pickle
 import unittest
 from blincodes import vector
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class InitVectorTestCase(unittest.TestCase):
     """Testing initialisation of Vector object."""
@@ -281,6 +287,15 @@ class ChangeLengthTestCase(unittest.TestCase):
         self.assertEqual(vec2, vec1.copy().resize(-2))
         self.assertEqual(vec3, vec1.copy().resize(2))
 
+    def test_set_value(self):
+        """Test to change value of vector in place."""
+        vec = vector.Vector(0b10011, 5)
+        self.assertIs(vec.set_value(0b110), vec)
+        self.assertEqual(vec, vector.Vector(0b00110, 5))
+        self.assertEqual(vec.set_value(0b1101001), vector.Vector(0b01001, 5))
+        with self.assertRaises(TypeError):
+            vec.set_value('101')
+
 
 class ToolFunctionsEvaluationTestCase(unittest.TestCase):
     """Testing to evaluating of various tool functions."""
@@ -363,5 +378,59 @@ class ToolFunctionsEvaluationTestCase(unittest.TestCase):
         self.assertEqual(vector.scalar_product(vec4, vec3), 0)
 
 
+
+class BytesVectorTestCase(unittest.TestCase):
+    """Test to convert vectors from and to packed bits."""
+
+    def test_bytes(self):
+        """Test to pack and unpack vector."""
+        vec = vector.Vector(0b1100101110001, 13)
+        self.assertEqual(vec.to_bytes(), bytes([0b11001011, 0b10001000]))
+        self.assertEqual(vec.to_bytes('little'),
+                         bytes([0b11010011, 0b00010001]))
+        self.assertEqual(vector.from_bytes(vec.to_bytes(), 13), vec)
+        self.assertEqual(
+            vector.from_bytes(bytearray(vec.to_bytes('little')), 13,
+                              'little'),
+            vec)
+        self.assertEqual(
+            vector.from_bytes(memoryview(b'\x0f\xf0')[1:]),
+            vector.Vector(0b11110000, 8))
+        self.assertEqual(vector.Vector().to_bytes(), b'')
+        self.assertEqual(vector.from_bytes(b''), vector.Vector())
+        with self.assertRaises(ValueError):
+            vector.from_bytes(b'\x00', 9)
+        with self.assertRaises(ValueError):
+            vec.to_bytes('middle')
+
+    def test_reverse_bits(self):
+        """Test to reverse order of lower bits of integer."""
+        self.assertEqual(vector.reverse_bits(0b1101, 4), 0b1011)
+        self.assertEqual(vector.reverse_bits(0b1101, 6), 0b101100)
+        self.assertEqual(vector.reverse_bits(0b111101, 3), 0b101)
+        self.assertEqual(vector.reverse_bits(0b1, 0), 0)
+
+    def test_pickle(self):
+        """Test to pickle vector as value and length."""
+        for vec in (vector.Vector(0b0001011, 7), vector.Vector(0, 5),
+                    vector.Vector()):
+            copy = pickle.loads(pickle.dumps(vec))
+            self.assertEqual(copy, vec)
+            self.assertEqual(len(copy), len(vec))
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        """Test to convert vector from and to numpy array."""
+        vec = vector.Vector(0b1100101110001, 13)
+        array = vec.to_numpy()
+        self.assertEqual(array.dtype, numpy.uint8)
+        self.assertEqual(array.tolist(), list(vec))
+        self.assertEqual(vector.from_numpy(array), vec)
+        self.assertEqual(vector.from_numpy(array.astype(bool)), vec)
+        self.assertEqual(vector.from_numpy(array.astype(int) * 3), vec)
+        with self.assertRaises(ValueError):
+            vector.from_numpy(numpy.zeros((2, 2)))
+
+
 if __name__ == "__main__":
     unittest.main()